@@ -7,7 +7,36 @@ that automatically respond to theme changes.
 
 import flet as ft
 import atoms
-from theme_tokens import get_theme
+from enum import IntEnum
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple, Union
+from theme_tokens import THEME
+
+
+# ============================================================================
+# SHARED STYLE OBJECTS
+# ============================================================================
+
+# Enum members used by every molecule, bound once at import
+_W500 = ft.FontWeight.W_500
+_BOLD = ft.FontWeight.BOLD
+_XALIGN_CENTER = ft.CrossAxisAlignment.CENTER
+_ALIGN_CENTER = ft.alignment.center
+
+# Molecules never mutate these after construction, so one instance per
+# distinct argument set can be shared by every control that uses it.
+
+
+@lru_cache(maxsize=64)
+def _padding_sym(horizontal: int, vertical: int) -> ft.Padding:
+    """Shared symmetric padding."""
+    return ft.padding.symmetric(horizontal=horizontal, vertical=vertical)
+
+
+@lru_cache(maxsize=64)
+def _border_bottom(color: str) -> ft.Border:
+    """Shared 1px bottom border."""
+    return ft.border.only(bottom=ft.BorderSide(1, color))
 
 
 # ============================================================================
@@ -23,13 +52,11 @@ def alert(
 
     Severity: "success", "warning", "error", "info"
     """
-    theme = get_theme()
-
     icon_map = {
-        "success": (ft.Icons.CHECK_CIRCLE, theme.colors.success),
-        "warning": (ft.Icons.WARNING, theme.colors.warning),
-        "error": (ft.Icons.ERROR, theme.colors.error),
-        "info": (ft.Icons.INFO, theme.colors.info),
+        "success": (ft.Icons.CHECK_CIRCLE, THEME.colors.success),
+        "warning": (ft.Icons.WARNING, THEME.colors.warning),
+        "error": (ft.Icons.ERROR, THEME.colors.error),
+        "info": (ft.Icons.INFO, THEME.colors.info),
     }
 
     icon_name, icon_color = icon_map.get(severity, icon_map["info"])
@@ -39,8 +66,8 @@ def alert(
             atoms.icon(icon_name, semantic=severity),
             atoms.body_text(message, expand=True),
         ],
-        spacing=theme.spacing.sm,
-        vertical_alignment=ft.CrossAxisAlignment.CENTER,
+        spacing=THEME.spacing.sm,
+        vertical_alignment=_XALIGN_CENTER,
     )
 
     if dismissible:
@@ -53,8 +80,8 @@ def alert(
 
     return ft.Container(
         content=content_row,
-        padding=theme.spacing.md,
-        border_radius=theme.radius.md,
+        padding=THEME.spacing.md,
+        border_radius=THEME.radius.md,
         bgcolor=ft.Colors.with_opacity(0.1, icon_color),
         border=ft.border.all(1, icon_color),
     )
@@ -67,24 +94,34 @@ def alert(
 
 def input_group(
     label: str, help_text: str = None, error: str = None, ref: ft.Ref = None, **kwargs
-) -> ft.Column:
+) -> ft.Control:
     """
     Input group molecule: Label + input + help/error text.
+
+    When there is no label, help or error text, the bare text field is
+    returned instead of a single-child Column.
     """
-    theme = get_theme()
+    field = atoms.text_field(ref=ref, **kwargs)
+
+    if not (label or error or help_text):
+        return field
+
+    controls = []
 
-    controls = [atoms.body_text(label, weight=ft.FontWeight.W_500)]
+    # Dynamic forms often pass "" for optional labels
+    if label:
+        controls.append(atoms.body_text(label, weight=_W500))
 
-    controls.append(atoms.text_field(ref=ref, **kwargs))
+    controls.append(field)
 
     if error:
-        controls.append(atoms.label_text(error, color=theme.colors.error))
+        controls.append(atoms.label_text(error, color=THEME.colors.error))
     elif help_text:
-        controls.append(atoms.label_text(help_text, color=theme.colors.text_secondary))
+        controls.append(atoms.label_text(help_text, color=THEME.colors.text_secondary))
 
     return ft.Column(
         controls,
-        spacing=theme.spacing.xs,
+        spacing=THEME.spacing.xs,
     )
 
 
@@ -111,45 +148,45 @@ def stat_card(
         trend: Optional trend text (e.g., "+12.5%")
         trend_positive: Whether trend is positive (green) or negative (red)
     """
-    theme = get_theme()
+    if not icon_name and not trend:
+        return _stat_card_simple(label, value, ref)
 
-    controls = []
-
-    # Icon and value row
-    value_row = ft.Row(
-        spacing=theme.spacing.md,
-        vertical_alignment=ft.CrossAxisAlignment.CENTER,
-    )
+    # Icon and value row (children collected first, Row built once)
+    row_controls = []
 
     if icon_name:
-        value_row.controls.append(
+        row_controls.append(
             ft.Container(
                 content=atoms.icon(icon_name, size=32, semantic="primary"),
                 width=56,
                 height=56,
-                border_radius=theme.radius.full,
-                bgcolor=ft.Colors.with_opacity(0.1, theme.colors.primary),
-                alignment=ft.alignment.center,
+                border_radius=THEME.radius.full,
+                bgcolor=THEME.primary_bg_subtle,
+                alignment=_ALIGN_CENTER,
             )
         )
 
     value_col = ft.Column(
         [
             atoms.label_text(label),
-            atoms.headline_text(value, level=2, ref=ref)
-            if ref
-            else atoms.headline_text(value, level=2),
+            atoms.headline_text(value, level=2, ref=ref),
         ],
-        spacing=theme.spacing.xs,
+        spacing=THEME.spacing.xs,
         expand=True,
     )
 
-    value_row.controls.append(value_col)
-    controls.append(value_row)
+    row_controls.append(value_col)
+    controls = [
+        ft.Row(
+            row_controls,
+            spacing=THEME.spacing.md,
+            vertical_alignment=_XALIGN_CENTER,
+        )
+    ]
 
     # Trend indicator
     if trend:
-        trend_color = theme.colors.success if trend_positive else theme.colors.error
+        trend_color = THEME.colors.success if trend_positive else THEME.colors.error
         trend_icon = (
             ft.Icons.ARROW_UPWARD if trend_positive else ft.Icons.ARROW_DOWNWARD
         )
@@ -160,14 +197,32 @@ def stat_card(
                     ft.Icon(trend_icon, size=16, color=trend_color),
                     atoms.label_text(trend, color=trend_color),
                 ],
-                spacing=theme.spacing.xs,
+                spacing=THEME.spacing.xs,
             )
         )
 
     return atoms.surface(
         content=ft.Column(
             controls,
-            spacing=theme.spacing.sm,
+            spacing=THEME.spacing.sm,
+        ),
+    )
+
+
+def _stat_card_simple(label: str, value: str, ref: ft.Ref = None) -> ft.Container:
+    """
+    Fast path of stat_card for plain metrics (no icon, no trend).
+
+    Skips the icon/value Row and the outer Column entirely.
+    """
+    return atoms.surface(
+        content=ft.Column(
+            [
+                atoms.label_text(label),
+                atoms.headline_text(value, level=2, ref=ref),
+            ],
+            spacing=THEME.spacing.xs,
+            expand=True,
         ),
     )
 
@@ -187,23 +242,26 @@ def list_item(
     """
     List item molecule: Title + subtitle with optional icons/actions.
     """
-    theme = get_theme()
-
     controls = []
 
     if leading_icon:
         controls.append(atoms.icon(leading_icon))
 
-    text_col = ft.Column(
-        [atoms.body_text(title, weight=ft.FontWeight.W_500)],
-        spacing=theme.spacing.xs,
-        expand=True,
-    )
+    text_controls = []
+
+    if title:
+        text_controls.append(atoms.body_text(title, weight=_W500))
 
     if subtitle:
-        text_col.controls.append(atoms.label_text(subtitle))
+        text_controls.append(atoms.label_text(subtitle))
 
-    controls.append(text_col)
+    controls.append(
+        ft.Column(
+            text_controls,
+            spacing=THEME.spacing.xs,
+            expand=True,
+        )
+    )
 
     if trailing:
         controls.append(trailing)
@@ -211,16 +269,76 @@ def list_item(
     return ft.Container(
         content=ft.Row(
             controls,
-            spacing=theme.spacing.md,
-            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+            spacing=THEME.spacing.md,
+            vertical_alignment=_XALIGN_CENTER,
         ),
-        padding=theme.spacing.md,
-        border_radius=theme.radius.md,
+        padding=THEME.spacing.md,
+        border_radius=THEME.radius.md,
         on_click=on_click,
         ink=True if on_click else False,
-        border=ft.border.only(bottom=ft.BorderSide(1, theme.colors.divider)),
+        border=_border_bottom(THEME.colors.divider),
+    )
+
+
+# ============================================================================
+# VIRTUALIZED LIST MOLECULE
+# ============================================================================
+
+
+def virtualized_list(
+    items: list,
+    build_item=list_item,
+    item_height: int = 56,
+    initial_count: int = 20,
+    buffer: int = 5,
+    **kwargs,
+) -> ft.ListView:
+    """
+    Virtualized list molecule: Builds rows only when they scroll into view.
+
+    Every entry of `items` is passed to `build_item` (tuples are unpacked as
+    positional arguments). Rows outside the visible window stay as
+    fixed-height placeholders until the user scrolls near them; once built,
+    a row is kept.
+
+    Args:
+        items: Row data, one entry per row
+        build_item: Row builder (defaults to list_item)
+        item_height: Fixed row height in pixels
+        initial_count: Rows built before the first scroll event
+        buffer: Extra rows built above and below the viewport
+    """
+    built = [False] * len(items)
+    list_view = ft.ListView(
+        [ft.Container(height=item_height) for _ in items],
+        item_extent=item_height,
+        **kwargs,
     )
 
+    def build_range(start: int, stop: int) -> bool:
+        changed = False
+        for index in range(max(start, 0), min(stop, len(items))):
+            if built[index]:
+                continue
+            item = items[index]
+            list_view.controls[index] = (
+                build_item(*item) if isinstance(item, tuple) else build_item(item)
+            )
+            built[index] = True
+            changed = True
+        return changed
+
+    def on_scroll(e: ft.OnScrollEvent):
+        first = int(e.pixels // item_height)
+        visible = int(e.viewport_dimension // item_height) + 1
+        if build_range(first - buffer, first + visible + buffer):
+            list_view.update()
+
+    list_view.on_scroll = on_scroll
+    build_range(0, initial_count)
+
+    return list_view
+
 
 # ============================================================================
 # AVATAR MOLECULE
@@ -231,21 +349,20 @@ def avatar(name: str, size: int = 40, on_click=None) -> ft.Container:
     """
     Avatar molecule: Shows user initials in a circle.
     """
-    theme = get_theme()
     initials = "".join([word[0].upper() for word in name.split()[:2]])
 
     return ft.Container(
         content=ft.Text(
             initials,
             size=size // 2.5,
-            weight=ft.FontWeight.BOLD,
+            weight=_BOLD,
             color=ft.Colors.WHITE,
         ),
         width=size,
         height=size,
         border_radius=size // 2,
-        bgcolor=theme.colors.primary,
-        alignment=ft.alignment.center,
+        bgcolor=THEME.colors.primary,
+        alignment=_ALIGN_CENTER,
         on_click=on_click,
         ink=True if on_click else False,
     )
@@ -256,33 +373,61 @@ def avatar(name: str, size: int = 40, on_click=None) -> ft.Container:
 # ============================================================================
 
 
-def badge(text: str, semantic: str = None) -> ft.Container:
+class BadgeSemantic(IntEnum):
+    """Badge colors, as indexes into ThemeManager.semantic_colors."""
+
+    DEFAULT = 0
+    SUCCESS = 1
+    WARNING = 2
+    ERROR = 3
+    INFO = 4
+
+
+# Legacy string names accepted by badge()
+_BADGE_SEMANTIC_BY_NAME = {
+    "success": BadgeSemantic.SUCCESS,
+    "warning": BadgeSemantic.WARNING,
+    "error": BadgeSemantic.ERROR,
+    "info": BadgeSemantic.INFO,
+}
+
+
+def badge(text: str, semantic: Union[BadgeSemantic, str] = None) -> ft.Container:
     """
     Badge molecule: Colored label tag.
 
-    Semantic: "success", "warning", "error", "info", None (default)
+    Semantic: a BadgeSemantic member, or the legacy names "success",
+    "warning", "error", "info", None (default)
     """
-    theme = get_theme()
+    return _badge(
+        text,
+        THEME.semantic_colors[_badge_semantic(semantic)],
+        _padding_sym(THEME.spacing.sm, THEME.spacing.xs),
+        THEME.radius.full,
+    )
 
-    color_map = {
-        "success": theme.colors.success,
-        "warning": theme.colors.warning,
-        "error": theme.colors.error,
-        "info": theme.colors.info,
-    }
 
-    bg_color = color_map.get(semantic, theme.colors.primary)
+def _badge_semantic(semantic: Union[BadgeSemantic, str, None]) -> BadgeSemantic:
+    """
+    Map a BadgeSemantic member or legacy name to a BadgeSemantic.
+
+    Unknown names and out-of-range integers fall back to DEFAULT.
+    """
+    if isinstance(semantic, int):
+        try:
+            return BadgeSemantic(semantic)
+        except ValueError:
+            return BadgeSemantic.DEFAULT
+    return _BADGE_SEMANTIC_BY_NAME.get(semantic, BadgeSemantic.DEFAULT)
+
 
+def _badge(text: str, bgcolor: str, padding, radius) -> ft.Container:
+    """Build a badge from already resolved theme tokens."""
     return ft.Container(
-        content=atoms.label_text(
-            text, color=ft.Colors.WHITE, weight=ft.FontWeight.BOLD
-        ),
-        padding=ft.padding.symmetric(
-            horizontal=theme.spacing.sm,
-            vertical=theme.spacing.xs,
-        ),
-        border_radius=theme.radius.full,
-        bgcolor=bg_color,
+        content=atoms.label_text(text, color=ft.Colors.WHITE, weight=_BOLD),
+        padding=padding,
+        border_radius=radius,
+        bgcolor=bgcolor,
     )
 
 
@@ -291,6 +436,11 @@ def badge(text: str, semantic: str = None) -> ft.Container:
 # ============================================================================
 
 
+# (icon, label) pairs for each mode, resolved once at import
+_TOGGLE_LIGHT = (ft.Icons.LIGHT_MODE, "Light Mode")
+_TOGGLE_DARK = (ft.Icons.DARK_MODE, "Dark Mode")
+
+
 def theme_toggle(current_mode: str, on_toggle) -> ft.Container:
     """
     Theme toggle molecule: Switch between light/dark mode.
@@ -299,28 +449,45 @@ def theme_toggle(current_mode: str, on_toggle) -> ft.Container:
         current_mode: "light" or "dark"
         on_toggle: Callback when toggled
     """
-    theme = get_theme()
-
     is_dark = current_mode == "dark"
+    toggle_icon, toggle_label = _TOGGLE_DARK if is_dark else _TOGGLE_LIGHT
 
     return ft.Container(
         content=ft.Row(
             [
-                atoms.icon(
-                    ft.Icons.LIGHT_MODE if not is_dark else ft.Icons.DARK_MODE,
-                    semantic="primary",
-                ),
-                atoms.body_text(
-                    "Dark Mode" if is_dark else "Light Mode",
-                    weight=ft.FontWeight.W_500,
-                ),
+                atoms.icon(toggle_icon, semantic="primary"),
+                atoms.body_text(toggle_label, weight=_W500),
                 ft.Container(expand=True),
                 atoms.switch(value=is_dark, on_change=on_toggle),
             ],
-            spacing=theme.spacing.sm,
-            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+            spacing=THEME.spacing.sm,
+            vertical_alignment=_XALIGN_CENTER,
         ),
-        padding=theme.spacing.md,
-        border_radius=theme.radius.md,
-        bgcolor=theme.colors.surface_variant,
+        padding=THEME.spacing.md,
+        border_radius=THEME.radius.md,
+        bgcolor=THEME.colors.surface_variant,
     )
+
+
+# ============================================================================
+# BATCH BUILDERS
+# ============================================================================
+
+
+def build_badges(
+    items: Iterable[Tuple[str, Optional[Union[BadgeSemantic, str]]]],
+) -> List[ft.Container]:
+    """
+    Build many badges at once from (text, semantic) pairs.
+
+    Theme tokens and the shared padding are resolved once for the whole
+    batch instead of once per badge.
+    """
+    palette = THEME.semantic_colors
+    padding = _padding_sym(THEME.spacing.sm, THEME.spacing.xs)
+    radius = THEME.radius.full
+
+    return [
+        _badge(text, palette[_badge_semantic(semantic)], padding, radius)
+        for text, semantic in items
+    ]
@@ -8,14 +8,34 @@ This module provides a reactive theme system where tokens automatically
 update when the theme mode changes.
 """
 
+import weakref
 import flet as ft
 from dataclasses import dataclass
-from typing import Literal
+from enum import IntEnum
+from typing import Literal, Union
 
 
 ThemeMode = Literal["light", "dark"]
 
 
+class Mode(IntEnum):
+    """Theme mode as an integer, so mode checks are plain truth tests."""
+
+    LIGHT = 0
+    DARK = 1
+
+
+_MODE_BY_NAME = {"light": Mode.LIGHT, "dark": Mode.DARK}
+_MODE_NAMES = ("light", "dark")
+
+
+def _to_mode(value: Union[Mode, ThemeMode]) -> Mode:
+    """Normalize a Mode or a legacy "light"/"dark" string."""
+    if isinstance(value, int):
+        return Mode(value)
+    return _MODE_BY_NAME[value]
+
+
 # ============================================================================
 # COLOR TOKENS
 # ============================================================================
@@ -178,29 +198,75 @@ RADIUS = RadiusTokens()
 # ============================================================================
 
 
+def _colors_for(mode: Mode) -> ColorTokens:
+    """Color tokens for a theme mode."""
+    return DARK_COLORS if mode else LIGHT_COLORS
+
+
 class ThemeManager:
     """Manages current theme and provides token access."""
 
-    def __init__(self, mode: ThemeMode = "light"):
-        self._mode: ThemeMode = mode
-        self._observers = []
+    __slots__ = (
+        "_mode",
+        "_observers",
+        "_cached_colors",
+        "_primary_bg_subtle",
+        "_semantic_colors",
+    )
+
+    def __init__(self, mode: Union[Mode, ThemeMode] = Mode.LIGHT):
+        self._mode: Mode = _to_mode(mode)
+        self._apply_mode(self._mode)
+        # Weak references, so discarded components don't keep receiving updates
+        self._observers: set = set()
+
+    def _apply_mode(self, mode: Mode):
+        """Resolve the mode-dependent tokens once, instead of on every access."""
+        colors = _colors_for(mode)
+        self._cached_colors: ColorTokens = colors
+        self._primary_bg_subtle: str = ft.Colors.with_opacity(0.1, colors.primary)
+        # Ordered as molecules.BadgeSemantic: default, success, warning, error, info
+        self._semantic_colors: tuple = (
+            colors.primary,
+            colors.success,
+            colors.warning,
+            colors.error,
+            colors.info,
+        )
 
     @property
     def mode(self) -> ThemeMode:
-        """Current theme mode."""
-        return self._mode
+        """Current theme mode as "light" or "dark"."""
+        return _MODE_NAMES[self._mode]
 
     @mode.setter
-    def mode(self, value: ThemeMode):
-        """Set theme mode and notify observers."""
+    def mode(self, value: Union[Mode, ThemeMode]):
+        """Set theme mode (Mode or "light"/"dark") and notify observers."""
+        value = _to_mode(value)
         if value != self._mode:
             self._mode = value
+            self._apply_mode(value)
             self._notify_observers()
 
+    @property
+    def mode_enum(self) -> Mode:
+        """Current theme mode as a Mode (falsy for light)."""
+        return self._mode
+
     @property
     def colors(self) -> ColorTokens:
-        """Get current color tokens."""
-        return DARK_COLORS if self._mode == "dark" else LIGHT_COLORS
+        """Get current color tokens (resolved when the mode changes)."""
+        return self._cached_colors
+
+    @property
+    def primary_bg_subtle(self) -> str:
+        """Primary color at 10% opacity, for icon backdrops."""
+        return self._primary_bg_subtle
+
+    @property
+    def semantic_colors(self) -> tuple:
+        """Semantic palette (primary, success, warning, error, info)."""
+        return self._semantic_colors
 
     @property
     def typography(self) -> TypographyTokens:
@@ -218,26 +284,36 @@ class ThemeManager:
         return RADIUS
 
     def observe(self, callback):
-        """Register observer for theme changes."""
-        self._observers.append(callback)
+        """
+        Register observer for theme changes.
+
+        Observers are held weakly: a bound method is dropped together with
+        its instance, and plain functions must be kept alive by the caller.
+        """
+        discard = self._observers.discard
+        if hasattr(callback, "__self__"):
+            self._observers.add(weakref.WeakMethod(callback, discard))
+        else:
+            self._observers.add(weakref.ref(callback, discard))
 
     def _notify_observers(self):
-        """Notify all observers of theme change."""
-        for callback in self._observers:
-            callback(self._mode)
+        """Notify all live observers of theme change."""
+        mode = _MODE_NAMES[self._mode]
+        # Snapshot, since an observer may (un)register while being notified
+        for observer_ref in tuple(self._observers):
+            callback = observer_ref()
+            if callback is not None:
+                callback(mode)
 
     def toggle(self):
         """Toggle between light and dark mode."""
-        self.mode = "dark" if self._mode == "light" else "light"
+        self.mode = Mode.LIGHT if self._mode else Mode.DARK
 
 
-# Global theme manager instance
-_theme_manager = None
+# Global theme manager instance (created at import, read directly by molecules)
+THEME = ThemeManager()
 
 
 def get_theme() -> ThemeManager:
     """Get global theme manager instance."""
-    global _theme_manager
-    if _theme_manager is None:
-        _theme_manager = ThemeManager()
-    return _theme_manager
+    return THEME
@@ -101,10 +101,10 @@ def main(page: ft.Page):
         total = counter_a.value + counter_b.value + counter_c.value
         sum_text.set(f"Total: {total}")
 
-    # Listen to counter changes
-    counter_a.listen(lambda _: update_sum(), immediate=True)
-    counter_b.listen(lambda _: update_sum(), immediate=True)
-    counter_c.listen(lambda _: update_sum(), immediate=True)
+    # Listen to counter changes (first sum computed once the counters mount)
+    counter_a.listen(lambda _: update_sum(), defer_immediate=True)
+    counter_b.listen(lambda _: update_sum(), defer_immediate=True)
+    counter_c.listen(lambda _: update_sum(), defer_immediate=True)
 
     section1 = ft.Container(
         content=ft.Column(
@@ -5,10 +5,30 @@ Components that combine visual structure (Atomic Design) with reactive state (Fl
 Each component manages its own state atom and provides a clean API for updates.
 """
 
+import itertools
+import sys
+from functools import lru_cache
 import flet as ft
 from typing import Optional, Callable, Any
 
 
+# ============================================================================
+# STYLE HELPERS
+# ============================================================================
+
+
+@lru_cache(maxsize=256)
+def _opac(opacity: float, color: str) -> str:
+    """Cached ``ft.Colors.with_opacity`` (same inputs, same color string)."""
+    return ft.Colors.with_opacity(opacity, color)
+
+
+@lru_cache(maxsize=256)
+def _border(width: float, color: str) -> ft.Border:
+    """Cached ``ft.border.all``; the returned Border is shared, never mutate it."""
+    return ft.border.all(width, color)
+
+
 # ============================================================================
 # BASE CLASS
 # ============================================================================
@@ -20,6 +40,13 @@ class ReactiveAtom:
 
     Combines visual component with reactive state management.
     Each component has its own atom and automatically binds to it.
+
+    State (atoms and bindings) is registered lazily: when the control is
+    mounted, or on the first get/set/listen call if that comes sooner.
+    Components that are built but never shown never touch the state store.
+
+    Until the control is mounted there is nothing on screen to refresh, so
+    batched writes made before mount skip their page.update() call.
     """
 
     def __init__(self, page: ft.Page, atom_key: str):
@@ -33,17 +60,69 @@ class ReactiveAtom:
         self.page = page
         self.atom_key = atom_key
         self.control: Optional[ft.Control] = None
+        self._state_ready = False
+        self._mounted = False
+        self._on_mount: list[Callable[[], None]] = []
+
+    def _setup_state(self):
+        """Create the component's atoms and bindings (subclasses override)."""
+
+    def _ensure_state(self):
+        """Run _setup_state() once."""
+        if not self._state_ready:
+            self._state_ready = True
+            self._setup_state()
+
+    def _defer_state(self):
+        """Register state when self.control is mounted (call after building it)."""
+        original_did_mount = self.control.did_mount
+
+        def did_mount():
+            self._mounted = True
+            self._ensure_state()
+            for fn in self._on_mount:
+                fn()
+            self._on_mount.clear()
+            original_did_mount()
+
+        self.control.did_mount = did_mount
+
+    def _batch(self):
+        """state.batch() that only flushes the page once the control is mounted."""
+        return self.page.state.batch(update_page=self._mounted)
 
     def set(self, value: Any):
         """Update the atom value."""
+        self._ensure_state()
         self.page.state.set(self.atom_key, value)
 
+    def update(self, fn: Callable[[Any], Any]):
+        """Update the atom value from its current value."""
+        self._ensure_state()
+        self.page.state.update(self.atom_key, fn)
+
     def get(self) -> Any:
         """Get current atom value."""
+        self._ensure_state()
         return self.page.state.get(self.atom_key)
 
-    def listen(self, callback: Callable, immediate: bool = True):
-        """Listen to atom changes."""
+    def listen(
+        self,
+        callback: Callable,
+        immediate: bool = True,
+        defer_immediate: bool = False,
+    ):
+        """
+        Listen to atom changes.
+
+        With defer_immediate=True and the control not mounted yet, the
+        listener is registered (and called with the current value) on mount
+        instead of right away, so the first call can refresh what is on screen.
+        """
+        if defer_immediate and immediate and not self._mounted:
+            self._on_mount.append(lambda: self.listen(callback))
+            return
+        self._ensure_state()
         self.page.state.listen(self.atom_key, callback, immediate)
 
 
@@ -70,12 +149,11 @@ class ReactiveText(ReactiveAtom):
         **kwargs,
     ):
         super().__init__(page, atom_key)
+        self._initial = initial_value
 
-        # Create atom
-        page.state.atom(atom_key, initial_value)
-
-        # Create UI
-        self.ref = ft.Ref[ft.Text]()
+        # Create UI (refs are typed by annotation: calling ft.Ref[ft.Text]()
+        # goes through the typing machinery on every instance)
+        self.ref: ft.Ref[ft.Text] = ft.Ref()
         self.control = ft.Text(
             ref=self.ref,
             value=initial_value,
@@ -84,9 +162,30 @@ class ReactiveText(ReactiveAtom):
             weight=weight,
             **kwargs,
         )
+        self._defer_state()
 
-        # Bind to state
-        page.state.bind(atom_key, self.ref, prop="value")
+    @classmethod
+    def basic(
+        cls, page: ft.Page, atom_key: str, initial_value: str = "", size: int = 14
+    ) -> "ReactiveText":
+        """
+        Build a plain text (value and size only) without the **kwargs pass-through.
+
+        Meant for long lists of simple labels, where the generic constructor's
+        keyword handling is paid once per row.
+        """
+        self = cls.__new__(cls)
+        ReactiveAtom.__init__(self, page, atom_key)
+        self._initial = initial_value
+        self.ref = ft.Ref()
+        self.control = ft.Text(value=initial_value, size=size, ref=self.ref)
+        self._defer_state()
+        return self
+
+    def _setup_state(self):
+        # Create atom and bind to state
+        self.page.state.atom(self.atom_key, self._initial)
+        self.page.state.bind(self.atom_key, self.ref, prop="value")
 
 
 # ============================================================================
@@ -105,6 +204,16 @@ class ReactiveCounter(ReactiveAtom):
     - Reset functionality
     """
 
+    # Monotonic source of atom keys shared by all counters
+    _ids = itertools.count()
+
+    # Button row: (icon, tooltip, handler method, uses accent color)
+    _BUTTONS = (
+        (ft.Icons.REMOVE, "Decrement", "decrement", True),
+        (ft.Icons.REFRESH, "Reset", "reset", False),
+        (ft.Icons.ADD, "Increment", "increment", True),
+    )
+
     def __init__(
         self,
         page: ft.Page,
@@ -113,18 +222,16 @@ class ReactiveCounter(ReactiveAtom):
         step: int = 1,
         color: str = None,
     ):
-        # Generate unique atom key
-        atom_key = f"counter_{id(self)}"
+        # Generate unique atom key (short, deterministic and interned)
+        atom_key = sys.intern(f"counter_{next(ReactiveCounter._ids)}")
         super().__init__(page, atom_key)
 
         self.step = step
         self.color = color or ft.Colors.BLUE_700
-
-        # Create atom
-        page.state.atom(atom_key, initial_count)
+        self._initial = initial_count
 
         # Create UI
-        self.count_ref = ft.Ref[ft.Text]()
+        self.count_ref: ft.Ref[ft.Text] = ft.Ref()
 
         self.control = ft.Container(
             content=ft.Column(
@@ -141,23 +248,12 @@ class ReactiveCounter(ReactiveAtom):
                     ft.Row(
                         [
                             ft.IconButton(
-                                icon=ft.Icons.REMOVE,
-                                icon_color=self.color,
-                                on_click=self.decrement,
-                                tooltip="Decrement",
-                            ),
-                            ft.IconButton(
-                                icon=ft.Icons.REFRESH,
-                                icon_color=ft.Colors.GREY_600,
-                                on_click=lambda e: self.reset(),
-                                tooltip="Reset",
-                            ),
-                            ft.IconButton(
-                                icon=ft.Icons.ADD,
-                                icon_color=self.color,
-                                on_click=self.increment,
-                                tooltip="Increment",
-                            ),
+                                icon=icon,
+                                icon_color=self.color if accent else ft.Colors.GREY_600,
+                                on_click=getattr(self, handler),
+                                tooltip=tooltip,
+                            )
+                            for icon, tooltip, handler, accent in self._BUTTONS
                         ],
                         alignment=ft.MainAxisAlignment.CENTER,
                     ),
@@ -165,25 +261,26 @@ class ReactiveCounter(ReactiveAtom):
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER,
             ),
             padding=20,
-            border=ft.border.all(2, self.color),
+            border=_border(2, self.color),
             border_radius=10,
-            bgcolor=ft.Colors.with_opacity(0.05, self.color),
+            bgcolor=_opac(0.05, self.color),
         )
+        self._defer_state()
 
-        # Bind to state
-        page.state.bind(atom_key, self.count_ref, prop="value")
+    def _setup_state(self):
+        # Create atom and bind to state
+        self.page.state.atom(self.atom_key, self._initial)
+        self.page.state.bind(self.atom_key, self.count_ref, prop="value")
 
     def increment(self, e=None):
         """Increment counter by step."""
-        current = self.get()
-        self.set(current + self.step)
+        self.update(lambda count: count + self.step)
 
     def decrement(self, e=None):
         """Decrement counter by step."""
-        current = self.get()
-        self.set(current - self.step)
+        self.update(lambda count: count - self.step)
 
-    def reset(self):
+    def reset(self, e=None):
         """Reset counter to 0."""
         self.set(0)
 
@@ -205,6 +302,15 @@ class ReactiveStatCard(ReactiveAtom):
     Perfect for dashboards showing metrics that update automatically.
     """
 
+    # Style objects shared by every card (never mutated after construction)
+    _BORDER = _border(1, ft.Colors.GREY_300)
+    _SHADOW = ft.BoxShadow(
+        spread_radius=1,
+        blur_radius=3,
+        color=_opac(0.1, ft.Colors.BLACK),
+        offset=ft.Offset(0, 2),
+    )
+
     def __init__(
         self,
         page: ft.Page,
@@ -219,15 +325,11 @@ class ReactiveStatCard(ReactiveAtom):
 
         self.color = color or ft.Colors.BLUE_700
         self.show_trend = show_trend
-
-        # Create atoms
-        page.state.atom(atom_key, initial_value)
-        if show_trend:
-            page.state.atom(f"{atom_key}_trend", "+0%")
+        self._initial = initial_value
 
         # Create UI
-        self.value_ref = ft.Ref[ft.Text]()
-        self.trend_ref = ft.Ref[ft.Text]() if show_trend else None
+        self.value_ref: ft.Ref[ft.Text] = ft.Ref()
+        self.trend_ref: Optional[ft.Ref[ft.Text]] = ft.Ref() if show_trend else None
 
         # Icon container
         icon_container = ft.Container(
@@ -235,54 +337,59 @@ class ReactiveStatCard(ReactiveAtom):
             width=64,
             height=64,
             border_radius=32,
-            bgcolor=ft.Colors.with_opacity(0.1, self.color),
+            bgcolor=_opac(0.1, self.color),
             alignment=ft.alignment.center,
         )
 
-        # Value column
-        value_column = ft.Column(
-            [
-                ft.Text(title, size=12, color=ft.Colors.GREY_600),
-                ft.Text(ref=self.value_ref, size=24, weight=ft.FontWeight.BOLD),
-            ],
-            spacing=4,
-            expand=True,
-        )
-
-        # Add trend if enabled
+        # Value column (trend included up front when enabled)
+        value_controls = [
+            ft.Text(title, size=12, color=ft.Colors.GREY_600),
+            ft.Text(ref=self.value_ref, size=24, weight=ft.FontWeight.BOLD),
+        ]
         if show_trend:
-            value_column.controls.append(
+            value_controls.append(
                 ft.Text(ref=self.trend_ref, size=12, color=ft.Colors.GREEN_600)
             )
 
         self.control = ft.Container(
             content=ft.Row(
-                [icon_container, value_column],
+                [
+                    icon_container,
+                    ft.Column(value_controls, spacing=4, expand=True),
+                ],
                 spacing=15,
                 vertical_alignment=ft.CrossAxisAlignment.CENTER,
             ),
             padding=20,
             border_radius=12,
             bgcolor=ft.Colors.WHITE,
-            border=ft.border.all(1, ft.Colors.GREY_300),
-            shadow=ft.BoxShadow(
-                spread_radius=1,
-                blur_radius=3,
-                color=ft.Colors.with_opacity(0.1, ft.Colors.BLACK),
-                offset=ft.Offset(0, 2),
-            ),
+            border=self._BORDER,
+            shadow=self._SHADOW,
         )
+        self._defer_state()
+
+    def _setup_state(self):
+        state = self.page.state
+        trend_key = f"{self.atom_key}_trend"
+
+        # Create atoms
+        state.atom(self.atom_key, self._initial)
+        if self.show_trend:
+            state.atom(trend_key, "+0%")
 
         # Bind to state
-        page.state.bind(atom_key, self.value_ref, prop="value")
-        if show_trend:
-            page.state.bind(f"{atom_key}_trend", self.trend_ref, prop="value")
+        bindings = [(self.atom_key, self.value_ref)]
+        if self.show_trend:
+            bindings.append((trend_key, self.trend_ref))
+        state.bind_many(bindings)
 
     def update_with_trend(self, value: str, trend: str):
-        """Update value and trend together."""
-        self.set(value)
-        if self.show_trend:
-            self.page.state.set(f"{self.atom_key}_trend", trend)
+        """Update value and trend together (single page update)."""
+        self._ensure_state()
+        with self._batch():
+            self.set(value)
+            if self.show_trend:
+                self.page.state.set(f"{self.atom_key}_trend", trend)
 
 
 # ============================================================================
@@ -295,6 +402,8 @@ class ReactiveInput(ReactiveAtom):
     Input field with reactive two-way binding.
 
     Changes in the field update the atom, and atom changes update the field.
+    Pass debounce (seconds) to write the atom once per typing burst instead
+    of on every keystroke.
     """
 
     def __init__(
@@ -305,15 +414,18 @@ class ReactiveInput(ReactiveAtom):
         label: str = None,
         hint: str = None,
         password: bool = False,
+        owner: Optional[ReactiveAtom] = None,
+        debounce: float = 0.0,
         **kwargs,
     ):
         super().__init__(page, atom_key)
-
-        # Create atom
-        page.state.atom(atom_key, initial_value)
+        self._initial = initial_value
+        # Component that creates this input's atom (e.g. a ReactiveForm)
+        self._owner = owner
+        self._debounce = debounce
 
         # Create UI
-        self.ref = ft.Ref[ft.TextField]()
+        self.ref: ft.Ref[ft.TextField] = ft.Ref()
         self.control = ft.TextField(
             ref=self.ref,
             label=label,
@@ -324,9 +436,17 @@ class ReactiveInput(ReactiveAtom):
             focused_border_color=ft.Colors.BLUE_900,
             **kwargs,
         )
-
-        # Two-way binding
-        page.state.bind_two_way(atom_key, self.ref, prop="value")
+        self._defer_state()
+
+    def _setup_state(self):
+        # Create atom (unless the owner does it) and two-way binding
+        if self._owner is not None:
+            self._owner._ensure_state()
+        else:
+            self.page.state.atom(self.atom_key, self._initial)
+        self.page.state.bind_two_way(
+            self.atom_key, self.ref, prop="value", debounce=self._debounce
+        )
 
 
 # ============================================================================
@@ -355,11 +475,10 @@ class ReactiveForm(ReactiveAtom):
         self.fields_dict = {}
         self.on_submit = on_submit
 
-        # Create form data atom
-        initial_data = {field["key"]: field.get("initial", "") for field in fields}
-        page.state.atom(atom_key, initial_data)
+        # Form data atom is created on mount (see _setup_state)
+        self._initial = {field["key"]: field.get("initial", "") for field in fields}
 
-        # Create input fields
+        # Create input fields; their atoms are created in bulk by the form
         inputs = []
         for field in fields:
             field_key = f"{form_id}_{field['key']}"
@@ -370,6 +489,7 @@ class ReactiveForm(ReactiveAtom):
                 label=field.get("label"),
                 hint=field.get("hint"),
                 password=field.get("password", False),
+                owner=self,
             )
             self.fields_dict[field["key"]] = reactive_input
             inputs.append(reactive_input.control)
@@ -394,31 +514,53 @@ class ReactiveForm(ReactiveAtom):
                 spacing=15,
             ),
             padding=30,
-            border=ft.border.all(1, ft.Colors.GREY_300),
+            border=_border(1, ft.Colors.GREY_300),
             border_radius=12,
             bgcolor=ft.Colors.WHITE,
         )
+        self._defer_state()
+
+    def _setup_state(self):
+        # Create the form data atom and every field atom in one pass
+        fields = self.fields_dict.values()
+        self.page.state.atoms(
+            {
+                self.atom_key: self._initial,
+                **{field.atom_key: field._initial for field in fields},
+            }
+        )
+
+        # Then wire each field's two-way binding
+        for field in fields:
+            field._ensure_state()
 
     def _handle_submit(self, e):
         """Handle form submission."""
         # Collect all field values
         data = {key: field.get() for key, field in self.fields_dict.items()}
 
-        # Update form atom
-        self.set(data)
+        # Update form atom; state writes made by the callback are
+        # flushed together with it
+        with self._batch():
+            self.set(data)
 
-        # Call user callback
-        if self.on_submit:
-            self.on_submit(data)
+            # Call user callback
+            if self.on_submit:
+                self.on_submit(data)
 
     def get_field(self, key: str) -> ReactiveInput:
         """Get a specific field by key."""
         return self.fields_dict.get(key)
 
     def reset(self):
-        """Reset all fields to empty."""
-        for field in self.fields_dict.values():
-            field.set("")
+        """Reset all fields to empty (single page update)."""
+        with self._batch():
+            for field in self.fields_dict.values():
+                field.set("")
+
+
+# Percent labels "0%".."100%", built once instead of formatted per tick
+_PCT_STRS = tuple(f"{i}%" for i in range(101))
 
 
 # ============================================================================
@@ -446,12 +588,12 @@ class ReactiveProgress(ReactiveAtom):
         self.max_value = max_value
         self.color = color or ft.Colors.BLUE_700
 
-        # Create atom
-        page.state.atom(atom_key, 0)
+        # Precomputed once so each tick is a multiply
+        self._inv_max = 1.0 / max_value
 
         # Create UI
-        self.progress_ref = ft.Ref[ft.ProgressBar]()
-        self.text_ref = ft.Ref[ft.Text]()
+        self.progress_ref: ft.Ref[ft.ProgressBar] = ft.Ref()
+        self.text_ref: ft.Ref[ft.Text] = ft.Ref()
 
         self.control = ft.Column(
             [
@@ -474,15 +616,26 @@ class ReactiveProgress(ReactiveAtom):
             ],
             spacing=10,
         )
+        self._defer_state()
+
+    def _setup_state(self):
+        page = self.page
+        atom_key = self.atom_key
+
+        # Create atom
+        page.state.atom(atom_key, 0)
 
         # Create selectors for derived values (progress bar value and percentage text)
         @page.state.selector(f"{atom_key}_bar_value")
         def compute_bar_value(get):
-            return get(atom_key) / self.max_value
+            return get(atom_key) * self._inv_max
 
+        # Integer math keeps the percent exact (no 28.999...% rounding down);
+        # the text binding is skipped while the integer percent is unchanged
         @page.state.selector(f"{atom_key}_percentage")
         def compute_percentage(get):
-            return f"{int((get(atom_key) / self.max_value) * 100)}%"
+            pct = int(get(atom_key) * 100 // self.max_value)
+            return _PCT_STRS[pct] if 0 <= pct <= 100 else f"{pct}%"
 
         # Bind selectors to UI controls - fully declarative, no page.update() needed
         page.state.bind(f"{atom_key}_bar_value", self.progress_ref, prop="value")
@@ -490,9 +643,7 @@ class ReactiveProgress(ReactiveAtom):
 
     def increment(self, amount: int = 1):
         """Increment progress."""
-        current = self.get()
-        new_value = min(current + amount, self.max_value)
-        self.set(new_value)
+        self.update(lambda current: min(current + amount, self.max_value))
 
     def complete(self):
         """Set progress to 100%."""
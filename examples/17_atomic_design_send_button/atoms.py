@@ -11,9 +11,13 @@ def send_icon(
     size: int = 16,
     color: str = ft.Colors.WHITE,
     initial_rotation: float = 11,
+    float_duration: int = 500,
 ) -> ft.IconButton:
     """
     Atom: Send icon (airplane) with animation settings.
+
+    float_duration (ms) is the length of one floating leg: the client tweens
+    the offset between the two float endpoints over that time.
     """
     return ft.IconButton(
         ref=ref,
@@ -21,7 +25,9 @@ def send_icon(
         icon_color=color,
         icon_size=size,
         offset=ft.Offset(0, 0),
-        animate_offset=ft.Animation(duration=500, curve=ft.AnimationCurve.EASE_IN_OUT),
+        animate_offset=ft.Animation(
+            duration=float_duration, curve=ft.AnimationCurve.EASE_IN_OUT
+        ),
         rotate=ft.Rotate(initial_rotation, alignment=ft.alignment.center),
         animate_rotation=ft.Animation(duration=600, curve=ft.AnimationCurve.DECELERATE),
         scale=ft.Scale(1),
@@ -109,7 +115,8 @@ def loading_bar(
     bar_color: str = ft.Colors.WHITE,
 ) -> ft.Container:
     """
-    Atom: Loading bar with progress animation using native ProgressBar.
+    Atom: Loading bar whose fill is a Container, so its width can be tweened
+    by the client (implicit `animate`) instead of stepped from Python.
     """
     return ft.Container(
         ref=ref,
@@ -117,13 +124,14 @@ def loading_bar(
         height=height,
         opacity=0,
         animate_opacity=ft.Animation(duration=200, curve=ft.AnimationCurve.EASE_IN_OUT),
-        content=ft.ProgressBar(
-            ref=progress_ref,  # Ref for the ProgressBar
-            value=0,
-            width=width,
+        bgcolor=bgcolor,
+        border_radius=3,
+        alignment=ft.alignment.center_left,
+        content=ft.Container(
+            ref=progress_ref,  # Ref for the fill
+            width=0,
             height=height,
-            bgcolor=bgcolor,
-            color=bar_color,
+            bgcolor=bar_color,
             border_radius=3,
         ),
     )
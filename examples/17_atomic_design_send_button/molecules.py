@@ -3,23 +3,58 @@ Molecules - Simple combinations of atoms that work as functional units.
 Following the Atomic Design pattern with Flet-ASP.
 
 Uses:
-- atom() for base state (hover, icon_offset for floating animation)
-- selector() for derived states (rotate, scale, text_offset, text_opacity)
-- bind() to link components to reactive state
+- atom() / atom_family() for base state (hover, icon_offset for floating animation)
+- selector_family() for the shared "active" state
+- bind() (with transform) to link components to reactive state
 """
 
+import operator
+
 import flet as ft
 from atoms import send_icon, button_text, cloud_icon, loading_bar
 
 
+# State families of SendIconWithText; each instance is a member keyed by prefix
+_HOVER = "send_btn_hover"
+_LOADING = "send_btn_loading"
+_ICON_OFFSET = "send_btn_icon_offset"
+_ACTIVE = "send_btn_active"
+
+
+def _compute_active(get, member_id):
+    """True while the button is hovered or loading."""
+    # Read both atoms (no short-circuit) so both stay dependencies
+    is_hover = get((_HOVER, member_id))
+    is_loading = get((_LOADING, member_id))
+    return is_hover or is_loading
+
+
 class SendIconWithText:
     """
     Molecule: Combination of send icon with text.
 
-    Uses selectors to automatically derive visual states from hover state.
+    Uses atom/selector families shared by every instance to derive visual
+    states from hover and loading; each instance only adds its members.
     The icon_offset is a separate atom because it's controlled by the floating animation.
     """
 
+    __slots__ = (
+        "page",
+        "prefix",
+        "initial_rotation",
+        "hover_rotation",
+        "active_key",
+        "_k_hover",
+        "_k_loading",
+        "_k_icon_offset",
+        "_float_offsets",
+        "_float_phase",
+        "icon_ref",
+        "text_ref",
+        "icon",
+        "text",
+    )
+
     def __init__(
         self,
         page: ft.Page,
@@ -30,6 +65,7 @@ class SendIconWithText:
         color: str = ft.Colors.WHITE,
         initial_rotation: float = 11,
         hover_rotation: float = 12.5,
+        float_interval: float = 0.5,
     ):
         self.page = page
         self.prefix = prefix
@@ -46,6 +82,7 @@ class SendIconWithText:
             size=icon_size,
             color=color,
             initial_rotation=initial_rotation,
+            float_duration=int(float_interval * 1000),
         )
         self.text = button_text(
             ref=self.text_ref,
@@ -58,90 +95,121 @@ class SendIconWithText:
         self._setup_state()
 
     def _setup_state(self):
-        """Configures base atoms and derived selectors."""
-        # === BASE ATOMS ===
-        # Hover state - controls derived visual states
-        self.page.state.atom(f"{self.prefix}_hover", False)
+        """Configures the shared families, this button's members and bindings."""
+        state = self.page.state
 
-        # Loading state - also controls derived visual states
-        self.page.state.atom(f"{self.prefix}_loading", False)
+        # === FAMILIES - one definition shared by every button on the page ===
+        # Hover and loading states - control derived visual states
+        state.atom_family(_HOVER, False)
+        state.atom_family(_LOADING, False)
 
-        # Icon offset - separate atom because it's controlled by the floating animation
+        # Icon offset - separate because it's controlled by the floating animation
         # (doesn't depend only on hover, but also on time)
-        self.page.state.atom(f"{self.prefix}_icon_offset", ft.Offset(0, 0))
-
-        # === SELECTORS - States automatically derived from hover or loading ===
-
-        # Icon rotation derived from hover or loading
-        @self.page.state.selector(f"{self.prefix}_icon_rotate")
-        def compute_icon_rotate(get):
-            is_hover = get(f"{self.prefix}_hover")
-            is_loading = get(f"{self.prefix}_loading")
-            rotation = (
-                self.hover_rotation
-                if (is_hover or is_loading)
-                else self.initial_rotation
-            )
-            return ft.Rotate(rotation, alignment=ft.alignment.center)
-
-        # Icon scale derived from hover or loading
-        @self.page.state.selector(f"{self.prefix}_icon_scale")
-        def compute_icon_scale(get):
-            is_hover = get(f"{self.prefix}_hover")
-            is_loading = get(f"{self.prefix}_loading")
-            return ft.Scale(1.25 if (is_hover or is_loading) else 1)
-
-        # Text offset derived from hover or loading
-        @self.page.state.selector(f"{self.prefix}_text_offset")
-        def compute_text_offset(get):
-            is_hover = get(f"{self.prefix}_hover")
-            is_loading = get(f"{self.prefix}_loading")
-            return ft.Offset(1, 0) if (is_hover or is_loading) else ft.Offset(-0.4, 0)
-
-        # Text opacity derived from hover or loading
-        @self.page.state.selector(f"{self.prefix}_text_opacity")
-        def compute_text_opacity(get):
-            is_hover = get(f"{self.prefix}_hover")
-            is_loading = get(f"{self.prefix}_loading")
-            return 0.0 if (is_hover or is_loading) else 1.0
+        state.atom_family(_ICON_OFFSET, ft.Offset(0, 0))
+
+        # Single "active" flag: the only thing the visual states depend on
+        state.selector_family(_ACTIVE, _compute_active)
+
+        # === MEMBERS - this button's keys, (family, prefix) tuples ===
+        self._k_hover = state.family(_HOVER, self.prefix)
+        self._k_loading = state.family(_LOADING, self.prefix)
+        self._k_icon_offset = state.family(_ICON_OFFSET, self.prefix)
+
+        # True while hovering or loading (listen to it instead of polling
+        # is_hovering()/is_loading())
+        self.active_key = state.family(_ACTIVE, self.prefix)
+
+        # Float endpoints (low, high) for idle and active, built once: the
+        # client tweens between them, so each leg is a single write
+        self._float_offsets = (
+            (ft.Offset(0, 0.09), ft.Offset(0, -0.09)),
+            (ft.Offset(0.5, 0.09), ft.Offset(0.5, -0.09)),
+        )
+        self._float_phase = 0
+
+        # Hover/loading changes the float amplitude right away
+        active_key = self.active_key
+        state.listen(active_key, self._on_active, immediate=False)
+
+        # Only two outcomes per visual state: build each value once and let
+        # the bindings hand back the shared instance
+        rotate_active = ft.Rotate(self.hover_rotation, alignment=ft.alignment.center)
+        rotate_idle = ft.Rotate(self.initial_rotation, alignment=ft.alignment.center)
+        scale_active, scale_idle = ft.Scale(1.25), ft.Scale(1)
+        offset_active, offset_idle = ft.Offset(1, 0), ft.Offset(-0.4, 0)
 
         # === BINDINGS ===
-        # Bind refs to atoms/selectors for automatic updates
-        self.page.state.bind(f"{self.prefix}_icon_offset", self.icon_ref, "offset")
-        self.page.state.bind(f"{self.prefix}_icon_rotate", self.icon_ref, "rotate")
-        self.page.state.bind(f"{self.prefix}_icon_scale", self.icon_ref, "scale")
-        self.page.state.bind(f"{self.prefix}_text_offset", self.text_ref, "offset")
-        self.page.state.bind(f"{self.prefix}_text_opacity", self.text_ref, "opacity")
+        # Visual states are projections of active, folded into the binds
+        state.bind(self._k_icon_offset, self.icon_ref, "offset")
+        state.bind(
+            active_key,
+            self.icon_ref,
+            "rotate",
+            transform=lambda active: rotate_active if active else rotate_idle,
+        )
+        state.bind(
+            active_key,
+            self.icon_ref,
+            "scale",
+            transform=lambda active: scale_active if active else scale_idle,
+        )
+        state.bind(
+            active_key,
+            self.text_ref,
+            "offset",
+            transform=lambda active: offset_active if active else offset_idle,
+        )
+        state.bind(
+            active_key,
+            self.text_ref,
+            "opacity",
+            transform=lambda active: 0.0 if active else 1.0,
+        )
 
     def set_hover_state(self, is_hovering: bool):
         """
         Updates the hover state.
 
         All visual states (rotate, scale, text_offset, text_opacity)
-        are automatically derived via selectors.
+        are automatically derived from the active selector.
         """
-        self.page.state.set(f"{self.prefix}_hover", is_hovering)
+        self.page.state.set(self._k_hover, is_hovering)
 
     def set_loading_state(self, is_loading: bool):
         """
         Updates the loading state.
 
         All visual states (rotate, scale, text_offset, text_opacity)
-        are automatically derived via selectors.
+        are automatically derived from the active selector.
+        """
+        self.page.state.set(self._k_loading, is_loading)
+
+    def _on_active(self, active: bool):
+        """Moves the float to the endpoints of the new state."""
+        offsets = self._float_offsets[1 if active else 0]
+        self.page.state.set(self._k_icon_offset, offsets[self._float_phase])
+
+    def float_step(self):
+        """
+        Sends the icon to the other float endpoint (one leg of the float).
+
+        Call it when the previous leg's offset animation ends, so the client
+        drives the timing and the server writes once per leg.
         """
-        self.page.state.set(f"{self.prefix}_loading", is_loading)
+        self._float_phase ^= 1
+        self._on_active(self.page.state.get(self.active_key))
 
     def set_icon_offset(self, x: float, y: float):
         """Sets the icon offset (used by floating animation)."""
-        self.page.state.set(f"{self.prefix}_icon_offset", ft.Offset(x, y))
+        self.page.state.set(self._k_icon_offset, ft.Offset(x, y))
 
     def is_hovering(self) -> bool:
         """Returns whether it's in hover state."""
-        return self.page.state.get(f"{self.prefix}_hover")
+        return self.page.state.get(self._k_hover)
 
     def is_loading(self) -> bool:
         """Returns whether it's in loading state."""
-        return self.page.state.get(f"{self.prefix}_loading")
+        return self.page.state.get(self._k_loading)
 
     def build(self) -> ft.Row:
         """Returns the Row component with icon and text."""
@@ -153,14 +221,36 @@ class SendIconWithText:
         )
 
 
+# Cloud (left, opacity) positions shared by every keyframe
+_CLOUD_HIDDEN = (130, 0.0)
+# Projections of a (left, opacity) position, shared by every binding
+_CLOUD_LEFT = operator.itemgetter(0)
+_CLOUD_OPACITY = operator.itemgetter(1)
+_CLOUD_SHOWN = (-20, 1.0)
+
+
 class CloudPair:
     """
     Molecule: Cloud pair for alternating parallax effect.
 
-    Uses atoms with incremental counter to avoid deep_equal blocking.
-    Each cloud has its own state (left, opacity) linked via bind().
+    Each cloud has one (left, opacity) atom, so a transition is a single
+    write; one listener per cloud applies both properties with one update().
     """
 
+    __slots__ = (
+        "page",
+        "prefix",
+        "animation_duration",
+        "_current_idx",
+        "_pos_keys",
+        "keyframes",
+        "cycle_seconds",
+        "cloud_a_ref",
+        "cloud_b_ref",
+        "cloud_a",
+        "cloud_b",
+    )
+
     def __init__(
         self,
         page: ft.Page,
@@ -175,8 +265,19 @@ class CloudPair:
         self.prefix = prefix
         self.animation_duration = animation_duration
         self._current_idx = 0
-        self._counter_a = 0
-        self._counter_b = 0
+
+        # Ring of position atom keys (cloud a, cloud b), built once
+        self._pos_keys = (f"{prefix}_a_pos", f"{prefix}_b_pos")
+
+        # One cloud cycle as data: (seconds from cycle start, position).
+        # Enter hidden on the right, glide left while fading in, then hide
+        travel = animation_duration / 1000
+        self.keyframes = (
+            (0.0, _CLOUD_HIDDEN),
+            (0.05, _CLOUD_SHOWN),
+            (0.05 + travel, _CLOUD_HIDDEN),
+        )
+        self.cycle_seconds = 0.1 + travel
 
         # Create refs
         self.cloud_a_ref = ft.Ref[ft.Container]()
@@ -205,73 +306,43 @@ class CloudPair:
 
     def _setup_state(self):
         """
-        Configures atoms for each cloud.
-        Binds directly to left and opacity atoms (simple values).
-        The incremental counter ensures each set() is unique.
-        """
-        # Separate atoms for each property of each cloud
-        # Using tuple (value, counter) to ensure uniqueness
-        self.page.state.atom(f"{self.prefix}_a_left", (130, 0))
-        self.page.state.atom(f"{self.prefix}_a_opacity", (0.0, 0))
-        self.page.state.atom(f"{self.prefix}_b_left", (130, 0))
-        self.page.state.atom(f"{self.prefix}_b_opacity", (0.0, 0))
-
-        # Selectors that extract only the value (first element of the tuple)
-        @self.page.state.selector(f"{self.prefix}_a_left_val")
-        def get_a_left(get):
-            return get(f"{self.prefix}_a_left")[0]
-
-        @self.page.state.selector(f"{self.prefix}_a_opacity_val")
-        def get_a_opacity(get):
-            return get(f"{self.prefix}_a_opacity")[0]
-
-        @self.page.state.selector(f"{self.prefix}_b_left_val")
-        def get_b_left(get):
-            return get(f"{self.prefix}_b_left")[0]
-
-        @self.page.state.selector(f"{self.prefix}_b_opacity_val")
-        def get_b_opacity(get):
-            return get(f"{self.prefix}_b_opacity")[0]
-
-        # Bindings using selectors
-        self.page.state.bind(f"{self.prefix}_a_left_val", self.cloud_a_ref, "left")
-        self.page.state.bind(
-            f"{self.prefix}_a_opacity_val", self.cloud_a_ref, "opacity"
-        )
-        self.page.state.bind(f"{self.prefix}_b_left_val", self.cloud_b_ref, "left")
-        self.page.state.bind(
-            f"{self.prefix}_b_opacity_val", self.cloud_b_ref, "opacity"
-        )
+        Configures one position atom per cloud and binds left and opacity.
 
-    def _set_cloud_state(self, suffix: str, left: float, opacity: float):
-        """Updates cloud state via separate atoms (with unique counter)."""
-        if suffix == "a":
-            self._counter_a += 1
-            self.page.state.set(f"{self.prefix}_a_left", (left, self._counter_a))
-            self.page.state.set(f"{self.prefix}_a_opacity", (opacity, self._counter_a))
-        else:
-            self._counter_b += 1
-            self.page.state.set(f"{self.prefix}_b_left", (left, self._counter_b))
-            self.page.state.set(f"{self.prefix}_b_opacity", (opacity, self._counter_b))
+        A set() sends both properties of the cloud with one update(), and
+        inside a batch() the cloud waits for the batch's page.update().
+        """
+        state = self.page.state
+        for pos_key, ref in zip(self._pos_keys, (self.cloud_a_ref, self.cloud_b_ref)):
+            # Composite atom: (left, opacity)
+            state.atom(pos_key, _CLOUD_HIDDEN)
+            state.bind(pos_key, ref, "left", transform=_CLOUD_LEFT)
+            state.bind(pos_key, ref, "opacity", transform=_CLOUD_OPACITY)
 
     def get_clouds(self) -> list:
         """Returns list with both clouds."""
         return [self.cloud_a, self.cloud_b]
 
-    def get_next_cloud_suffix(self) -> str:
-        """Returns the suffix of the next cloud in the cycle."""
-        suffix = "a" if self._current_idx == 0 else "b"
-        self._current_idx = (self._current_idx + 1) % 2
-        return suffix
+    def get_next_cloud(self) -> str:
+        """Returns the next cloud in the cycle (its position atom key)."""
+        cloud = self._pos_keys[self._current_idx]
+        self._current_idx ^= 1
+        return cloud
+
+    def set_cloud_position(self, cloud: str, left: float, opacity: float):
+        """Sets the position and opacity of a cloud from get_next_cloud()."""
+        self.page.state.set(cloud, (left, opacity))
 
-    def set_cloud_position(self, suffix: str, left: float, opacity: float):
-        """Sets cloud position and opacity via reactive state."""
-        self._set_cloud_state(suffix, left, opacity)
+    def set_cloud_keyframe(self, cloud: str, position: tuple):
+        """Writes a (left, opacity) position from `keyframes` to a cloud."""
+        self.page.state.set(cloud, position)
 
     def reset(self):
         """Resets both clouds to initial position (hidden)."""
-        self._set_cloud_state("a", 130, 0.0)
-        self._set_cloud_state("b", 130, 0.0)
+        # Called when the loops go idle: both clouds go in one page.update(),
+        # and none is sent when both are already hidden
+        with self.page.state.batch():
+            for cloud in self._pos_keys:
+                self.page.state.set(cloud, _CLOUD_HIDDEN)
 
     def get_animation_duration_seconds(self) -> float:
         """Returns the animation duration in seconds."""
@@ -283,8 +354,23 @@ class LoadingBar:
     Molecule: Loading bar with progress controlled via flet-asp.
 
     Uses atom for progress (0-100) and bind to update bar width.
+    A progress change can carry a duration: the client then tweens the fill
+    width itself, so a whole load is a single state write.
     """
 
+    __slots__ = (
+        "page",
+        "prefix",
+        "width",
+        "_k_progress",
+        "_k_animate",
+        "_k_visible",
+        "_last_progress",
+        "bar_ref",
+        "progress_ref",
+        "bar",
+    )
+
     def __init__(
         self,
         page: ft.Page,
@@ -297,16 +383,23 @@ class LoadingBar:
         self.page = page
         self.prefix = prefix
         self.width = width
-        self._counter = 0  # Counter to ensure uniqueness in deep_equal
+
+        # Keys used on the hot path, built once
+        self._k_progress = f"{prefix}_progress"
+        self._k_animate = f"{prefix}_animate"
+        self._k_visible = f"{prefix}_visible"
+
+        # Last (progress, duration) written, to skip repeated writes
+        self._last_progress = (0.0, 0)
 
         # Create refs
         self.bar_ref = ft.Ref[ft.Container]()
-        self.progress_ref = ft.Ref[ft.ProgressBar]()
+        self.progress_ref = ft.Ref[ft.Container]()
 
         # Create UI atom (passing both refs)
         self.bar = loading_bar(
             ref=self.bar_ref,
-            progress_ref=self.progress_ref,  # Ref for the ProgressBar
+            progress_ref=self.progress_ref,  # Ref for the fill
             width=width,
             height=height,
             bgcolor=bgcolor,
@@ -317,44 +410,71 @@ class LoadingBar:
         self._setup_state()
 
     def _setup_state(self):
-        """Configures progress atom, visibility, and selectors."""
-        # Atom: progress from 0 to 100 with counter (value, counter)
-        self.page.state.atom(f"{self.prefix}_progress", (0.0, 0))
+        """Configures progress atom, visibility, and bindings."""
+        # Atom: progress from 0 to 100
+        self.page.state.atom(self._k_progress, 0.0)
 
-        # Atom: visibility (True = visible, False = hidden)
-        self.page.state.atom(f"{self.prefix}_visible", False)
+        # Atom: fill animation for the next progress change (None = jump)
+        self.page.state.atom(self._k_animate, None)
 
-        # Selector: converts progress (0-100) to ProgressBar value (0.0-1.0)
-        @self.page.state.selector(f"{self.prefix}_value")
-        def compute_value(get):
-            progress_tuple = get(f"{self.prefix}_progress")
-            progress = progress_tuple[0]  # Extract value from tuple (0-100)
-            return progress / 100.0  # Convert to 0.0-1.0
+        # Atom: visibility (True = visible, False = hidden)
+        self.page.state.atom(self._k_visible, False)
 
-        # Selector: opacity based on visibility
-        @self.page.state.selector(f"{self.prefix}_opacity")
-        def compute_opacity(get):
-            return 1.0 if get(f"{self.prefix}_visible") else 0.0
+        # Bindings: one-line projections are folded into the bind, so there
+        # is no selector (and cache entry) between the atoms and the refs
+        px_per_pct = self.width * 0.01
+        self.page.state.bind(self._k_animate, self.progress_ref, "animate")
+        self.page.state.bind(
+            self._k_progress,
+            self.progress_ref,
+            "width",
+            transform=lambda progress: progress * px_per_pct,
+        )
+        self.page.state.bind(
+            self._k_visible,
+            self.bar_ref,
+            "opacity",
+            transform=lambda visible: 1.0 if visible else 0.0,
+        )
 
-        # Bindings
-        self.page.state.bind(f"{self.prefix}_value", self.progress_ref, "value")
-        self.page.state.bind(f"{self.prefix}_opacity", self.bar_ref, "opacity")
+    def set_progress(self, progress: float, duration: float = 0):
+        """
+        Sets the bar progress (0-100).
 
-    def set_progress(self, progress: float):
-        """Sets the bar progress (0-100)."""
-        progress = max(0, min(100, progress))  # Clamp between 0-100
-        self._counter += 1
+        With duration (seconds) > 0 the client animates the fill to the new
+        progress over that time; otherwise it jumps there.
+        """
+        # Clamp between 0-100 (comparisons instead of min/max calls)
+        if progress < 0:
+            progress = 0
+        elif progress > 100:
+            progress = 100
+
+        # Nothing to do if this exact write was the last one (e.g. reset()
+        # on a bar that is already at 0%)
+        if (progress, duration) == self._last_progress:
+            return
+        self._last_progress = (progress, duration)
+
+        animate = (
+            ft.Animation(int(duration * 1000), ft.AnimationCurve.LINEAR)
+            if duration > 0
+            else None
+        )
 
-        # Update only the atom - flet-asp should manage the update
-        self.page.state.set(f"{self.prefix}_progress", (progress, self._counter))
+        # Animation first, so the client applies it to the width change;
+        # the bound controls update themselves, no page.update() needed
+        with self.page.state.batch(update_page=False):
+            self.page.state.set(self._k_animate, animate)
+            self.page.state.set(self._k_progress, progress)
 
     def show(self):
         """Makes the bar visible."""
-        self.page.state.set(f"{self.prefix}_visible", True)
+        self.page.state.set(self._k_visible, True)
 
     def hide(self):
         """Hides the bar."""
-        self.page.state.set(f"{self.prefix}_visible", False)
+        self.page.state.set(self._k_visible, False)
 
     def reset(self):
         """Resets the bar to 0%."""
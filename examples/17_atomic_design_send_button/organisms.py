@@ -6,12 +6,20 @@ Uses Flet lifecycle methods:
 - build(): Builds the UI when the control receives self.page
 - did_mount(): Starts animations after the control is added to the page
 - will_unmount(): Stops animations before the control is removed
+
+Cloud animations are coroutines on the page's event loop (no extra threads);
+the icon float is a chain of client-side tweens (no server timer at all).
 """
 
+import asyncio
+import itertools
 import time
 import flet as ft
 from molecules import SendIconWithText, CloudPair, LoadingBar
 
+# Source of per-button ids, so several buttons can share one page
+_button_ids = itertools.count()
+
 
 class AnimatedSendButton(ft.Container):
     """
@@ -20,7 +28,9 @@ class AnimatedSendButton(ft.Container):
     Composite custom control that inherits from Container and uses:
     - Flet lifecycle (build, did_mount, will_unmount)
     - flet_asp reactive state for UI updates
-    - Does not use update() directly - all changes are via atoms
+    - Property changes go through atoms; update() is called directly only
+      when the lazily built clouds or loading bar are inserted into the Stack
+    - One asyncio task drives the cloud loops
 
     Combines:
     - SendIconWithText (molecule): airplane icon + "SEND" text
@@ -38,7 +48,8 @@ class AnimatedSendButton(ft.Container):
         loading_duration: float = 3.0,
     ):
         super().__init__()
-        self.prefix = "animated_btn"
+        # Unique per button: it identifies this button's family members
+        self.prefix = f"animated_btn_{next(_button_ids)}"
         self._width = width
         self._height = height
         self._bgcolor = bgcolor
@@ -48,7 +59,12 @@ class AnimatedSendButton(ft.Container):
         self._running = False
         self._is_loading = False
 
-        # Molecules will be created in build()
+        # Mirrors the icon's active selector (hovering or loading); created
+        # on the event loop by _run_animations() (cloud loops sleep on it)
+        self._active_event: asyncio.Event = None
+        self._loop: asyncio.AbstractEventLoop = None
+
+        # Molecules are created in build() (clouds and bar on first use)
         self.send_icon_text = None
         self.clouds_top = None
         self.clouds_bottom = None
@@ -64,10 +80,45 @@ class AnimatedSendButton(ft.Container):
             page=self.page,
             prefix=f"{self.prefix}_icon_text",
             text_value=self._text_value,
+            float_interval=self._float_interval,
+        )
+
+        # The float is a chain of client-side tweens: each ending leg asks
+        # for the next one, so there is no server-side timer
+        self.send_icon_text.icon.on_animation_end = self._on_icon_animation_end
+
+        # Clouds and loading bar are built on first hover/click
+        # (_ensure_clouds/_ensure_loading_bar): a page full of untouched
+        # buttons never pays for their atoms, selectors and bindings
+
+        # Configure Container properties (self) - back to single Container
+        self.width = self._width
+        self.height = self._height
+        self.bgcolor = self._bgcolor
+        self.border_radius = 10
+        self.clip_behavior = ft.ClipBehavior.HARD_EDGE
+        self.on_hover = self._on_hover
+        self.content = ft.Stack(
+            controls=[
+                # Icon and text layer (clouds go below, the bar above it)
+                self.send_icon_text.build(),
+                # Transparent layer to capture clicks (covers everything)
+                ft.Container(
+                    width=self._width,
+                    height=self._height,
+                    bgcolor=ft.Colors.TRANSPARENT,
+                    on_click=self._on_click,
+                ),
+            ],
         )
 
+    def _ensure_clouds(self):
+        """Builds both cloud pairs and inserts them behind the icon."""
+        if self.clouds_top is not None:
+            return
+
         # Top clouds (faster)
-        self.clouds_top = CloudPair(
+        clouds_top = CloudPair(
             page=self.page,
             prefix=f"{self.prefix}_cloud_top",
             size=12,
@@ -77,7 +128,7 @@ class AnimatedSendButton(ft.Container):
         )
 
         # Bottom clouds (slower - parallax)
-        self.clouds_bottom = CloudPair(
+        clouds_bottom = CloudPair(
             page=self.page,
             prefix=f"{self.prefix}_cloud_bottom",
             size=10,
@@ -86,8 +137,22 @@ class AnimatedSendButton(ft.Container):
             animation_duration=1800,
         )
 
-        # Loading bar
-        self.loading_bar = LoadingBar(
+        # Cloud layer (background)
+        self.content.controls[0:0] = [
+            *clouds_top.get_clouds(),
+            *clouds_bottom.get_clouds(),
+        ]
+        self.clouds_top = clouds_top
+        self.clouds_bottom = clouds_bottom
+        if self.content.page:
+            self.content.update()
+
+    def _ensure_loading_bar(self):
+        """Builds the loading bar and inserts it below the click layer."""
+        if self.loading_bar is not None:
+            return
+
+        loading_bar = LoadingBar(
             page=self.page,
             prefix=f"{self.prefix}_loading",
             width=self._width,
@@ -96,162 +161,146 @@ class AnimatedSendButton(ft.Container):
             bar_color=ft.Colors.WHITE,
         )
 
-        # Configure Container properties (self) - back to single Container
-        self.width = self._width
-        self.height = self._height
-        self.bgcolor = self._bgcolor
-        self.border_radius = 10
-        self.clip_behavior = ft.ClipBehavior.HARD_EDGE
-        self.on_hover = self._on_hover
-        self.content = ft.Stack(
-            controls=[
-                # Cloud layer (background)
-                *self.clouds_top.get_clouds(),
-                *self.clouds_bottom.get_clouds(),
-                # Icon and text layer (middle)
-                self.send_icon_text.build(),
-                # Loading bar (front, at the bottom)
-                ft.Container(
-                    content=self.loading_bar.build(),
-                    bottom=0,
-                    left=0,
-                    right=0,
-                ),
-                # Transparent layer to capture clicks (covers everything)
-                ft.Container(
-                    width=self._width,
-                    height=self._height,
-                    bgcolor=ft.Colors.TRANSPARENT,
-                    on_click=self._on_click,
-                ),
-            ],
+        # Loading bar (front, at the bottom)
+        self.content.controls.insert(
+            -1,
+            ft.Container(
+                content=loading_bar.build(),
+                bottom=0,
+                left=0,
+                right=0,
+            ),
         )
+        self.loading_bar = loading_bar
+        if self.content.page:
+            self.content.update()
 
     def did_mount(self):
         """
         Called after the control is added to the page.
-        Starts the animation threads here.
+        Starts the animation task here.
         """
         self._running = True
-        self.page.run_thread(self._fly_animation)
-        self.page.run_thread(self._cloud_top_animation)
-        self.page.run_thread(self._cloud_bottom_animation)
+        self.send_icon_text.float_step()  # First float leg
+        self.page.run_task(self._run_animations)
 
     def will_unmount(self):
         """
         Called before the control is removed from the page.
-        Stops the animation threads.
+        Stops the animation loops.
         """
         self._running = False
+        self._set_active(True)  # Wake parked loops so they can exit
 
     def _on_hover(self, e):
         """Hover event handler - uses reactive state."""
         is_hovering = e.data == "true"
+        if is_hovering:
+            self._ensure_clouds()
         self.send_icon_text.set_hover_state(is_hovering)
 
     def _on_click(self, e):
         """Click handler - starts loading."""
         if not self._is_loading:
             self._is_loading = True
+            self._ensure_clouds()
+            self._ensure_loading_bar()
+
+            # One page.update() sends the icon, text and bar changes together
+            with self.page.state.batch():
+                # Activate loading state on icon/text (hides text and centers icon)
+                self.send_icon_text.set_loading_state(True)
+
+                # Reset and show bar immediately
+                self.loading_bar.reset()
+                self.loading_bar.show()
+
+            # Start loading on the event loop
+            self.page.run_task(self._loading_animation)
+
+    def _set_active(self, active: bool):
+        """Sets/clears the active event (callable from any thread)."""
+        if self._active_event is None:
+            return
+        event = self._active_event
+        self._loop.call_soon_threadsafe(event.set if active else event.clear)
+
+    async def _run_animations(self):
+        """Task: runs both cloud loops concurrently."""
+        self._loop = asyncio.get_running_loop()
+        self._active_event = asyncio.Event()
+
+        # Single source of truth: the icon's active selector drives the event
+        self.page.state.listen(self.send_icon_text.active_key, self._set_active)
+
+        await asyncio.gather(
+            self._cloud_top_animation(),
+            self._cloud_bottom_animation(),
+        )
 
-            # Activate loading state on icon/text (hides text and centers icon)
-            self.send_icon_text.set_loading_state(True)
+    @staticmethod
+    async def _animate_cloud(cloud_pair: CloudPair):
+        """Plays one cycle of the pair's keyframes on its next cloud."""
+        cloud = cloud_pair.get_next_cloud()
+        elapsed = 0.0
+        for at, position in cloud_pair.keyframes:
+            await asyncio.sleep(at - elapsed)
+            cloud_pair.set_cloud_keyframe(cloud, position)
+            elapsed = at
+
+        # Rest until the end of the cycle
+        await asyncio.sleep(cloud_pair.cycle_seconds - elapsed)
+
+    def _on_icon_animation_end(self, e):
+        """Starts the next float leg when the icon's offset tween ends."""
+        if self._running and e.data == "offset":
+            self.send_icon_text.float_step()
+
+    async def _cloud_loop(self, name: str):
+        """Coroutine: parallax loop for the cloud pair stored in `name`."""
+        active = self._active_event
+        while self._running:
+            # Dormant (no writes, no wakeups) until hover/loading starts
+            await active.wait()
 
-            # Reset and show bar immediately
-            self.loading_bar.reset()
-            self.loading_bar.show()
+            # The pair only exists once hover/click has activated the button
+            cloud_pair = getattr(self, name)
+            if cloud_pair is None:
+                return
 
-            # Start loading in thread
-            self.page.run_thread(self._loading_animation)
+            while self._running and active.is_set():
+                await self._animate_cloud(cloud_pair)
 
-    @staticmethod
-    def _animate_cloud(cloud_pair: CloudPair, duration: float):
-        """Animates a cloud from right to left."""
-        suffix = cloud_pair.get_next_cloud_suffix()
+            # Park the clouds once per idle transition
+            if self._running:
+                cloud_pair.reset()
 
-        # Position on the right (invisible)
-        cloud_pair.set_cloud_position(suffix, 130, 0.0)
-        time.sleep(0.05)
+    async def _cloud_top_animation(self):
+        """Coroutine: Top clouds parallax effect."""
+        await self._cloud_loop("clouds_top")
 
-        # Show and move to the left
-        cloud_pair.set_cloud_position(suffix, -20, 1.0)
-        time.sleep(duration)
+    async def _cloud_bottom_animation(self):
+        """Coroutine: Bottom clouds parallax effect."""
+        await self._cloud_loop("clouds_bottom")
 
-        # Hide when reaching the left
-        cloud_pair.set_cloud_position(suffix, 130, 0.0)
-        time.sleep(0.05)
+    async def _loading_animation(self):
+        """Coroutine: Progressive loading animation."""
+        # Simulate loading: the client tweens the bar to 100% on its own
+        self.loading_bar.set_progress(100, duration=self._loading_duration)
 
-    def _fly_animation(self):
-        """Thread: Flying/floating airplane effect - always active."""
-        while self._running:
-            is_hover = self.send_icon_text.is_hovering()
-            is_loading = self._is_loading
-
-            if is_hover or is_loading:
-                # Floating when hover or loading (centered)
-                self.send_icon_text.set_icon_offset(0.5, 0.09)
-                time.sleep(self._float_interval)
-
-                if self._running and (
-                    self.send_icon_text.is_hovering() or self._is_loading
-                ):
-                    self.send_icon_text.set_icon_offset(0.5, -0.09)
-                    time.sleep(self._float_interval)
-            else:
-                # Normal floating (initial position)
-                self.send_icon_text.set_icon_offset(0, 0.09)
-                time.sleep(self._float_interval)
-
-                if (
-                    self._running
-                    and not self.send_icon_text.is_hovering()
-                    and not self._is_loading
-                ):
-                    self.send_icon_text.set_icon_offset(0, -0.09)
-                    time.sleep(self._float_interval)
-
-    def _cloud_top_animation(self):
-        """Thread: Top clouds parallax effect."""
-        while self._running:
-            if self.send_icon_text.is_hovering() or self._is_loading:
-                self._animate_cloud(
-                    self.clouds_top, self.clouds_top.get_animation_duration_seconds()
-                )
-            else:
-                self.clouds_top.reset()
-                time.sleep(0.1)
-
-    def _cloud_bottom_animation(self):
-        """Thread: Bottom clouds parallax effect."""
-        while self._running:
-            if self.send_icon_text.is_hovering() or self._is_loading:
-                self._animate_cloud(
-                    self.clouds_bottom,
-                    self.clouds_bottom.get_animation_duration_seconds(),
-                )
-            else:
-                self.clouds_bottom.reset()
-                time.sleep(0.1)
-
-    def _loading_animation(self):
-        """Thread: Progressive loading animation."""
-        # Simulate loading with incremental progress
-        steps = 100
-        delay = self._loading_duration / steps
-
-        for i in range(steps + 1):
-            if not self._running:
-                break
-            self.loading_bar.set_progress(i)
-            time.sleep(delay)
+        # Wait for it in short slices so unmounting stops the wait early
+        deadline = time.monotonic() + self._loading_duration
+        while self._running and time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
 
         # Hide bar and reset
         self.loading_bar.hide()
-        time.sleep(0.3)  # Wait for fade out to complete
-        self.loading_bar.reset()
+        await asyncio.sleep(0.3)  # Wait for fade out to complete
+        with self.page.state.batch():
+            self.loading_bar.reset()
 
-        # Deactivate loading state on icon/text (text reappears)
-        self.send_icon_text.set_loading_state(False)
+            # Deactivate loading state on icon/text (text reappears)
+            self.send_icon_text.set_loading_state(False)
 
         # Finish loading
         self._is_loading = False
@@ -1,7 +1,14 @@
+from functools import lru_cache
 import flet as ft
 import flet_asp as fa
 
 
+@lru_cache(maxsize=128)
+def combine_names(first: str, last: str) -> str:
+    """Joins the names; cached, so retyping or deleting reuses earlier strings."""
+    return f"{first} {last}".strip()
+
+
 def main(page: ft.Page):
     """
     This example demonstrates how to define a derived state in FletASP using the @selector(...) decorator.
@@ -25,12 +32,12 @@ def main(page: ft.Page):
     @state.selector("full_name")
     def full_name(get):
         # get("key") retrieves the current value of any atom or selector
-        return f"{get('first_name')} {get('last_name')}".strip()
+        return combine_names(get("first_name"), get("last_name"))
 
     # Alternatively, using function registration:
     # state.add_selector(
     #     "full_name",
-    #     lambda get: f"{get('first_name')} {get('last_name')}".strip()
+    #     lambda get: combine_names(get("first_name"), get("last_name"))
     # )
 
     # Create references for the UI controls
@@ -44,12 +51,12 @@ def main(page: ft.Page):
         ft.TextField(
             label="First name",
             ref=first_ref,
-            on_change=lambda e: state.set("first_name", e.control.value),
+            on_change=state.setter("first_name", delay=0.03),
         ),
         ft.TextField(
             label="Last name",
             ref=last_ref,
-            on_change=lambda e: state.set("last_name", e.control.value),
+            on_change=state.setter("last_name", delay=0.03),
         ),
     )
 
@@ -1,8 +1,16 @@
 import asyncio
+from dataclasses import dataclass
 import flet as ft
 import flet_asp as fa
 
 
+@dataclass(frozen=True)
+class User:
+    """Logged-in user; compared by value, so an identical login is not a change."""
+
+    email: str
+
+
 def main(page: ft.Page):
     """
     This example demonstrates how to use the Action class in Flet-ASP to encapsulate an asynchronous operation, such as a login request.
@@ -32,8 +40,10 @@ def main(page: ft.Page):
 
     # Define the login action logic (asynchronous)
     async def login_action(get, set_value, args):
-        set_value("loading", True)
-        set_value("error", "")
+        # Related writes in one batch: listeners and the page update run once
+        with state.batch():
+            set_value("loading", True)
+            set_value("error", "")
 
         # Simulate an API delay
         await asyncio.sleep(1.5)
@@ -42,14 +52,17 @@ def main(page: ft.Page):
         email = get("email")
         password = get("password")
 
-        # Simulated credential validation
-        if email == "test@test.com" and password == "123":
-            set_value("user", {"email": email})
-        else:
-            set_value("error", "Invalid credentials")
-            set_value("user", None)
+        # Simulated credential validation - the user, error and loading
+        # bindings only assign their controls here; the batch then sends all
+        # three to the client in a single page.update()
+        with state.batch():
+            if email == "test@test.com" and password == "123":
+                set_value("user", User(email=email))
+            else:
+                set_value("error", "Invalid credentials")
+                set_value("user", None)
 
-        set_value("loading", False)
+            set_value("loading", False)
 
     # Create the Action object
     login = fa.Action(login_action)
@@ -65,13 +78,13 @@ def main(page: ft.Page):
                 ft.TextField(
                     label="Email",
                     ref=email_ref,
-                    on_change=lambda e: state.set("email", e.control.value),
+                    on_change=state.setter("email", delay=0.03),
                 ),
                 ft.TextField(
                     label="Password",
                     password=True,
                     ref=password_ref,
-                    on_change=lambda e: state.set("password", e.control.value),
+                    on_change=state.setter("password", delay=0.03),
                 ),
                 ft.ElevatedButton("Login", on_click=on_login_click),
                 ft.ProgressRing(ref=loading_ref),
@@ -84,7 +97,12 @@ def main(page: ft.Page):
     # Bind state values to UI controls
     state.bind("loading", loading_ref, prop="visible")
     state.bind("error", error_ref, prop="value")
-    state.bind("user", user_ref, prop="value")
+    state.bind(
+        "user",
+        user_ref,
+        prop="value",
+        transform=lambda user: f"Logged in as {user.email}" if user else "",
+    )
 
 
 if __name__ == "__main__":
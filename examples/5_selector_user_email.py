@@ -1,12 +1,20 @@
 import asyncio
+from dataclasses import dataclass
 import flet as ft
 import flet_asp as fa
 
 
+@dataclass(frozen=True)
+class User:
+    """Logged-in user; compared by value, so an identical login is not a change."""
+
+    email: str
+
+
 def main(page: ft.Page):
     """
     This example demonstrates how to use the @selector decorator in Flet-ASP
-    to derive a specific property from an object (in this case, user["email"]).
+    to derive a specific property from an object (in this case, user.email).
 
     Instead of binding the entire user atom, this approach focuses only on
     what matters — the email. The derived value is updated automatically
@@ -42,17 +50,20 @@ def main(page: ft.Page):
     # Define the async login action using @action decorator
     @state.action
     async def login(get, set_value):
-        set_value("loading", True)
-        set_value("error", "")
+        # Related writes in one batch: listeners and the page update run once
+        with state.batch():
+            set_value("loading", True)
+            set_value("error", "")
         await asyncio.sleep(1)
 
-        if get("email") == "test@test.com" and get("password") == "123":
-            set_value("user", {"email": get("email")})
-        else:
-            set_value("error", "Invalid login")
-            set_value("user", None)
+        with state.batch():
+            if get("email") == "test@test.com" and get("password") == "123":
+                set_value("user", User(email=get("email")))
+            else:
+                set_value("error", "Invalid login")
+                set_value("user", None)
 
-        set_value("loading", False)
+            set_value("loading", False)
 
     # Trigger login on button click
     def on_login_click(e):
@@ -63,20 +74,20 @@ def main(page: ft.Page):
     @state.selector("user_email")
     def get_user_email(get):
         user = get("user")
-        return (user or {}).get("email", "")
+        return user.email if user else ""
 
     # Build the UI layout
     page.add(
         ft.TextField(
             label="Email",
             ref=email_input_ref,
-            on_change=lambda e: state.set("email", e.control.value),
+            on_change=state.setter("email", delay=0.03),
         ),
         ft.TextField(
             label="Password",
             password=True,
             ref=pass_input_ref,
-            on_change=lambda e: state.set("password", e.control.value),
+            on_change=state.setter("password", delay=0.03),
         ),
         ft.ElevatedButton("Login", on_click=on_login_click),
         ft.ProgressRing(ref=loading_ref),
@@ -15,7 +15,7 @@ def main(page: ft.Page):
     - bind() for declarative UI updates
 
     * User types credentials and clicks Login
-    * Simulated async login with progress updates
+    * Simulated async login with a progress message
     * After login:
         - If valid: shows Welcome, <email>
         - If invalid: shows User not authenticated
@@ -38,18 +38,19 @@ def main(page: ft.Page):
     # Define the async login action using @action decorator
     @state.action
     async def login(get, set_value):
-        # Simulate loading step with progress updates
-        for i in range(10):
-            await asyncio.sleep(0.1)
-            set_value("auth_status", f"Authenticating... {i}")
-
-        # Fake credential validation
-        if get("email") == "test@test.com" and get("password") == "123":
-            set_value("user", {"email": get("email")})
-            set_value("auth_status", "")  # Clear status on success
-        else:
-            set_value("user", None)
-            set_value("auth_status", "")  # Clear status on failure
+        # Simulate the request: one status write, shown until it finishes
+        set_value("auth_status", "Authenticating...")
+        await asyncio.sleep(1.0)
+
+        # Fake credential validation - one batch, so the welcome selector
+        # recomputes once for both writes
+        with state.batch():
+            if get("email") == "test@test.com" and get("password") == "123":
+                set_value("user", {"email": get("email")})
+                set_value("auth_status", "")  # Clear status on success
+            else:
+                set_value("user", None)
+                set_value("auth_status", "")  # Clear status on failure
 
     # Run the action when the button is clicked
     def on_login_click(e):
@@ -79,13 +80,13 @@ def main(page: ft.Page):
         ft.TextField(
             label="Email",
             ref=email_ref,
-            on_change=lambda e: state.set("email", e.control.value),
+            on_change=state.setter("email", delay=0.03),
         ),
         ft.TextField(
             label="Password",
             password=True,
             ref=password_ref,
-            on_change=lambda e: state.set("password", e.control.value),
+            on_change=state.setter("password", delay=0.03),
         ),
         ft.ElevatedButton("Login", on_click=on_login_click),
         ft.Text(ref=welcome_ref),
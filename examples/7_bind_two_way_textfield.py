@@ -37,8 +37,9 @@ def main(page: ft.Page):
     def current_message(new_value):
         print("Current value:", new_value)
 
-    # Establish two-way binding between the atom and the TextField
-    state.bind_two_way("message", text_input_ref)
+    # Establish two-way binding between the atom and the TextField; a burst
+    # of keystrokes becomes one atom write (and one listener call)
+    state.bind_two_way("message", text_input_ref, debounce=0.05)
 
     # Listen to the atom to react programmatically (e.g., logging)
     state.listen("message", current_message)
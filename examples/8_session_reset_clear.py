@@ -30,18 +30,20 @@ def main(page: ft.Page):
 
     # Async login action with simulated delay
     async def login_action(get, set_value, _):
-        # Simulate loading
+        # Simulate loading. Each step is its own visible frame (100 ms
+        # apart), so these writes are not merged
         for i in range(10):
             await asyncio.sleep(0.1)
             set_value("status", f"Loading... {i}")
 
-        # Basic login logic
+        # Basic login logic - the result goes out in one page.update()
         email = get("email")
-        if email:
-            set_value("user", {"email": email})
-            set_value("status", "Logged in")
-        else:
-            set_value("status", "Email cannot be empty")
+        with state.batch():
+            if email:
+                set_value("user", {"email": email})
+                set_value("status", "Logged in")
+            else:
+                set_value("status", "Email cannot be empty")
 
     # Create the action
     login = fa.Action(login_action)
@@ -65,7 +67,7 @@ def main(page: ft.Page):
         ft.TextField(
             label="Email",
             ref=email_input,
-            on_change=lambda e: state.set("email", e.control.value),
+            on_change=state.setter("email", delay=0.05),
         ),
         ft.Row(
             [
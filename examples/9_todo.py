@@ -1,78 +1,146 @@
+from dataclasses import dataclass
 import flet as ft
 import flet_asp as fa
 from typing import Callable
 
 
+@dataclass(slots=True)
+class Task:
+    """A task; slotted, so a long list carries no per-task __dict__."""
+
+    id: int
+    title: str
+    completed: bool = False
+
+
 class TaskItem(ft.Column):
     """
     A reusable UI component representing a task row,
-    in edit or display mode based on the `editing` flag.
+    in edit or display mode depending on whether it is the task being edited.
+
+    Items are kept per task id and brought up to date with sync(), so a
+    change to one task patches one row instead of rebuilding the list.
+    The row's controls are only created in build(), when Flet first sends
+    the item to the page; a task hidden by the filter never allocates them.
     """
 
     def __init__(
         self,
-        task_data: dict,
+        task: Task,
         on_toggle: Callable,
         on_delete: Callable,
         on_edit: Callable,
         on_save: Callable,
     ):
         super().__init__()
-        self.task_data = task_data
+        self.task_id = task.id
         self.title_ref = ft.Ref[ft.TextField]()
+        self.checkbox_ref = ft.Ref[ft.Checkbox]()
+        self.on_toggle = on_toggle
+        self.on_delete = on_delete
+        self.on_edit = on_edit
+        self.on_save = on_save
 
-        if task_data.get("editing", False):
-            self.controls = [
-                ft.Row(
-                    alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
-                    vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                    controls=[
-                        ft.TextField(
-                            ref=self.title_ref,
-                            value=task_data["title"],
-                            border=ft.InputBorder.UNDERLINE,
-                            expand=True,
-                        ),
-                        ft.IconButton(
-                            icon=ft.Icons.DONE_OUTLINE_OUTLINED,
-                            icon_color=ft.Colors.GREEN,
-                            tooltip="Save task",
-                            on_click=lambda e: on_save(
-                                task_data["id"], self.title_ref.current.value
-                            ),
-                        ),
-                    ],
-                )
-            ]
+        # (title, completed, editing) last rendered
+        self.signature = None
+        self.sync(task)
+
+    def sync(self, task: Task, editing: bool = False) -> bool:
+        """
+        Brings the row in line with task.
+
+        Args:
+            task (Task): The task shown by this row.
+            editing (bool): Whether this is the task being edited.
+
+        Returns:
+            bool: True if anything changed (the caller then sends it).
+        """
+        signature = (task.title, task.completed, editing)
+        if signature == self.signature:
+            return False
+
+        previous, self.signature = self.signature, signature
+        if not self.controls:
+            # Not built yet: build() will use the new signature
+            return False
+
+        title, completed, editing = signature
+        if not editing and not previous[2]:
+            # Still in display mode: patch the checkbox in place
+            checkbox = self.checkbox_ref.current
+            checkbox.value = completed
+            checkbox.label = title
         else:
-            self.controls = [
+            self._render()
+        return True
+
+    def build(self):
+        # Flet calls this each time the item is added to the page
+        if not self.controls:
+            self._render()
+
+    def _render(self):
+        """Builds the row for the current signature."""
+        title, completed, editing = self.signature
+        self.controls = [
+            self._build_editor(title)
+            if editing
+            else self._build_display(title, completed)
+        ]
+
+    def _build_editor(self, title: str) -> ft.Row:
+        """Row with the title field and the save button."""
+        return ft.Row(
+            alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+            controls=[
+                ft.TextField(
+                    ref=self.title_ref,
+                    value=title,
+                    border=ft.InputBorder.UNDERLINE,
+                    expand=True,
+                ),
+                ft.IconButton(
+                    icon=ft.Icons.DONE_OUTLINE_OUTLINED,
+                    icon_color=ft.Colors.GREEN,
+                    tooltip="Save task",
+                    on_click=lambda e: self.on_save(
+                        self.task_id, self.title_ref.current.value
+                    ),
+                ),
+            ],
+        )
+
+    def _build_display(self, title: str, completed: bool) -> ft.Row:
+        """Row with the checkbox and the edit/delete buttons."""
+        return ft.Row(
+            alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+            controls=[
+                ft.Checkbox(
+                    ref=self.checkbox_ref,
+                    value=completed,
+                    label=title,
+                    on_change=lambda e: self.on_toggle(self.task_id),
+                ),
                 ft.Row(
-                    alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
-                    vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                    spacing=0,
                     controls=[
-                        ft.Checkbox(
-                            value=task_data["completed"],
-                            label=task_data["title"],
-                            on_change=lambda e: on_toggle(task_data["id"]),
+                        ft.IconButton(
+                            icon=ft.Icons.CREATE_OUTLINED,
+                            tooltip="Edit task",
+                            on_click=lambda e: self.on_edit(self.task_id),
                         ),
-                        ft.Row(
-                            spacing=0,
-                            controls=[
-                                ft.IconButton(
-                                    icon=ft.Icons.CREATE_OUTLINED,
-                                    tooltip="Edit task",
-                                    on_click=lambda e: on_edit(task_data["id"]),
-                                ),
-                                ft.IconButton(
-                                    ft.Icons.DELETE_OUTLINE,
-                                    tooltip="Delete task",
-                                    on_click=lambda e: on_delete(task_data["id"]),
-                                ),
-                            ],
+                        ft.IconButton(
+                            ft.Icons.DELETE_OUTLINE,
+                            tooltip="Delete task",
+                            on_click=lambda e: self.on_delete(self.task_id),
                         ),
                     ],
-                )
-            ]
+                ),
+            ],
+        )
 
 
 def main(page: ft.Page):
@@ -92,13 +160,21 @@ def main(page: ft.Page):
     state = fa.get_state_manager(page)
 
     # Declare reactive atoms
-    state.atom("tasks", [])
+    # Tasks by id (dicts keep insertion order, so this is also the display
+    # order). They are mutated in place or replaced wholesale: compare by
+    # identity instead of walking every task on each write.
+    state.atom("tasks", {}, eq="identity")
+    # Ids of the tasks not completed yet, kept in step with "tasks" so the
+    # active filter and count do not scan every task
+    state.atom("active_ids", set(), eq="identity")
+    # Id of the task being edited, if any
+    state.atom("editing_id", None)
     state.atom("new_task", "")
     state.atom("filter", "all")
 
     # UI references
     input_ref = ft.Ref[ft.TextField]()
-    tasks_column_ref = ft.Ref[ft.Column]()
+    tasks_column_ref = ft.Ref[ft.ListView]()
     tabs_ref = ft.Ref[ft.Tabs]()
     active_count_ref = ft.Ref[ft.Text]()
 
@@ -108,79 +184,148 @@ def main(page: ft.Page):
         if not title:
             return
         tasks = state.get("tasks")
-        new_id = max([t["id"] for t in tasks], default=0) + 1
-        tasks.append(
-            {"id": new_id, "title": title, "completed": False, "editing": False}
-        )
-        state.set("tasks", tasks)
-        state.set("new_task", "")
+        new_id = max(tasks, default=0) + 1
+        tasks[new_id] = Task(new_id, title)
+        active_ids = state.get("active_ids")
+        active_ids.add(new_id)
+        # The tasks and the cleared input go out together
+        with state.batch():
+            state.set("tasks", tasks)
+            state.set("active_ids", active_ids)
+            state.set("new_task", "")
 
     def toggle_task(task_id: int):
         tasks = state.get("tasks")
-        for t in tasks:
-            if t["id"] == task_id:
-                t["completed"] = not t["completed"]
-        state.set("tasks", tasks)
+        active_ids = state.get("active_ids")
+        task = tasks[task_id]
+        task.completed = not task.completed
+        if task.completed:
+            active_ids.discard(task_id)
+        else:
+            active_ids.add(task_id)
+        with state.batch():
+            state.set("tasks", tasks)
+            state.set("active_ids", active_ids)
 
     def delete_task(task_id: int):
-        tasks = [t for t in state.get("tasks") if t["id"] != task_id]
-        state.set("tasks", tasks)
+        tasks = state.get("tasks")
+        active_ids = state.get("active_ids")
+        del tasks[task_id]
+        active_ids.discard(task_id)
+        with state.batch():
+            state.set("tasks", tasks)
+            state.set("active_ids", active_ids)
 
     def edit_task(task_id: int):
-        tasks = state.get("tasks")
-        for t in tasks:
-            t["editing"] = t["id"] == task_id
-        state.set("tasks", tasks)
+        # One write, however many tasks there are
+        state.set("editing_id", task_id)
 
     def save_task(task_id: int, new_title: str):
         tasks = state.get("tasks")
-        for t in tasks:
-            if t["id"] == task_id:
-                t["title"] = new_title
-            t["editing"] = False
-        state.set("tasks", tasks)
+        tasks[task_id].title = new_title
+        with state.batch():
+            state.set("tasks", tasks)
+            state.set("editing_id", None)
 
     def on_tab_change(e):
         tab_text = e.control.tabs[e.control.selected_index].text
         state.set("filter", tab_text)
 
+    # Task rows by id, reused across renders (keyed reconciliation)
+    task_items: dict[int, TaskItem] = {}
+
+    # Bumped on every write of "tasks": the tasks dict is mutated in place,
+    # so its identity alone cannot tell whether a cached result is stale
+    tasks_version = 0
+    # filter -> (tasks_version, filtered tasks)
+    filtered_cache: dict[str, tuple[int, list]] = {}
+    # (tasks_version, filter, editing_id) of the last render
+    last_render = None
+
+    def on_tasks_change(_=None):
+        nonlocal tasks_version
+        tasks_version += 1
+        render_tasks()
+
+    def filter_tasks(tasks: dict, current_filter: str) -> list:
+        """Tasks shown under current_filter, reused while tasks are unchanged."""
+        cached = filtered_cache.get(current_filter)
+        if cached is not None and cached[0] == tasks_version:
+            return cached[1]
+
+        active_ids = state.get("active_ids")
+        if current_filter == "active":
+            # Ids grow with each new task, so id order is display order
+            filtered = [tasks[i] for i in sorted(active_ids)]
+        elif current_filter == "completed":
+            filtered = [t for i, t in tasks.items() if i not in active_ids]
+        else:
+            filtered = list(tasks.values())
+
+        filtered_cache[current_filter] = (tasks_version, filtered)
+        return filtered
+
     def render_tasks(_=None):
         """
         Render the task list based on current filter.
 
+        Rows are reused by task id: a changed task patches its own row, and
+        the column is only re-sent when rows are added, removed or reordered.
+        A render for the same tasks, filter and edited task is skipped.
+
         Note: This uses control.update() because we're dynamically creating
         a list of controls. For simple value bindings, use state.bind() instead.
-        When replacing control.controls with a new list, you need to call
-        control.update() to refresh that specific control.
         """
+        nonlocal last_render
         tasks = state.get("tasks")
         current_filter = state.get("filter")
+        editing_id = state.get("editing_id")
 
-        if current_filter == "all":
-            filtered = tasks
-        elif current_filter == "active":
-            filtered = [t for t in tasks if not t["completed"]]
-        elif current_filter == "completed":
-            filtered = [t for t in tasks if t["completed"]]
-        else:
-            filtered = tasks
+        render_key = (tasks_version, current_filter, editing_id)
+        if render_key == last_render:
+            return
+        last_render = render_key
 
-        tasks_column_ref.current.controls = [
-            TaskItem(t, toggle_task, delete_task, edit_task, save_task)
-            for t in filtered
-        ]
-        # Update only this control (not page.update()) - required for dynamic control lists
-        tasks_column_ref.current.update()
+        filtered = filter_tasks(tasks, current_filter)
+
+        # Forget rows of deleted tasks
+        for task_id in [i for i in task_items if i not in tasks]:
+            del task_items[task_id]
+
+        rows = []
+        changed = []
+        for t in filtered:
+            item = task_items.get(t.id)
+            editing = t.id == editing_id
+            if item is None:
+                item = task_items[t.id] = TaskItem(
+                    t, toggle_task, delete_task, edit_task, save_task
+                )
+            elif item.sync(t, editing):
+                changed.append(item)
+            rows.append(item)
+
+        column = tasks_column_ref.current
+        current = column.controls
+        if len(current) != len(rows) or any(a is not b for a, b in zip(current, rows)):
+            # Membership or order changed: one column update sends it all
+            column.controls = rows
+            column.update()
+        else:
+            # Same rows: send only the ones that changed
+            for item in changed:
+                item.update()
 
     # Selector: count active tasks
     @state.selector("active_count")
     def count_active(get):
-        return len([t for t in get("tasks") if not t["completed"]])
+        return len(get("active_ids"))
 
     # Action: clear completed tasks
     @state.action
     async def clear_completed(get, set_value):
-        set_value("tasks", [t for t in get("tasks") if not t["completed"]])
+        tasks = get("tasks")
+        set_value("tasks", {i: tasks[i] for i in sorted(get("active_ids"))})
 
     # UI layout
     page.title = "ToDo App (Flet-ASP)"
@@ -196,7 +341,7 @@ def main(page: ft.Page):
                             ref=input_ref,
                             expand=True,
                             hint_text="What needs to be done?",
-                            on_change=lambda e: state.set("new_task", e.control.value),
+                            on_change=state.setter("new_task", delay=0.05),
                         ),
                         ft.FloatingActionButton(icon=ft.Icons.ADD, on_click=add_task),
                     ]
@@ -212,13 +357,15 @@ def main(page: ft.Page):
                     ],
                 ),
                 ft.Row([ft.Text("Active tasks:"), ft.Text(ref=active_count_ref)]),
-                ft.Column(ref=tasks_column_ref, spacing=5),
+                # A ListView only lays out the rows in view
+                ft.ListView(ref=tasks_column_ref, spacing=5, expand=True),
                 ft.OutlinedButton(
                     text="Clear completed",
                     on_click=lambda e: page.run_task(clear_completed),
                 ),
             ],
             width=600,
+            expand=True,
         )
     )
 
@@ -227,8 +374,9 @@ def main(page: ft.Page):
     state.bind("new_task", input_ref, prop="value")
 
     # Listeners
-    state.listen("tasks", render_tasks)
+    state.listen("tasks", on_tasks_change)
     state.listen("filter", render_tasks)
+    state.listen("editing_id", render_tasks)
 
 
 if __name__ == "__main__":
@@ -23,6 +23,8 @@ class Action:
         login_action = Action(login)
     """
 
+    __slots__ = ("handler",)
+
     def __init__(
         self,
         handler: Callable[[Callable[[str], Any], Callable[[str, Any], None], Any], Any],
@@ -1,7 +1,10 @@
+import operator
 import sys
+import threading
 import weakref
+from contextlib import contextmanager
 from flet import Control, Ref
-from typing import Any, Callable, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from flet_asp.utils import deep_equal
 
 # Python version detection for performance optimizations
@@ -19,6 +22,54 @@ if PYTHON_314_PLUS:
 else:
     _BIND_EXECUTOR = None
 
+# Named equality modes of Atom(eq=...)
+_EQUALITY: Dict[str, Callable[[Any, Any], bool]] = {
+    "deep": deep_equal,
+    "identity": operator.is_,
+}
+
+# Per-thread nesting depth of "the caller sends one page.update() afterwards"
+_deferred_updates = threading.local()
+
+
+@contextmanager
+def deferred_control_updates():
+    """
+    Within the block, bindings assign control properties but skip their own
+    `control.update()`: the caller promises a single `page.update()` after
+    the block, which sends every changed control in one message.
+    """
+    _deferred_updates.depth = getattr(_deferred_updates, "depth", 0) + 1
+    try:
+        yield
+    finally:
+        _deferred_updates.depth -= 1
+
+
+@contextmanager
+def collected_control_updates():
+    """
+    Within the block, bindings assign control properties and, instead of
+    calling `update()` on a mounted control, add it to the yielded dict
+    (used as an ordered set) so the caller can send them all with one
+    `page.update(*controls)`. Unmounted controls take the usual path.
+
+    Inside `deferred_control_updates()` or another collecting block nothing
+    is collected here: the enclosing caller already sends those controls.
+    """
+    if getattr(_deferred_updates, "depth", 0) or (
+        getattr(_deferred_updates, "collected", None) is not None
+    ):
+        yield {}
+        return
+
+    collected: Dict[Control, None] = {}
+    _deferred_updates.collected = collected
+    try:
+        yield collected
+    finally:
+        _deferred_updates.collected = None
+
 
 class Atom:
     """
@@ -44,9 +95,16 @@ class Atom:
 
     Attributes:
         _value (Any): The current state value.
-        _listeners (List[Callable]): Functions to call when value changes.
+        _listeners (Tuple[Callable, ...]): Functions to call when value changes.
+            Copy-on-write: registration rebuilds the tuple, so dispatch iterates
+            an immutable snapshot with no per-notification copy.
+        _listened (Set[Callable]): Callbacks added with `listen()`, for
+            constant-time duplicate checks.
         _pending_updates (List[Tuple]): Queue of updates for unmounted controls.
+        _bindings (Dict[Tuple[int, str], Callable]): `bind()` listeners keyed by
+            (id(ref), prop), for constant-time duplicate checks.
         key (str): Optional identifier for debug purposes.
+        _eq (Callable): Equality used to skip unchanged writes.
 
     Class Attributes:
         ENABLE_FREE_THREADING (bool): Enable parallel processing on Python 3.14+.
@@ -55,7 +113,20 @@ class Atom:
         RETRY_BASE_DELAY (float): Base delay for exponential backoff (seconds).
     """
 
-    # Configuration - Can be customized per application
+    # No per-instance __dict__: apps hold many small atoms per session
+    __slots__ = (
+        "_value",
+        "_listeners",
+        "_listened",
+        "_pending_updates",
+        "_bindings",
+        "key",
+        "_eq",
+        "_context",
+        "__weakref__",
+    )
+
+    # Configuration - Can be customized per application (on the class)
     if PYTHON_314_PLUS:
         ENABLE_FREE_THREADING = True  # Free-threading without GIL
         MAX_PARALLEL_BINDS = 4  # Real parallel processing
@@ -69,17 +140,32 @@ class Atom:
     MAX_RETRY_ATTEMPTS = 3  # Maximum retry attempts for unmounted controls
     RETRY_BASE_DELAY = 0.005  # 5ms base delay for exponential backoff
 
-    def __init__(self, value: Any, key: str = ""):
+    def __init__(
+        self,
+        value: Any,
+        key: str = "",
+        eq: str | Callable[[Any, Any], bool] = "deep",
+    ):
         """
         Initializes a new Atom with hybrid update support.
 
         Args:
             value (Any): Initial state value.
             key (str, optional): Debug identifier for this atom.
+            eq (str | Callable, optional): How a write is compared with the
+                current value to decide whether it is a change: "deep"
+                (`deep_equal`, default), "identity" (only the same object is
+                unchanged; skips the deep walk for large collections), or a
+                function `(old, new) -> bool`.
         """
         self._value: Any = value
-        self._listeners: List[Callable[[Any], None]] = []
+        self._eq: Callable[[Any, Any], bool] = (
+            _EQUALITY[eq] if isinstance(eq, str) else eq
+        )
+        self._listeners: Tuple[Callable[[Any], None], ...] = ()
+        self._listened: Set[Callable[[Any], None]] = set()
         self._pending_updates: List[Tuple[int, weakref.ref, str, Any]] = []
+        self._bindings: Dict[Tuple[int, str], Callable[[Any], None]] = {}
         self.key: str = key
 
         # Python 3.14: Context variables for thread-safety
@@ -101,18 +187,39 @@ class Atom:
         """
         return self._value
 
-    def _set_value(self, value: Any) -> None:
+    def _set_value(self, value: Any, force: bool = False) -> bool:
         """
         Updates the atom value and notifies listeners if it changed.
 
+        Writing a value equal to the current one is a no-op. Setting the very
+        same dict, list or set again still notifies, since it may have been
+        mutated in place. An atom without listeners just stores the value.
+
         NOTE: This should only be called by StateManager.
 
         Args:
             value (Any): New value.
+            force (bool): Notify even if the value is unchanged.
+
+        Returns:
+            bool: Whether listeners were notified.
         """
-        if isinstance(value, (dict, list)) or not deep_equal(self._value, value):
+        if not self._listeners:
+            # Nobody to notify (e.g. an input only read on submit): whether
+            # the value changed does not matter, so skip the comparison
             self._value = value
-            self._notify_listeners()
+            return False
+
+        if not force:
+            if value is self._value:
+                if not isinstance(value, (dict, list, set)):
+                    return False
+            elif self._eq(self._value, value):
+                return False
+
+        self._value = value
+        self._notify_listeners()
+        return True
 
     def _notify_listeners(self) -> None:
         """
@@ -121,8 +228,12 @@ class Atom:
         Listeners may trigger control updates, which are handled by the hybrid
         update strategy (_safe_update).
         """
+        # Bind the value once: hot atoms can have hundreds of listeners.
+        # The tuple is a snapshot: listeners added or removed by a callback
+        # take effect from the next notification
+        value = self._value
         for callback in self._listeners:
-            callback(self._value)
+            callback(value)
 
     def listen(self, callback: Callable[[Any], None], immediate: bool = True) -> None:
         """
@@ -132,10 +243,19 @@ class Atom:
             callback (Callable[[Any], None]): The function to call with the new value.
             immediate (bool): If True, call immediately with current value.
         """
-        if callback not in self._listeners:
-            self._listeners.append(callback)
-            if immediate:
-                callback(self._value)
+        # Constant-time duplicate check; an unhashable callable falls back
+        # to scanning the listeners
+        try:
+            if callback in self._listened:
+                return
+            self._listened.add(callback)
+        except TypeError:
+            if callback in self._listeners:
+                return
+
+        self._listeners += (callback,)
+        if immediate:
+            callback(self._value)
 
     def unlisten(self, callback: Callable[[Any], None]):
         """
@@ -144,7 +264,26 @@ class Atom:
         Args:
             callback (Callable[[Any], None]): Listener to remove.
         """
-        self._listeners = [cb for cb in self._listeners if cb != callback]
+        self._listeners = tuple(cb for cb in self._listeners if cb != callback)
+        try:
+            self._listened.discard(callback)
+        except TypeError:
+            pass
+
+        for binding_key, listener in list(self._bindings.items()):
+            if listener == callback:
+                del self._bindings[binding_key]
+
+    def _remove_binding(self, binding_key: Tuple[int, str]) -> None:
+        """
+        Removes the `bind()` listener registered under a (id(ref), prop) key.
+
+        Args:
+            binding_key (Tuple[int, str]): Key of the binding to drop.
+        """
+        listener = self._bindings.pop(binding_key, None)
+        if listener is not None:
+            self._listeners = tuple(cb for cb in self._listeners if cb is not listener)
 
     def _safe_update(
         self,
@@ -179,10 +318,16 @@ class Atom:
         # STEP 1: Lazy update - always set property (never fails)
         setattr(target, prop, value)
 
-        if not update:
+        # A batch flush sends one page.update() for every bound control
+        if not update or getattr(_deferred_updates, "depth", 0):
             return
 
-        # STEP 2: Try immediate update
+        # STEP 2: Try immediate update - or, while a write fans out to several
+        # bindings, leave a mounted control for the caller's single update
+        collected = getattr(_deferred_updates, "collected", None)
+        if collected is not None and getattr(target, "page", None):
+            collected[target] = None
+            return
         if Atom._try_update_immediate(target):
             return  # Success! (99% of cases)
 
@@ -410,7 +555,14 @@ class Atom:
 
         self._pending_updates = remaining
 
-    def bind(self, control: Ref, prop: str = "value", update: bool = True) -> None:
+    def bind(
+        self,
+        control: Ref,
+        prop: str = "value",
+        update: bool = True,
+        weak: bool = False,
+        transform: Optional[Callable[[Any], Any]] = None,
+    ) -> None:
         """
         Binds the atom to a UI control (Ref) with hybrid update strategy.
 
@@ -429,33 +581,66 @@ class Atom:
             - Incremental GC (10x smaller pauses)
             - 3-5% faster overall
 
+        A Ref can be bound once per property; repeated calls are ignored.
+
         Args:
             control (Ref): A Flet Ref to the UI component.
             prop (str): The property to update (e.g., "value", "text").
             update (bool): Whether to call `update()` after setting the property.
+            weak (bool): Hold the Ref weakly and drop the binding once the Ref is
+                garbage collected. Flet controls do not keep their Ref alive,
+                so only use this when the Ref is owned by a longer-lived object
+                (e.g. a component that creates and discards many controls).
+            transform (Callable, optional): Maps the value before it is assigned,
+                for one-line projections that do not need their own selector.
 
         Example:
             >>> count_ref = ft.Ref[ft.Text]()
             >>> state.atom("count", 0)
             >>> state.bind("count", count_ref)
             >>> page.add(ft.Text(ref=count_ref))  # Works even if added after bind!
+            >>> state.bind("count", count_ref, "color",
+            ...            transform=lambda n: "red" if n < 0 else None)
         """
 
-        def listener(value):
-            target = control.current
-            if target is None:
-                return
+        # Prevent duplicate bindings
+        binding_key = (id(control), prop)
+        if binding_key in self._bindings:
+            return
 
-            # Use hybrid update strategy
-            self._safe_update(target, prop, value, update)
+        # Hot path: one closure call per notification. A strong binding reads
+        # the Ref directly; only a weak one pays for dereferencing
+        safe_update = self._safe_update
+        if weak:
+            resolve = weakref.ref(control, lambda _: self._remove_binding(binding_key))
 
-        # Prevent duplicate bindings
-        for existing_listener in self._listeners:
-            if getattr(existing_listener, "__ref__", None) is control:
-                return
+            def listener(value):
+                ref = resolve()
+                target = ref.current if ref is not None else None
+                if target is None:
+                    return
+
+                if transform is not None:
+                    value = transform(value)
+
+                # Use hybrid update strategy
+                safe_update(target, prop, value, update)
+
+        else:
+
+            def listener(value):
+                target = control.current
+                if target is None:
+                    return
+
+                if transform is not None:
+                    value = transform(value)
+
+                # Use hybrid update strategy
+                safe_update(target, prop, value, update)
 
-        listener.__ref__ = control
-        self._listeners.append(listener)
+        self._bindings[binding_key] = listener
+        self._listeners += (listener,)
 
         # Always apply current value immediately
         listener(self._value)
@@ -471,6 +656,9 @@ class Atom:
 
         Strategy: Same as bind() - uses hybrid update approach.
 
+        A Control is held weakly: its binding is dropped once the control is
+        garbage collected. Each (control, prop) pair is bound at most once.
+
         Args:
             control (Control | Ref): Control or Ref instance.
             prop (str): UI property to update.
@@ -485,57 +673,51 @@ class Atom:
             >>> text_control = ft.Text()
             >>> state.bind_dynamic("message", text_control)
         """
-        is_ref = hasattr(control, "current")
-        target = control.current if is_ref else control
+        # Prevent duplicate bindings (same key scheme as bind())
+        binding_key = (id(control), prop)
+        if binding_key in self._bindings:
+            return
+
+        if hasattr(control, "current"):
+
+            def resolve():
+                return control.current
+
+        else:
+            # Hold the control weakly: once it is destroyed the binding
+            # removes itself instead of keeping the control alive
+            resolve = weakref.ref(control, lambda _: self._remove_binding(binding_key))
 
         def listener(value):
-            actual_target = control.current if is_ref else control
+            actual_target = resolve()
             if actual_target is None:
                 return
 
             # Use hybrid update strategy
             self._safe_update(actual_target, prop, value, update)
 
-        # Prevent duplicate bindings
-        for existing_listener in self._listeners:
-            if is_ref:
-                if getattr(existing_listener, "__ref__", None) is getattr(
-                    target, "ref", None
-                ):
-                    return
-            else:
-                if getattr(existing_listener, "__control_id__", None) == id(target):
-                    return
-
-        if is_ref:
-            listener.__ref__ = target
-        else:
-            listener.__control_id__ = id(target)
-
-        self._listeners.append(listener)
+        self._bindings[binding_key] = listener
+        self._listeners += (listener,)
 
         # Always apply current value immediately
         listener(self._value)
 
     def unbind(self, target: Control | Ref) -> None:
         """
-        Removes the listener bound to a specific control or Ref.
+        Removes the listeners bound to a specific control or Ref.
 
         Args:
             target (Control | Ref): UI component or Ref to unbind.
         """
-        if isinstance(target, Ref):
-            self._listeners = [
-                listener
-                for listener in self._listeners
-                if getattr(listener, "__ref__", None) is not target
-            ]
-        elif isinstance(target, Control):
-            self._listeners = [
-                listener
-                for listener in self._listeners
-                if getattr(listener, "__control_id__", None) != id(target)
-            ]
+        target_id = id(target)
+        bound = [
+            self._bindings.pop(binding_key)
+            for binding_key in [k for k in self._bindings if k[0] == target_id]
+        ]
+        if bound:
+            self._listeners = tuple(
+                listener for listener in self._listeners if listener not in bound
+            )
 
     def bind_two_way(
         self,
@@ -543,6 +725,7 @@ class Atom:
         prop: str = "value",
         update: bool = True,
         on_input_change: Optional[Callable] = None,
+        write: Optional[Callable[[Any], None]] = None,
     ) -> None:
         """
         Creates a two-way binding between the atom and an input control.
@@ -551,6 +734,8 @@ class Atom:
         vice versa (UI → atom). Commonly used for form inputs like TextField.
 
         Strategy: Uses hybrid update approach for atom → UI direction.
+        Writes coming from the control itself are not echoed back to it (the
+        control already shows the typed value); other listeners still run.
 
         Args:
             control (Ref): Ref of the UI input control.
@@ -558,6 +743,9 @@ class Atom:
             update (bool): Whether to update the control visually.
             on_input_change (Optional[Callable]): Custom change handler.
                 If None, uses default handler that updates the atom.
+            write (Optional[Callable]): Receives the control's value on each
+                change (e.g. `StateManager.set_debounced`). Default: sets the
+                atom right away.
 
         Example:
             >>> email_ref = ft.Ref[ft.TextField]()
@@ -569,20 +757,21 @@ class Atom:
 
         def listener(value):
             target = control.current
-            if target is None:
+            # A value typed into the control is already shown there
+            if target is None or getattr(target, prop, None) == value:
                 return
 
             # Use hybrid update strategy
             self._safe_update(target, prop, value, update)
 
-        listener.__control_id__ = id(control)
         # Always apply current value immediately (immediate=True)
         self.listen(listener, immediate=True)
 
         # Input → state direction
+        write_value = write or self._set_value
+
         def on_change(e):
-            new_value = getattr(control.current, prop)
-            self._set_value(new_value)
+            write_value(getattr(control.current, prop))
 
         def setup_on_change():
             """Setup the on_change handler - handles both common and uncommon cases"""
@@ -613,7 +802,6 @@ class Atom:
         # Try to setup immediately (common case)
         if not setup_on_change():
             # Uncommon case: control not ready, use polling
-            import threading
             import time
 
             def poll_and_setup():
@@ -631,7 +819,9 @@ class Atom:
 
         Also clears any pending updates in the queue.
         """
-        self._listeners.clear()
+        self._listeners = ()
+        self._listened.clear()
+        self._bindings.clear()
         self._pending_updates.clear()
 
     def has_listeners(self) -> bool:
@@ -1,9 +1,88 @@
 import asyncio
 import copy
+import io
+import logging
+import operator
+import pickle
 import threading
-from typing import Any, Callable
+from contextlib import contextmanager
+from typing import Any, Callable, Optional
 from flet_asp.atom import Atom
-from flet_asp.utils import deep_equal
+from flet_asp.utils import _SCALAR_TYPES, deep_equal
+
+logger = logging.getLogger(__name__)
+
+# Results copied before they are cached, so later mutation cannot reach them
+_MUTABLE_TYPES = (dict, list, set, bytearray)
+
+
+class _NotPlainData(Exception):
+    """Raised by `_PlainDataPickler` on anything but plain data."""
+
+
+class _PlainDataPickler(pickle.Pickler):
+    """
+    A pickler that only accepts plain data.
+
+    The C pickler serializes exact str, int, float, bytes, bool, None, dict,
+    list, tuple, set and frozenset instances itself; every other object goes
+    through `reducer_override()`, which rejects it.
+    """
+
+    def reducer_override(self, obj):
+        raise _NotPlainData
+
+
+# Per-thread nesting depth of "recompute selectors after these writes", and
+# the selectors marked dirty meanwhile (a dict used as an ordered set)
+_held_selectors = threading.local()
+
+
+@contextmanager
+def deferred_selector_updates():
+    """
+    Within the block, a selector whose dependencies change is only marked
+    dirty. Each dirty selector recomputes once when the outermost block
+    exits - or earlier, if its value is read - instead of once per changed
+    dependency, and never sees a half-applied set of writes.
+    """
+    depth = getattr(_held_selectors, "depth", 0)
+    if not depth:
+        _held_selectors.pending = {}
+    _held_selectors.depth = depth + 1
+    try:
+        yield
+    finally:
+        _held_selectors.depth = depth
+        if not depth:
+            pending = _held_selectors.pending
+            _held_selectors.pending = {}
+            for selector in pending:
+                if selector._dirty:
+                    selector._refresh()
+
+
+def _detach(value: Any) -> Any:
+    """
+    Returns `value` as the selector should cache it.
+
+    Mutable containers are copied: shallowly when they only hold scalars
+    (one C-level pass), with a pickle round-trip when they nest plain data,
+    and with `copy.deepcopy()` otherwise. Anything else is returned as is.
+    """
+    if not isinstance(value, _MUTABLE_TYPES):
+        return value
+
+    items = value.values() if isinstance(value, dict) else value
+    if _SCALAR_TYPES.issuperset(map(type, items)):
+        return copy.copy(value)
+
+    buffer = io.BytesIO()
+    try:
+        _PlainDataPickler(buffer, pickle.HIGHEST_PROTOCOL).dump(value)
+    except _NotPlainData:
+        return copy.deepcopy(value)
+    return pickle.loads(buffer.getbuffer())
 
 
 class Selector(Atom):
@@ -20,10 +99,27 @@ class Selector(Atom):
         state.add_selector("user_email", lambda get: get("user")["email"])
     """
 
+    __slots__ = (
+        "_select_fn",
+        "_get_atom",
+        "_is_updating",
+        "_dependencies",
+        "_update_lock",
+        "_update_depth",
+        "_dep_keys",
+        "_dep_atoms",
+        "_cached_args",
+        "_dirty",
+        "_snapshot",
+        "_getter",
+        "_is_async",
+    )
+
     def __init__(
         self,
         select_fn: Callable[[Callable[[str], Any]], Any],
         resolve_atom: Callable[[str], Atom],
+        thread_safe: bool = False,
     ):
         """
         Initializes the Selector.
@@ -31,20 +127,35 @@ class Selector(Atom):
         Args:
             select_fn (Callable): A function that receives `get(key)` and returns the derived value.
             resolve_atom (Callable): A function that resolves atom instances by key.
+            thread_safe (bool): Guard recomputation with a lock instead of a plain
+                flag, for dependencies written from several threads.
         """
 
         super().__init__(None)
         self._select_fn = select_fn
         self._get_atom = resolve_atom
-        self._is_updating = False
-        self._dependencies: set[str] = set()
-        self._update_lock = threading.Lock()  # Protect against race conditions
+        self._is_updating = False  # Re-entry guard when not thread-safe
+        self._dependencies: frozenset[str] = frozenset()
+        # Protect against race conditions, only when asked to
+        self._update_lock = threading.Lock() if thread_safe else None
         self._update_depth = (
             0  # Track recursion depth for circular dependency detection
         )
-        # Memoization cache: stores snapshot of dependency values
-        # Used to skip recomputation when dependency values haven't changed
-        self._cached_deps: dict[str, Any] = {}
+        # Memoization (reselect-style): dependency keys and atoms in read order,
+        # resolved once, and the tuple of their values at the last computation.
+        # A change is skipped when the new argument tuple equals the cached one
+        self._dep_keys: tuple = ()
+        self._dep_atoms: tuple = ()
+        self._cached_args: Optional[tuple] = None
+        # Set while a recomputation is held by deferred_selector_updates()
+        self._dirty = False
+        # Getter handed to select_fn on recomputation, bound once: reads the
+        # latest dependency snapshot, other keys from their atoms
+        self._snapshot: dict[str, Any] = {}
+        self._getter = self._read
+        # Whether select_fn returns awaitables, known from its definition or
+        # its first result, so sync selectors never inspect their results
+        self._is_async = asyncio.iscoroutinefunction(select_fn)
         self._setup_dependencies()
 
     def __repr__(self):
@@ -62,36 +173,56 @@ class Selector(Atom):
         dependency tracking happens during async execution.
         """
         # Check if selector function is async
-        if asyncio.iscoroutinefunction(self._select_fn):
+        if self._is_async:
             # For async selectors, set initial value to None
             self._value = None
             # Run the initial async computation with dependency tracking
             self._schedule_async_with_tracking()
         else:
             # Sync selector - track dependencies during initial call
+            tracked: dict[str, Any] = {}
+
             def getter(key: str):
-                self._dependencies.add(key)
                 value = self._get_atom(key).value
                 # Cache initial dependency values for memoization
-                self._cached_deps[key] = value
+                tracked.setdefault(key, value)
                 return value
 
             # Initial value computation
-            self._value = self._select_fn(getter)
+            result = self._select_fn(getter)
+            self._track_dependencies(tracked)
+
+            if asyncio.iscoroutine(result):
+                # A plain function returning a coroutine: async from now on
+                self._is_async = True
+                self._value = None
+                self._schedule_async(result)
+            else:
+                self._value = _detach(result)
 
             # Register listeners for each dependency
             self._register_dependency_listeners()
 
+    def _track_dependencies(self, tracked: dict[str, Any]):
+        """
+        Stores the dependencies read by a computation and their values.
+
+        Args:
+            tracked (dict): Dependency key → value, in read order.
+        """
+        self._dependencies = frozenset(tracked)
+        self._dep_keys = tuple(tracked)
+        self._dep_atoms = tuple(self._get_atom(key) for key in tracked)
+        self._cached_args = tuple(tracked.values())
+
     def _register_dependency_listeners(self):
         """
         Registers listeners for all tracked dependencies.
         Called after dependencies are known (sync or async).
         """
-        for key in self._dependencies:
-            atom = self._get_atom(key)
-            # Check if listener already registered to avoid duplicates
-            if not any(cb == self._on_dependency_change for cb in atom._listeners):
-                atom.listen(self._on_dependency_change, immediate=False)
+        for atom in self._dep_atoms:
+            # Atom.listen() skips the listener if it is already registered
+            atom.listen(self._on_dependency_change, immediate=False)
 
     def _schedule_async_with_tracking(self):
         """
@@ -99,32 +230,29 @@ class Selector(Atom):
         This is used for async selectors where dependencies are tracked during execution.
         """
         # Create a tracking getter for the async call
-        tracked_deps: set[str] = set()
-        cached_values: dict[str, Any] = {}
+        tracked: dict[str, Any] = {}
 
         def tracking_getter(key: str):
-            tracked_deps.add(key)
             value = self._get_atom(key).value
-            cached_values[key] = value
+            tracked.setdefault(key, value)
             return value
 
         async def run_with_tracking():
             try:
                 result = await self._select_fn(tracking_getter)
                 # Update dependencies and cache after successful execution
-                self._dependencies = tracked_deps
-                self._cached_deps = cached_values
+                self._track_dependencies(tracked)
                 # Register listeners now that we know the dependencies
                 self._register_dependency_listeners()
                 # Set the value (this will notify listeners)
                 self._set_value(result)
-            except Exception as e:
-                print(f"[Selector async error]: {e}")
+            except Exception:
+                logger.exception("Async selector failed")
 
         # Schedule the coroutine
         try:
             loop = asyncio.get_running_loop()
-            asyncio.ensure_future(run_with_tracking(), loop=loop)
+            loop.create_task(run_with_tracking())
         except RuntimeError:
             # No running event loop - run in a separate thread
             def run_in_thread():
@@ -148,7 +276,7 @@ class Selector(Atom):
         try:
             loop = asyncio.get_running_loop()
             # If we have a running loop, create a task
-            asyncio.ensure_future(self._handle_async(coro), loop=loop)
+            loop.create_task(self._handle_async(coro))
         except RuntimeError:
             # No running event loop - run in a separate thread
             def run_in_thread():
@@ -159,19 +287,37 @@ class Selector(Atom):
 
     def _on_dependency_change(self, _):
         """
-        Called when any dependency changes. Re-evaluates the selector.
+        Called when any dependency changes. Re-evaluates the selector, or
+        marks it dirty while recomputation is held (e.g. in a batch flush).
+        """
+        if getattr(_held_selectors, "depth", 0):
+            self._dirty = True
+            _held_selectors.pending[self] = None
+            return
+
+        self._refresh()
+
+    def _refresh(self):
+        """
+        Re-evaluates the selector.
 
         Handles both sync and async results with protection against:
-        - Race conditions (via threading.Lock)
+        - Race conditions (via threading.Lock, when thread-safe)
         - Circular dependencies (via recursion depth tracking)
         - Re-entry during async operations
         - Unnecessary recomputation (via memoization)
         """
-        # Try to acquire lock (non-blocking)
-        # If already locked, another update is in progress, skip this one
-        if not self._update_lock.acquire(blocking=False):
+        # Try to acquire lock (non-blocking), or the flag on a single thread
+        # If already held, another update is in progress, skip this one
+        lock = self._update_lock
+        if lock is None:
+            if self._is_updating:
+                return
+            self._is_updating = True
+        elif not lock.acquire(blocking=False):
             return
 
+        self._dirty = False
         try:
             # Check recursion depth to prevent circular dependencies
             self._update_depth += 1
@@ -185,41 +331,58 @@ class Selector(Atom):
                     f"This usually means selector A depends on selector B which depends on A."
                 )
 
-            # Memoization: Check if any dependency values actually changed
-            deps_changed = False
-            new_dep_values: dict[str, Any] = {}
-
-            for key in self._dependencies:
-                new_value = self._get_atom(key).value
-                new_dep_values[key] = new_value
-
-                # Compare with cached value
-                if key not in self._cached_deps or not deep_equal(
-                    new_value, self._cached_deps[key]
-                ):
-                    deps_changed = True
+            # Memoization: one tuple of the dependency values, compared with
+            # the previous one - by identity first, deeply only if that fails
+            args = tuple([atom.value for atom in self._dep_atoms])
+            cached = self._cached_args
 
             # Skip recomputation if no dependency values changed
-            # This provides 5-20x speedup for expensive selector functions
-            if not deps_changed:
+            # This provides 5-20x speedup for expensive selector functions.
+            # The very same dict, list or set never counts as unchanged: like
+            # Atom._set_value, assume it was mutated in place.
+            if (
+                cached is not None
+                and not any(
+                    arg is old and isinstance(arg, (dict, list, set))
+                    for arg, old in zip(args, cached)
+                )
+                and (all(map(operator.is_, args, cached)) or deep_equal(args, cached))
+            ):
                 return
 
             # Update cache with new values
-            self._cached_deps = new_dep_values
+            self._cached_args = args
 
-            def getter(key: str):
-                return self._get_atom(key).value
-
-            result = self._select_fn(getter)
+            # Serve known dependencies from the snapshot just taken
+            self._snapshot = dict(zip(self._dep_keys, args))
+            result = self._select_fn(self._getter)
 
-            if asyncio.iscoroutine(result):
+            if self._is_async and asyncio.iscoroutine(result):
                 self._schedule_async(result)
             else:
                 self._set_value(result)
 
         finally:
             self._update_depth -= 1
-            self._update_lock.release()
+            if lock is None:
+                self._is_updating = False
+            else:
+                lock.release()
+
+    def _read(self, key: str) -> Any:
+        """
+        Returns a dependency value for `select_fn`.
+
+        Args:
+            key (str): Atom or selector key.
+
+        Returns:
+            Any: The value from the last snapshot, or the atom's current value.
+        """
+        snapshot = self._snapshot
+        if key in snapshot:
+            return snapshot[key]
+        return self._get_atom(key).value
 
     def recompute(self):
         """
@@ -227,8 +390,8 @@ class Selector(Atom):
         Useful when dependencies are dynamic or changed indirectly.
         """
         # Clear cache to force recomputation
-        self._cached_deps.clear()
-        self._on_dependency_change(None)
+        self._cached_args = None
+        self._refresh()
 
     async def _handle_async(self, coro):
         """
@@ -240,30 +403,26 @@ class Selector(Atom):
         try:
             result = await coro
             self._set_value(result)
-        except Exception as e:
-            print(f"[Selector async error]: {e}")
+        except Exception:
+            logger.exception("Async selector failed")
 
     def _set_value(self, new_value: Any):
         """
         Updates the internal value if it differs from the current one.
 
-        Only performs deep copy for mutable types to prevent external mutations.
-        Immutable types (str, int, float, tuple, etc.) are assigned directly
-        for better performance.
+        Only copies mutable types to prevent external mutations (see
+        `_detach()`). Immutable types (str, int, float, tuple, etc.) are
+        assigned directly for better performance.
 
         Args:
             new_value (Any): New computed result.
         """
 
         if not deep_equal(new_value, self._value):
-            # Only deep copy mutable container types
-            # This optimization improves performance by 5-10x for immutable types
-            if isinstance(new_value, (dict, list, set)):
-                self._value = copy.deepcopy(new_value)
-            else:
-                # Immutable types or objects - safe to assign directly
-                # Includes: str, int, float, bool, None, tuple, frozenset, custom immutable objects
-                self._value = new_value
+            # Only mutable container types are copied, and a container of
+            # scalars only shallowly; str, int, tuple, frozenset, custom
+            # immutable objects etc. are assigned directly
+            self._value = _detach(new_value)
             self._notify_listeners()
 
     @property
@@ -275,4 +434,7 @@ class Selector(Atom):
             Any: Computed value.
         """
 
+        if self._dirty:
+            # A held recomputation is pulled forward by the first read
+            self._refresh()
         return self._value
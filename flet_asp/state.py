@@ -1,11 +1,43 @@
+import copy
+import sys
+import threading
+import time
+from contextlib import contextmanager
 from flet import Page, Control
-from typing import Any, Callable, Dict, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+    Tuple,
+)
 from flet.core.ref import Ref
-from flet_asp.atom import Atom
-from flet_asp.selector import Selector
+from flet_asp.atom import Atom, collected_control_updates, deferred_control_updates
+from flet_asp.selector import Selector, deferred_selector_updates
 from flet_asp.action import Action
 
 
+def _intern_key(key: Hashable) -> Hashable:
+    """
+    Interns a string key before it is stored in a registry.
+
+    Lookups with a literal key (interned by the compiler) then match the
+    stored key by identity, even when it was built at runtime (e.g. with an
+    f-string). Family keys (tuples) are returned as is.
+
+    Args:
+        key (Hashable): State key.
+
+    Returns:
+        Hashable: The interned key.
+    """
+    return sys.intern(key) if type(key) is str else key
+
+
 class StateManager:
     """
     A reactive global state manager following the Atom/Selector pattern (Flet-ASP).
@@ -22,12 +54,35 @@ class StateManager:
         _atoms (Dict[str, Atom]): All registered atom states.
         _selectors (Dict[str, Selector]): All registered computed selectors.
         _page (Optional[Page]): Reference to the Flet page (if provided).
+        _thread_safe (bool): Whether selectors guard recomputation with a lock.
+        _batch_depth (int): Nesting level of active `batch()` blocks.
+        _pending_writes (Dict[str, Any]): Atom writes buffered during a batch.
+        _forced_writes (Set[str]): Buffered keys written with `force=True`.
+        _atom_families (Dict[str, Any]): Default value per atom family.
+        _selector_families (Dict[str, Callable]): Select function per selector family.
+        _debounced_writes (Dict[str, Any]): Latest value per `set_debounced()` /
+            `set_throttled()` key, until its timer writes it.
+        _throttle_times (Dict[str, float]): Monotonic time of the last throttled
+            write per key.
+        _debounce_timers (Dict[str, threading.Timer]): Open debounce window per key.
+        _setters (Dict[Tuple[str, float], Callable]): Cached `setter()` handlers.
     """
 
-    def __init__(self, page: Optional[Page] = None):
+    def __init__(self, page: Optional[Page] = None, thread_safe: bool = False):
         self._atoms: Dict[str, Atom] = {}
         self._selectors: Dict[str, Selector] = {}
         self._page: Optional[Page] = page
+        self._thread_safe: bool = thread_safe
+        self._batch_depth: int = 0
+        self._pending_writes: Dict[str, Any] = {}
+        self._forced_writes: Set[str] = set()
+        self._atom_families: Dict[str, Any] = {}
+        self._selector_families: Dict[str, Callable] = {}
+        self._debounced_writes: Dict[str, Any] = {}
+        self._debounce_timers: Dict[str, threading.Timer] = {}
+        self._debounce_lock = threading.Lock()
+        self._throttle_times: Dict[str, float] = {}
+        self._setters: Dict[Tuple[str, float], Callable] = {}
 
         # Hook page.update() to flush pending updates automatically
         if page:
@@ -66,31 +121,81 @@ class StateManager:
         # Replace page.update with wrapped version
         page.update = wrapped_update
 
-    def atom(self, key: str, default: Optional[Any] = None) -> Atom:
+    def atom(
+        self,
+        key: str,
+        default: Optional[Any] = None,
+        eq: str | Callable[[Any, Any], bool] = "deep",
+    ) -> Atom:
         """
         Returns the Atom for a given key, or creates it with an optional default value.
 
         Args:
             key (str): Unique key for the atom.
             default (Any, optional): Initial value.
+            eq (str | Callable, optional): Change detection used when the atom
+                is created: "deep" (default), "identity" or `(old, new) -> bool`
+                (see `Atom`).
 
         Returns:
             Atom: The corresponding atom instance.
+
+        Example:
+            >>> # Large list, replaced or mutated in place: skip the deep walk
+            >>> state.atom("tasks", [], eq="identity")
         """
 
-        if key in self._selectors:
-            raise ValueError(f"Key '{key}' is already registered as a Selector.")
+        # A key lives in one registry only, so an existing atom needs no
+        # selector check
+        atom = self._atoms.get(key)
+        if atom is None and self._is_family_key(key):
+            # A family member used before family(): create it from its family
+            self.family(*key)
+            atom = self._atoms.get(key)
+        if atom is None:
+            if key in self._selectors:
+                raise ValueError(f"Key '{key}' is already registered as a Selector.")
+            key = _intern_key(key)
+            atom = self._atoms[key] = Atom(default, key=key, eq=eq)
+
+        return atom
+
+    def atoms(self, mapping: Dict[str, Any]) -> Dict[str, Atom]:
+        """
+        Returns or creates several Atoms in one pass.
 
-        if key not in self._atoms:
-            self._atoms[key] = Atom(default, key=key)
+        Same semantics as calling `atom(key, default)` for each item: existing
+        atoms keep their current value.
 
-        return self._atoms[key]
+        Args:
+            mapping (Dict[str, Any]): Map of key → default value.
+
+        Returns:
+            Dict[str, Atom]: The corresponding atom instances, by key.
+
+        Raises:
+            ValueError: If a key is already registered as a Selector.
+        """
+
+        atoms = self._atoms
+
+        for key in mapping:
+            if key in self._selectors:
+                raise ValueError(f"Key '{key}' is already registered as a Selector.")
+
+        for key, default in mapping.items():
+            if key not in atoms:
+                key = _intern_key(key)
+                atoms[key] = Atom(default, key=key)
+
+        return {key: atoms[key] for key in mapping}
 
     def _resolve_atom_or_selector(self, key: str) -> Atom:
         """
         Internal method to resolve both atoms and selectors.
 
         This allows selectors to depend on other selectors, not just atoms.
+        A family member key is created through its family on first use.
 
         Args:
             key (str): The key to resolve.
@@ -98,10 +203,108 @@ class StateManager:
         Returns:
             Atom: The atom or selector (which inherits from Atom).
         """
-        if key in self._selectors:
-            return self._selectors[key]
+        selector = self._selectors.get(key)
+        if selector is not None:
+            return selector
+        if key not in self._atoms and self._is_family_key(key):
+            # First use of a family member before family() was called
+            return self._resolve_atom_or_selector(self.family(*key))
         return self.atom(key)
 
+    def atom_family(self, name: str, default: Optional[Any] = None) -> None:
+        """
+        Registers a family of atoms that share a default value.
+
+        Members are created on demand by `family(name, member_id)` and keyed
+        by the `(name, member_id)` tuple, so many components can share one
+        definition instead of each registering its own prefixed keys.
+
+        Args:
+            name (str): Family name.
+            default (Any, optional): Initial value of every member; each
+                member gets its own shallow copy, so a mutable default (e.g.
+                a list) is not shared between members.
+
+        Example:
+            >>> state.atom_family("hover", False)
+            >>> state.set(state.family("hover", button_id), True)
+        """
+
+        self._atom_families.setdefault(name, default)
+
+    def selector_family(
+        self, name: str, select_fn: Callable[[Callable[[Any], Any], Any], Any]
+    ) -> None:
+        """
+        Registers a family of selectors that share one select function.
+
+        Args:
+            name (str): Family name.
+            select_fn (Callable): `select_fn(get, member_id)` deriving the value
+                of one member.
+
+        Example:
+            >>> state.selector_family(
+            ...     "active", lambda get, bid: get(("hover", bid)) or get(("busy", bid))
+            ... )
+            >>> state.bind(state.family("active", bid), icon_ref, "disabled")
+        """
+
+        self._selector_families.setdefault(name, select_fn)
+
+    def _is_family(self, name: Any) -> bool:
+        """Returns True if `name` is a registered atom or selector family."""
+        return name in self._selector_families or name in self._atom_families
+
+    def _is_family_key(self, key: Any) -> bool:
+        """
+        Returns True if `key` is a `(name, member_id)` key of a registered family.
+
+        Raises:
+            KeyError: If `key` is a tuple starting with a family name but is
+                not a `(name, member_id)` pair.
+        """
+        if type(key) is not tuple or not key or not self._is_family(key[0]):
+            return False
+        if len(key) != 2:
+            raise KeyError(
+                f"Key {key!r} starts with family '{key[0]}' but is not a "
+                f"(name, member_id) pair."
+            )
+        return True
+
+    def family(self, name: str, member_id: Hashable) -> Tuple[str, Hashable]:
+        """
+        Returns the state key of a family member, creating the member if needed.
+
+        The key works with every other method (`get`, `set`, `bind`, `listen`...).
+
+        Args:
+            name (str): Family name registered with `atom_family()` or
+                `selector_family()`.
+            member_id (Hashable): Identifies the member (e.g. a component id).
+
+        Returns:
+            Tuple[str, Hashable]: The `(name, member_id)` key.
+
+        Raises:
+            KeyError: If no family is registered under `name`.
+        """
+
+        key = (name, member_id)
+        if key in self._atoms or key in self._selectors:
+            return key
+
+        select_fn = self._selector_families.get(name)
+        if select_fn is not None:
+            self.add_selector(key, lambda get: select_fn(get, member_id))
+        elif name in self._atom_families:
+            self._atoms[key] = Atom(copy.copy(self._atom_families[name]), key=key)
+        else:
+            raise KeyError(f"Family '{name}' is not registered.")
+
+        return key
+
     def add_selector(
         self, key: str, select_fn: Callable[[Callable[[str], Any]], Any]
     ) -> Selector:
@@ -119,15 +322,21 @@ class StateManager:
         if key in self._atoms:
             raise ValueError(f"Key '{key}' is already registered as an Atom.")
 
-        if key not in self._selectors:
-            self._selectors[key] = Selector(select_fn, self._resolve_atom_or_selector)
+        selector = self._selectors.get(key)
+        if selector is None:
+            selector = self._selectors[_intern_key(key)] = Selector(
+                select_fn, self._resolve_atom_or_selector, self._thread_safe
+            )
 
-        return self._selectors[key]
+        return selector
 
     def get(self, key: str) -> Any:
         """
         Retrieves the current value of an Atom or Selector.
 
+        Inside a `batch()` block, returns the latest buffered write for the key;
+        a value still held by `set_debounced()`/`set_throttled()` is returned too.
+
         Args:
             key (str): The key of the state.
 
@@ -135,34 +344,367 @@ class StateManager:
             Any: Current value.
         """
 
-        if key in self._selectors:
-            return self._selectors[key].value
-        return self.atom(key).value
+        if self._pending_writes and key in self._pending_writes:
+            return self._pending_writes[key]
+
+        if self._debounced_writes and key in self._debounced_writes:
+            return self._debounced_writes[key]
+
+        # Existing atoms (most reads) resolve with a single lookup
+        atom = self._atoms.get(key)
+        if atom is not None:
+            return atom.value
+
+        return self._resolve_atom_or_selector(key).value
 
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: str, value: Any, force: bool = False) -> None:
         """
         Updates the value of an Atom.
 
         Args:
             key (str): Atom key.
             value (Any): New value.
+            force (bool): Notify listeners even if the value is unchanged
+                (e.g. to restart an animation from the same position).
+        """
+
+        # A direct write supersedes a delayed one still pending for the key
+        if self._debounce_timers and key in self._debounce_timers:
+            self._cancel_delayed_write(key)
+
+        # Most writes go to an existing atom outside a batch with at most one
+        # binding: apply them here, the rest through _set_atom_value()
+        atom = self._atoms.get(key)
+        if (
+            atom is not None
+            and not self._batch_depth
+            and (self._page is None or len(atom._listeners) < 2)
+        ):
+            atom._set_value(value, force)
+        else:
+            self._set_atom_value(key, value, force)
+
+    def set_debounced(self, key: str, value: Any, delay: float = 0.03) -> None:
+        """
+        Updates an Atom once a burst of calls has settled (trailing debounce).
+
+        Every call restarts a `delay` second timer; once no call came for
+        `delay` seconds, the latest value is written with a single `set()`,
+        so per-keystroke handlers notify listeners and bindings once per
+        pause in typing.
+
+        Example:
+            >>> ft.TextField(
+            ...     on_change=lambda e: state.set_debounced("email", e.control.value)
+            ... )
+
+        Args:
+            key (str): Atom key.
+            value (Any): New value.
+            delay (float): Seconds without a call before the value is written.
+        """
+
+        timer = threading.Timer(delay, self._flush_debounced, (key,))
+        timer.daemon = True
+
+        with self._debounce_lock:
+            self._debounced_writes[key] = value
+            previous = self._debounce_timers.get(key)
+            self._debounce_timers[key] = timer
+
+        if previous is not None:
+            previous.cancel()
+        timer.start()
+
+    def set_throttled(self, key: str, value: Any, interval: float = 0.016) -> None:
+        """
+        Updates an Atom at most once per `interval` seconds.
+
+        A call outside the interval writes right away; calls inside it only
+        keep their value, and the latest one is written when it ends, so
+        the final value of a burst (e.g. a slider drag) is never lost.
+
+        Example:
+            >>> ft.Slider(
+            ...     on_change=lambda e: state.set_throttled("volume", e.control.value)
+            ... )
+
+        Args:
+            key (str): Atom key.
+            value (Any): New value.
+            interval (float): Minimum seconds between writes.
+        """
+
+        now = time.monotonic()
+        with self._debounce_lock:
+            if key in self._debounce_timers:
+                self._debounced_writes[key] = value
+                return
+
+            wait = self._throttle_times.get(key, float("-inf")) + interval - now
+            if wait <= 0:
+                self._throttle_times[key] = now
+                timer = None
+            else:
+                self._debounced_writes[key] = value
+                timer = threading.Timer(wait, self._flush_debounced, (key,))
+                timer.daemon = True
+                self._debounce_timers[key] = timer
+
+        if timer is None:
+            self._set_atom_value(key, value)
+        else:
+            timer.start()
+
+    def setter(self, key: str, delay: float = 0.0) -> Callable[[Any], None]:
+        """
+        Returns an event handler that writes `e.control.value` to an Atom.
+
+        Handlers are cached per `(key, delay)`, so every control and call
+        site shares one callable instead of building its own lambda.
+
+        Example:
+            >>> ft.TextField(on_change=state.setter("email"))
+            >>> ft.TextField(on_change=state.setter("query", delay=0.03))
+
+        Args:
+            key (str): Atom key.
+            delay (float): When > 0, writes through `set_debounced()`.
+
+        Returns:
+            Callable: Handler taking a Flet control event.
+        """
+
+        handler = self._setters.get((key, delay))
+        if handler is None:
+            if delay > 0:
+
+                def handler(e):
+                    self.set_debounced(key, e.control.value, delay)
+
+            else:
+
+                def handler(e):
+                    self.set(key, e.control.value)
+
+            self._setters[(key, delay)] = handler
+
+        return handler
+
+    def _flush_debounced(self, key: str) -> None:
+        """
+        Writes the latest delayed value of a key (timer callback).
+
+        Args:
+            key (str): Atom key.
         """
 
+        with self._debounce_lock:
+            # Timer callbacks run on the Timer's own thread
+            if self._debounce_timers.get(key) is not threading.current_thread():
+                return  # Cancelled by a direct set(), or restarted by a later call
+            del self._debounce_timers[key]
+            value = self._debounced_writes.pop(key)
+            self._throttle_times[key] = time.monotonic()
+
         self._set_atom_value(key, value)
 
-    def _set_atom_value(self, key: str, value: Any) -> None:
+    def _cancel_delayed_write(self, key: str) -> None:
+        """
+        Drops the pending `set_debounced()`/`set_throttled()` write of a key.
+
+        Args:
+            key (str): Atom key.
+        """
+
+        with self._debounce_lock:
+            timer = self._debounce_timers.pop(key, None)
+            self._debounced_writes.pop(key, None)
+
+        if timer is not None:
+            timer.cancel()
+
+    def update(self, key: str, fn: Callable[[Any], Any]) -> None:
+        """
+        Updates an Atom from its current value (functional update).
+
+        Writes `fn(current)`, where `current` is what `get()` returns: inside
+        a `batch()` block the latest buffered write, and otherwise a value
+        still held by `set_debounced()`/`set_throttled()`, which the update
+        supersedes.
+
+        Example:
+            >>> state.update("count", lambda count: count + 1)
+
+        Args:
+            key (str): Atom key.
+            fn (Callable[[Any], Any]): Receives the current value and returns
+                the new one.
+        """
+
+        current = self.get(key)
+
+        # Like set(), replace a delayed write still pending for the key; its
+        # value is the `current` the update builds on
+        if self._debounce_timers and key in self._debounce_timers:
+            self._cancel_delayed_write(key)
+
+        self._set_atom_value(key, fn(current))
+
+    def _set_atom_value(self, key: str, value: Any, force: bool = False) -> None:
         """
         Internal method for updating atom values.
 
+        Inside a `batch()` block the write is buffered instead of applied.
+
         Args:
             key (str): Atom key.
             value (Any): New value.
+            force (bool): Skip the equality check.
+        """
+
+        atom = self._atoms.get(key)
+        if atom is None:
+            atom = self.atom(key)
+
+        if self._batch_depth:
+            self._pending_writes[key] = value
+            if force:
+                self._forced_writes.add(key)
+        elif self._page is not None and len(atom._listeners) > 1:
+            # Several bindings: send their controls in one message rather
+            # than one update() per control
+            with collected_control_updates() as controls:
+                atom._set_value(value, force)
+            if controls:
+                self._update_controls(list(controls))
+        else:
+            atom._set_value(value, force)
+
+    def _update_controls(self, controls: list) -> None:
+        """
+        Sends several mounted controls to the client with one `page.update()`.
+
+        Args:
+            controls (list): Controls whose properties were changed.
+        """
+
+        if len(controls) == 1:
+            Atom._try_update_immediate(controls[0])
+            return
+
+        try:
+            self._page.update(*controls)
+        except Exception:
+            # Fall back to one update per control rather than lose them
+            for control in controls:
+                Atom._try_update_immediate(control)
+
+    @contextmanager
+    def batch(self, update_page: bool = True) -> Iterator["StateManager"]:
+        """
+        Groups several `set()` calls into a single notification pass.
+
+        Writes made inside the block are buffered (last write per key wins)
+        and applied when the outermost block exits, so each atom notifies its
+        listeners at most once. If the manager is bound to a page,
+        `page.update()` is then called a single time. Blocks can be nested.
+
+        Args:
+            update_page (bool): Call `page.update()` after applying the writes.
+                Pass False while the page is still being built: bound controls
+                still receive the values, but no empty frame is sent.
+
+        Example:
+            >>> with state.batch():
+            ...     state.set("first_name", "")
+            ...     state.set("last_name", "")
+            ...     state.set("email", "")
+
+        Yields:
+            StateManager: This manager.
+        """
+
+        self.start_batch()
+        try:
+            yield self
+        finally:
+            self.flush_batch(update_page)
+
+    def start_batch(self) -> None:
+        """
+        Opens a batch window without a `with` block.
+
+        Every call must be paired with `flush_batch()`. Useful when the
+        writes to group span several methods (e.g. a component constructor).
+        """
+
+        self._batch_depth += 1
+
+    def flush_batch(self, update_page: bool = True) -> None:
+        """
+        Closes a batch window opened by `start_batch()`.
+
+        Buffered writes are applied when the outermost window closes.
+
+        Args:
+            update_page (bool): Call `page.update()` after applying the writes
+                (only honored by the outermost window).
         """
 
-        self.atom(key)._set_value(value)
+        if self._batch_depth:
+            self._batch_depth -= 1
+
+        if not self._batch_depth:
+            self._flush_pending_writes(update_page)
+
+    def _flush_pending_writes(self, update_page: bool = True) -> None:
+        """
+        Applies the writes buffered by `batch()` and updates the page once,
+        if any of them notified listeners.
+
+        Args:
+            update_page (bool): Whether to call `page.update()` afterwards.
+        """
+
+        if not self._pending_writes:
+            return
+
+        pending = self._pending_writes
+        forced = self._forced_writes
+        self._pending_writes = {}
+        self._forced_writes = set()
+
+        page_update = getattr(self._page, "update", None) if update_page else None
+
+        # Selectors over several of these keys recompute once, after all of
+        # the writes are applied
+        if not callable(page_update):
+            with deferred_selector_updates():
+                for key, value in pending.items():
+                    self.atom(key)._set_value(value, key in forced)
+            return
+
+        # Bound controls get their new values now and are all sent by the
+        # single page.update() below, instead of one update() each
+        notified = False
+        with deferred_control_updates(), deferred_selector_updates():
+            for key, value in pending.items():
+                if self.atom(key)._set_value(value, key in forced):
+                    notified = True
+
+        # Writes equal to the current values changed nothing to send
+        if notified:
+            page_update()
 
     def bind(
-        self, key: str, control: Ref, prop: str = "value", update: bool = True
+        self,
+        key: str,
+        control: Ref,
+        prop: str = "value",
+        update: bool = True,
+        weak: bool = False,
+        transform: Optional[Callable[[Any], Any]] = None,
     ) -> None:
         """
         Binds an Atom or Selector to a Ref (Flet UI element).
@@ -172,12 +714,33 @@ class StateManager:
             control (Ref): Flet control Ref.
             prop (str): Property to bind (default: "value").
             update (bool): Call `update()` after assignment.
+            weak (bool): Drop the binding once the Ref is garbage collected
+                (see `Atom.bind`).
+            transform (Callable, optional): Maps the value before it is assigned.
         """
 
-        if key in self._selectors:
-            self._selectors[key].bind(control, prop, update)
-        else:
-            self.atom(key).bind(control, prop, update)
+        atom = self._resolve_atom_or_selector(key)
+        atom.bind(control, prop, update, weak, transform)
+
+    def bind_many(self, bindings: Iterable[Tuple]) -> None:
+        """
+        Binds several Atoms or Selectors to Refs in one call.
+
+        Args:
+            bindings (Iterable[Tuple]): `(key, ref)` or `(key, ref, prop)` tuples;
+                `prop` defaults to "value".
+
+        Example:
+            >>> state.bind_many([
+            ...     ("title", title_ref),
+            ...     ("color", title_ref, "color"),
+            ... ])
+        """
+
+        resolve = self._resolve_atom_or_selector
+
+        for key, control, *prop in bindings:
+            resolve(key).bind(control, prop[0] if prop else "value")
 
     def bind_dynamic(
         self, key: str, control: Control | Ref, prop: str = "value", update: bool = True
@@ -192,10 +755,8 @@ class StateManager:
             update (bool): Call `update()` after change.
         """
 
-        if key in self._selectors:
-            self._selectors[key].bind_dynamic(control, prop, update)
-        else:
-            self.atom(key).bind_dynamic(control, prop, update)
+        atom = self._resolve_atom_or_selector(key)
+        atom.bind_dynamic(control, prop, update)
 
     def bind_two_way(
         self,
@@ -204,6 +765,7 @@ class StateManager:
         prop: str = "value",
         update: bool = True,
         on_input_change: Callable = None,
+        debounce: float = 0.0,
     ):
         """
         Creates a two-way binding between Atom and a Ref input (e.g. TextField).
@@ -214,12 +776,32 @@ class StateManager:
             prop (str): Property to sync (default: "value").
             update: (bool): Call `update()` after change.
             on_input_change (Callable, optional): Custom change handler.
+            debounce (float): When > 0, the field's value is written through
+                `set_debounced()`: once no change came for `debounce` seconds,
+                and readable with `get()` meanwhile (default: 0, write on
+                every change).
+
+        Raises:
+            ValueError: If `key` is a selector, or if both `on_input_change`
+                and `debounce` are given (the custom handler does the writing).
         """
 
         if key in self._selectors:
             raise ValueError("bind_two_way is not supported for selectors")
 
-        self.atom(key).bind_two_way(control, prop, update, on_input_change)
+        if on_input_change is not None and debounce > 0:
+            raise ValueError(
+                "bind_two_way: debounce only applies to the default handler; "
+                "debounce inside on_input_change instead (e.g. set_debounced())"
+            )
+
+        write = None
+        if debounce > 0:
+
+            def write(value):
+                self.set_debounced(key, value, debounce)
+
+        self.atom(key).bind_two_way(control, prop, update, on_input_change, write)
 
     def unbind(self, key: str, target: Control | Ref):
         """
@@ -234,10 +816,7 @@ class StateManager:
         if not atom:
             return
 
-        if isinstance(target, Ref):
-            atom.unbind(target)
-        elif isinstance(target, Control) and hasattr(target, "ref"):
-            atom.unbind(target.ref)
+        atom.unbind(target)
 
     def listen(
         self, key: str, callback: Callable[[Any], None], immediate: bool = True
@@ -251,11 +830,9 @@ class StateManager:
             immediate (bool): Call immediately with current value.
         """
 
-        atom = self._selectors[key] if key in self._selectors else self.atom(key)
-
-        if any(cb == callback for cb in atom._listeners):
-            return
+        atom = self._resolve_atom_or_selector(key)
 
+        # Atom.listen() ignores callbacks that are already registered
         atom.listen(callback, immediate)
 
     def listen_multiple(self, keys_callbacks: dict[str, Callable[[Any], None]]):
@@ -266,8 +843,11 @@ class StateManager:
             keys_callbacks (dict): Map of key → callback.
         """
 
+        selectors, atoms = self._selectors, self._atoms
+        resolve = self._resolve_atom_or_selector
         for key, callback in keys_callbacks.items():
-            self.listen(key, callback)
+            atom = selectors.get(key) or atoms.get(key) or resolve(key)
+            atom.listen(callback)
 
     def unlisten(self, key: str, callback: Callable[[Any], None]):
         """
@@ -308,7 +888,7 @@ class StateManager:
         """
 
         if key in self._atoms:
-            self._set_atom_value(key, value)
+            self.set(key, value)
         elif key in self._selectors:
             raise ValueError(f"Selector '{key}' cannot be reset directly.")
 
@@ -327,17 +907,35 @@ class StateManager:
         """
         Clears all atoms and listeners from memory.
 
-        Ideal for logout or session reset.
+        Ideal for logout or session reset. Pending `set_debounced()` /
+        `set_throttled()` and buffered `batch()` writes are dropped too.
         """
 
-        for atom in self._atoms.values():
+        atoms, selectors = self._atoms, self._selectors
+        # Swap in empty registries first: nothing resolves an old key again
+        self._atoms = {}
+        self._selectors = {}
+
+        # Detach the old atoms, so a late callback (e.g. the on_change of a
+        # two-way bound input) no longer reaches any control
+        for atom in atoms.values():
             atom.clear_listeners()
 
-        for s in self._selectors.values():
+        for s in selectors.values():
             s.clear_listeners()
 
-        self._atoms.clear()
-        self._selectors.clear()
+        # A delayed write would otherwise re-create its atom after the clear
+        with self._debounce_lock:
+            timers = list(self._debounce_timers.values())
+            self._debounce_timers.clear()
+            self._debounced_writes.clear()
+
+        for timer in timers:
+            timer.cancel()
+
+        self._throttle_times.clear()
+        self._pending_writes.clear()
+        self._forced_writes.clear()
 
     def invalidate(self, key: str):
         """
@@ -347,8 +945,9 @@ class StateManager:
             key (str): Selector key.
         """
 
-        if key in self._selectors:
-            self._selectors[key].recompute()
+        selector = self._selectors.get(key)
+        if selector is not None:
+            selector.recompute()
 
     def selector(self, key: str):
         """
@@ -402,31 +1001,71 @@ class StateManager:
         """
         import asyncio
 
-        # Check if the function is async
+        # One Action per decorated function, built here; each call only
+        # forwards its arguments through Action's `args` parameter
         if asyncio.iscoroutinefunction(func):
 
-            async def async_wrapper(*args, **kwargs):
-                # Create an Action instance with an async handler
-                async def async_handler(get, set, _):
-                    return await func(get, set, *args, **kwargs)
+            async def async_handler(get, set, call):
+                return await func(get, set, *call[0], **call[1])
 
-                action_instance = Action(async_handler)
+            action_instance = Action(async_handler)
+
+            async def async_wrapper(*args, **kwargs):
                 # Execute the action asynchronously with this state manager
-                return await action_instance.run_async(self)
+                return await action_instance.run_async(self, (args, kwargs))
 
             return async_wrapper
         else:
+            action_instance = Action(
+                lambda get, set, call: func(get, set, *call[0], **call[1])
+            )
 
             def wrapper(*args, **kwargs):
-                # Create an Action instance
-                action_instance = Action(
-                    lambda get, set, _: func(get, set, *args, **kwargs)
-                )
                 # Execute the action with this state manager
-                return action_instance.run(self)
+                return action_instance.run(self, (args, kwargs))
 
             return wrapper
 
+    async def run_actions(
+        self,
+        actions: Iterable[Action | Tuple[Action, Any]],
+        concurrency: int = 8,
+    ) -> list:
+        """
+        Runs async actions concurrently, at most `concurrency` at a time.
+
+        A slot is refilled as soon as any running action finishes, so one slow
+        action does not hold back the rest of the queue.
+
+        Args:
+            actions (Iterable): Actions to run, each either an `Action` or an
+                `(Action, args)` tuple.
+            concurrency (int): Maximum number of actions in flight. Default: 8.
+
+        Returns:
+            list: The results, in the order of `actions`.
+
+        Raises:
+            ValueError: If `concurrency` is less than 1.
+
+        Example:
+            >>> load_user = fa.Action(fetch_user)
+            >>> await state.run_actions([(load_user, i) for i in user_ids], 4)
+        """
+        import asyncio
+
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        slots = asyncio.Semaphore(concurrency)
+
+        async def run_one(item):
+            action, args = item if isinstance(item, tuple) else (item, None)
+            async with slots:
+                return await action.run_async(self, args)
+
+        return list(await asyncio.gather(*(run_one(item) for item in actions)))
+
 
 def get_state_manager(page: Page) -> StateManager:
     """
@@ -450,9 +1089,10 @@ def get_state_manager(page: Page) -> StateManager:
         >>>     state.atom("count", 0)
         >>>     # Now bindings will work even if controls aren't added yet!
     """
-    if not hasattr(page, "_state_manager"):
+    try:
+        return page._state_manager
+    except AttributeError:
         manager = StateManager(page)  # Pass page for automatic flush
-        setattr(page, "_state_manager", manager)
-        setattr(page, "state", manager)
-
-    return getattr(page, "_state_manager")
+        page._state_manager = manager
+        page.state = manager
+        return manager
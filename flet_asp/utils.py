@@ -1,5 +1,14 @@
 from typing import Any
 
+# Leaf types compared directly with == (exact type match is checked first)
+_SCALAR_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+# Shorter sequences are cheaper to walk than to scan as a whole
+_FLAT_MIN_LEN = 16
+
+# Marks a key missing from the other dict
+_MISSING = object()
+
 
 def deep_equal(a: Any, b: Any) -> bool:
     """
@@ -12,6 +21,7 @@ def deep_equal(a: Any, b: Any) -> bool:
     Handles:
     - Primitives (int, float, str, bool, None)
     - Collections (dict, list, tuple, set)
+    - Array-likes exposing `__array_interface__` (e.g. numpy arrays)
     - Nested structures
     - Custom objects (via __eq__)
 
@@ -37,23 +47,41 @@ def deep_equal(a: Any, b: Any) -> bool:
     # Type mismatch - definitely not equal
     # Using type() here (not isinstance) because we want exact type match
     # isinstance(True, int) is True, but we want to treat bool != int
-    if type(a) is not type(b):
+    cls = type(a)
+    if cls is not type(b):
         return False
 
+    # Scalars (the bulk of the leaves): one set lookup, then C-level ==
+    if cls in _SCALAR_TYPES:
+        return a == b
+
     # Handle dictionaries recursively
     if isinstance(a, dict):
         if len(a) != len(b):
             return False
-        for key in a:
-            if key not in b or not deep_equal(a[key], b[key]):
+        get = b.get
+        for key, value in a.items():
+            other = get(key, _MISSING)
+            if other is not value and (
+                other is _MISSING or not deep_equal(value, other)
+            ):
                 return False
         return True
 
-    # Handle lists and tuples recursively
+    # Handle lists and tuples recursively, stopping at the first mismatch
     if isinstance(a, (list, tuple)):
         if len(a) != len(b):
             return False
-        return all(deep_equal(x, y) for x, y in zip(a, b))
+        if len(a) >= _FLAT_MIN_LEN and type(a[0]) in _SCALAR_TYPES:
+            # Long flat payloads (e.g. chart series): C-level passes for the
+            # exact element types and == instead of one call per element
+            types = list(map(type, a))
+            if _SCALAR_TYPES.issuperset(types):
+                return types == list(map(type, b)) and a == b
+        for x, y in zip(a, b):
+            if x is not y and not deep_equal(x, y):
+                return False
+        return True
 
     # Handle sets (order-independent comparison)
     if isinstance(a, set):
@@ -61,6 +89,14 @@ def deep_equal(a: Any, b: Any) -> bool:
             return False
         return a == b
 
+    # Array-likes (e.g. numpy arrays), detected without importing numpy:
+    # their == is element-wise, so compare shape, dtype and every element
+    if hasattr(a, "__array_interface__"):
+        try:
+            return a.shape == b.shape and a.dtype == b.dtype and bool((a == b).all())
+        except Exception:
+            return False
+
     # Primitives and other types - use built-in equality
     try:
         return a == b
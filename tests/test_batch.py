@@ -0,0 +1,238 @@
+"""
+Tests for batched state updates.
+
+`StateManager.batch()` buffers writes and applies them when the block exits,
+so listeners run once per key and the page is updated a single time.
+"""
+
+from unittest.mock import Mock
+from flet import Ref
+from flet_asp.state import StateManager
+
+
+class MockPage:
+    """Mock Flet Page that counts update() calls."""
+
+    def __init__(self):
+        self.controls = []
+        self.update_calls = 0
+
+    def update(self, *args):
+        self.update_calls += 1
+
+
+class TestBatch:
+    """Tests for StateManager.batch()."""
+
+    def test_listeners_fire_once_with_last_value(self):
+        """Multiple writes to one key inside a batch notify once, with the last value."""
+        manager = StateManager()
+        manager.atom("count", 0)
+        callback = Mock()
+        manager.listen("count", callback, immediate=False)
+
+        with manager.batch():
+            manager.set("count", 1)
+            manager.set("count", 2)
+            manager.set("count", 3)
+            callback.assert_not_called()
+
+        callback.assert_called_once_with(3)
+        assert manager.get("count") == 3
+
+    def test_get_inside_batch_reads_buffered_value(self):
+        """Reads inside a batch see the writes made earlier in the block."""
+        manager = StateManager()
+        manager.atom("count", 0)
+
+        with manager.batch():
+            manager.set("count", 5)
+            assert manager.get("count") == 5
+            assert manager.atom("count").value == 0
+
+        assert manager.atom("count").value == 5
+
+    def test_page_updated_once_per_batch(self):
+        """A batch bound to a page calls page.update() a single time."""
+        page = MockPage()
+        manager = StateManager(page)
+        for key in ("a", "b", "c"):
+            manager.listen(key, Mock())
+
+        with manager.batch():
+            for key in ("a", "b", "c"):
+                manager.set(key, key.upper())
+
+        assert page.update_calls == 1
+        assert manager.get("b") == "B"
+
+    def test_unchanged_batch_does_not_update_page(self):
+        """A batch whose writes equal the current values sends nothing."""
+        page = MockPage()
+        manager = StateManager(page)
+        manager.atom("point", (1, 2))
+        callback = Mock()
+        manager.listen("point", callback, immediate=False)
+
+        with manager.batch():
+            manager.set("point", (1, 2))
+
+        callback.assert_not_called()
+        assert page.update_calls == 0
+
+    def test_empty_batch_does_not_update_page(self):
+        """A batch without writes leaves the page alone."""
+        page = MockPage()
+        manager = StateManager(page)
+
+        with manager.batch():
+            pass
+
+        assert page.update_calls == 0
+
+    def test_nested_batches_flush_at_outermost_exit(self):
+        """Only the outermost batch applies the buffered writes."""
+        manager = StateManager()
+        manager.atom("name", "")
+        callback = Mock()
+        manager.listen("name", callback, immediate=False)
+
+        with manager.batch():
+            with manager.batch():
+                manager.set("name", "Ada")
+            callback.assert_not_called()
+
+        callback.assert_called_once_with("Ada")
+
+    def test_selector_recomputes_after_batch(self):
+        """Selectors see all batched writes once the block exits."""
+        manager = StateManager()
+        manager.atom("first", "John")
+        manager.atom("last", "Doe")
+        manager.add_selector("full", lambda get: f"{get('first')} {get('last')}")
+
+        with manager.batch():
+            manager.set("first", "Jane")
+            manager.set("last", "Roe")
+            assert manager.get("full") == "John Doe"
+
+        assert manager.get("full") == "Jane Roe"
+
+    def test_selector_recomputes_once_per_batch(self):
+        """A selector over several batched keys recomputes once, never half-applied."""
+        manager = StateManager()
+        manager.atom("first", "John")
+        manager.atom("last", "Doe")
+        seen = []
+
+        def full(get):
+            seen.append((get("first"), get("last")))
+            return f"{get('first')} {get('last')}"
+
+        manager.add_selector("full", full)
+        listener = Mock()
+        manager.listen("full", listener, immediate=False)
+
+        with manager.batch():
+            manager.set("first", "Jane")
+            manager.set("last", "Roe")
+
+        assert seen == [("John", "Doe"), ("Jane", "Roe")]
+        listener.assert_called_once_with("Jane Roe")
+
+    def test_dirty_selector_read_by_listener_is_current(self):
+        """A listener running mid-flush reads the selector's up-to-date value."""
+        manager = StateManager()
+        manager.atom("price", 1)
+        manager.atom("qty", 1)
+        manager.add_selector("total", lambda get: get("price") * get("qty"))
+        totals = []
+        manager.listen("price", lambda _: totals.append(manager.get("total")), False)
+
+        with manager.batch():
+            manager.set("qty", 3)
+            manager.set("price", 2)
+
+        assert totals == [6]
+        assert manager.get("total") == 6
+
+    def test_start_and_flush_batch(self):
+        """start_batch()/flush_batch() pairs behave like a batch() block."""
+        page = MockPage()
+        manager = StateManager(page)
+        manager.atom("a", 0)
+        callback = Mock()
+        manager.listen("a", callback, immediate=False)
+
+        manager.start_batch()
+        manager.set("a", 1)
+        manager.start_batch()
+        manager.set("a", 2)
+        manager.flush_batch()
+        callback.assert_not_called()
+        manager.flush_batch()
+
+        callback.assert_called_once_with(2)
+        assert page.update_calls == 1
+
+    def test_batch_without_page_update(self):
+        """update_page=False applies the writes but skips page.update()."""
+        page = MockPage()
+        manager = StateManager(page)
+        manager.atom("a", 0)
+        callback = Mock()
+        manager.listen("a", callback, immediate=False)
+
+        with manager.batch(update_page=False):
+            manager.set("a", 1)
+
+        callback.assert_called_once_with(1)
+        assert page.update_calls == 0
+
+    def test_bound_controls_sent_by_single_page_update(self):
+        """Bindings inside a batch skip control.update(); the page is updated once."""
+        page = MockPage()
+        manager = StateManager(page)
+        manager.atom("a", 0)
+        manager.atom("b", 0)
+        first, second = Ref(), Ref()
+        first.current = Mock(page=page)
+        second.current = Mock(page=page)
+        manager.bind("a", first)
+        manager.bind("b", second)
+        first.current.update.reset_mock()
+        second.current.update.reset_mock()
+        page.update_calls = 0
+
+        with manager.batch():
+            manager.set("a", 1)
+            manager.set("b", 2)
+
+        assert first.current.value == 1
+        assert second.current.value == 2
+        first.current.update.assert_not_called()
+        second.current.update.assert_not_called()
+        assert page.update_calls == 1
+
+    def test_write_to_several_bindings_sends_one_update(self):
+        """A set() that changes several bound controls sends them together."""
+        page = MockPage()
+        page.updated_with = []
+        page.update = lambda *controls: page.updated_with.append(controls)
+        manager = StateManager(page)
+        manager.atom("theme", "light")
+        label, button = Ref(), Ref()
+        label.current = Mock(page=page)
+        button.current = Mock(page=page)
+        manager.bind("theme", label)
+        manager.bind("theme", button, prop="text")
+        label.current.update.reset_mock()
+        button.current.update.reset_mock()
+
+        manager.set("theme", "dark")
+
+        assert label.current.value == "dark"
+        assert button.current.text == "dark"
+        label.current.update.assert_not_called()
+        button.current.update.assert_not_called()
+        assert page.updated_with == [(label.current, button.current)]
@@ -267,6 +267,139 @@ def test_bind_two_way_multiple_fields():
     print("✅ Multiple fields test passed!")
 
 
+def test_bind_two_way_does_not_echo_input_changes():
+    """
+    Test that a change typed into the field is not written back to the same
+    field (no extra update round-trip), while other listeners still run.
+    """
+    page = MockPage()
+    state = fa.get_state_manager(page)
+    state.atom("name", "")
+
+    name_ref = ft.Ref[ft.TextField]()
+    page.add(ft.TextField(ref=name_ref))
+    name_ref.current.page = page
+    state.bind_two_way("name", name_ref)
+
+    calls = []
+    state.listen("name", calls.append, immediate=False)
+
+    updates = []
+    name_ref.current.update = lambda: updates.append(True)
+
+    name_ref.current.value = "Ada"
+    name_ref.current.on_change(None)
+
+    assert state.get("name") == "Ada"
+    assert calls == ["Ada"]
+    assert updates == []
+
+    # Writes from elsewhere still reach the field
+    state.set("name", "Grace")
+    assert name_ref.current.value == "Grace"
+    assert updates == [True]
+
+
+def test_bind_two_way_debounce_value_readable_while_pending():
+    """
+    Test that a debounced field value is visible to state.get() before it
+    is written, so a submit inside the window does not read stale input.
+    """
+    page = MockPage()
+    state = fa.get_state_manager(page)
+    state.atom("email", "")
+
+    email_ref = ft.Ref[ft.TextField]()
+    page.add(ft.TextField(ref=email_ref))
+    state.bind_two_way("email", email_ref, debounce=0.05)
+
+    calls = []
+    state.listen("email", calls.append, immediate=False)
+
+    email_ref.current.value = "ada@example.com"
+    email_ref.current.on_change(None)
+
+    assert state.get("email") == "ada@example.com"
+    assert calls == []
+
+    time.sleep(0.15)
+    assert calls == ["ada@example.com"]
+
+
+def test_bind_two_way_rejects_debounce_with_custom_handler():
+    """
+    Test that debounce together with on_input_change raises instead of
+    silently not debouncing the custom handler.
+    """
+    import pytest
+
+    page = MockPage()
+    state = fa.get_state_manager(page)
+    state.atom("query", "")
+
+    query_ref = ft.Ref[ft.TextField]()
+    page.add(ft.TextField(ref=query_ref))
+
+    with pytest.raises(ValueError):
+        state.bind_two_way(
+            "query", query_ref, on_input_change=lambda e: None, debounce=0.05
+        )
+
+
+def test_bind_two_way_debounce_coalesces_changes():
+    """
+    Test that with debounce > 0, a burst of changes results in a single atom
+    write carrying the field's latest value.
+    """
+    page = MockPage()
+    state = fa.get_state_manager(page)
+    state.atom("query", "")
+
+    query_ref = ft.Ref[ft.TextField]()
+    page.add(ft.TextField(ref=query_ref))
+    state.bind_two_way("query", query_ref, debounce=0.05)
+
+    calls = []
+    state.listen("query", calls.append, immediate=False)
+
+    for text in ("h", "he", "hel", "hell", "hello"):
+        query_ref.current.value = text
+        query_ref.current.on_change(None)
+
+    assert calls == []
+
+    time.sleep(0.15)
+    assert calls == ["hello"]
+    assert state.get("query") == "hello"
+
+
+def test_bind_two_way_debounce_restarts_on_every_change():
+    """
+    Test that each change restarts the debounce delay: typing slower than
+    the delay's total but faster than the delay writes once, at the end.
+    """
+    page = MockPage()
+    state = fa.get_state_manager(page)
+    state.atom("search", "")
+
+    search_ref = ft.Ref[ft.TextField]()
+    page.add(ft.TextField(ref=search_ref))
+    state.bind_two_way("search", search_ref, debounce=0.15)
+
+    calls = []
+    state.listen("search", calls.append, immediate=False)
+
+    for text in ("f", "fl", "fle", "flet", "flet!"):
+        search_ref.current.value = text
+        search_ref.current.on_change(None)
+        time.sleep(0.05)
+
+    assert calls == []
+
+    time.sleep(0.4)
+    assert calls == ["flet!"]
+
+
 if __name__ == "__main__":
     try:
         test_bind_two_way_common_case()
@@ -0,0 +1,51 @@
+"""
+Tests for `deep_equal`, the comparison behind atom change detection and
+selector memoization.
+"""
+
+from flet_asp.utils import deep_equal
+
+
+class FakeArray:
+    """Minimal array-like: element-wise == and an `__array_interface__`."""
+
+    def __init__(self, values, dtype="float64"):
+        self.values = list(values)
+        self.shape = (len(self.values),)
+        self.dtype = dtype
+        self.__array_interface__ = {"shape": self.shape, "typestr": dtype}
+
+    def __eq__(self, other):
+        return FakeMask([x == y for x, y in zip(self.values, other.values)])
+
+
+class FakeMask(list):
+    def all(self):
+        return all(self)
+
+
+def test_type_strict_scalars_and_sequences():
+    """Equal-comparing values of different types are not deeply equal."""
+    assert deep_equal(1, 1)
+    assert not deep_equal(1, 1.0)
+    assert not deep_equal(True, 1)
+    assert deep_equal({"a": [1, {"b": None}]}, {"a": [1, {"b": None}]})
+    assert not deep_equal({"a": None}, {"b": None})
+
+
+def test_long_flat_sequences():
+    """Long scalar sequences compare values and exact element types."""
+    series = [float(i) for i in range(100)]
+
+    assert deep_equal(series, [float(i) for i in range(100)])
+    assert not deep_equal(series, series[:-1] + [0.5])
+    assert not deep_equal(list(range(100)), [float(i) for i in range(100)])
+    assert not deep_equal(list(range(100)), list(range(99)) + [[99]])
+
+
+def test_array_likes():
+    """Array-likes compare by shape, dtype and elements."""
+    assert deep_equal(FakeArray([1.0, 2.0]), FakeArray([1.0, 2.0]))
+    assert not deep_equal(FakeArray([1.0, 2.0]), FakeArray([1.0, 3.0]))
+    assert not deep_equal(FakeArray([1.0]), FakeArray([1.0, 2.0]))
+    assert not deep_equal(FakeArray([1.0], "float64"), FakeArray([1.0], "int64"))
@@ -7,7 +7,7 @@ controls are added to the page.
 
 import pytest
 from unittest.mock import Mock
-from flet import Ref, Column
+from flet import Ref, Column, Text
 from flet_asp.atom import Atom
 from flet_asp.state import StateManager
 
@@ -162,6 +162,93 @@ class TestHybridBinding:
         # Should NOT have added another listener
         assert len(atom._listeners) == initial_listener_count
 
+    def test_same_ref_can_bind_different_props(self):
+        """Test that one Ref can be bound to several properties."""
+        atom = Atom("blue", key="test")
+        ref = Ref()
+        ref.current = Mock(page=None)
+
+        atom.bind(ref, prop="color")
+        atom.bind(ref, prop="bgcolor")
+        atom.bind(ref, prop="color")
+
+        assert len(atom._listeners) == 2
+        assert ref.current.color == "blue"
+        assert ref.current.bgcolor == "blue"
+
+    def test_bind_with_transform(self):
+        """Test that transform maps the value before it is assigned."""
+        atom = Atom(50, key="progress")
+        ref = Ref()
+        ref.current = Mock(page=None)
+
+        atom.bind(ref, prop="width", transform=lambda p: p * 2)
+        assert ref.current.width == 100
+
+        atom._set_value(10)
+        assert ref.current.width == 20
+
+    def test_weak_binding_dropped_when_ref_collected(self):
+        """Test that weak bindings vanish once their Ref is garbage collected."""
+        import gc
+
+        atom = Atom(1, key="test")
+        ref = Ref()
+        ref.current = Mock(page=None)
+
+        atom.bind(ref, prop="value", weak=True)
+        assert ref.current.value == 1
+        assert len(atom._listeners) == 1
+
+        del ref
+        gc.collect()
+
+        assert len(atom._listeners) == 0
+        assert len(atom._bindings) == 0
+
+    def test_unbind_removes_weak_binding(self):
+        """Test that unbind() also removes weak bindings."""
+        atom = Atom(1, key="test")
+        ref = Ref()
+        ref.current = Mock(page=None)
+
+        atom.bind(ref, prop="value", weak=True)
+        atom.unbind(ref)
+
+        assert len(atom._listeners) == 0
+        assert len(atom._bindings) == 0
+
+    def test_bind_dynamic_control_dropped_when_collected(self):
+        """Test that a control bound directly does not outlive its owner."""
+        import gc
+
+        atom = Atom("hi", key="test")
+        control = Text()
+
+        atom.bind_dynamic(control, prop="value")
+        atom.bind_dynamic(control, prop="value")
+        assert control.value == "hi"
+        assert len(atom._listeners) == 1
+
+        del control
+        gc.collect()
+
+        assert len(atom._listeners) == 0
+        assert len(atom._bindings) == 0
+
+    def test_unbind_control(self):
+        """Test that unbind() removes every binding of a control."""
+        atom = Atom("blue", key="test")
+        control = Text()
+
+        atom.bind_dynamic(control, prop="value")
+        atom.bind_dynamic(control, prop="color")
+        atom.unbind(control)
+
+        assert len(atom._listeners) == 0
+        atom._set_value("red")
+        assert control.color == "blue"
+
     def test_weakref_prevents_memory_leak(self):
         """Test that weakref allows garbage collection of destroyed controls."""
         import gc
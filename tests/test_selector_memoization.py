@@ -41,6 +41,102 @@ class TestSelectorMemoization:
         assert manager.get("doubled") == 30
         assert call_count[0] == 2  # Now it should be 2
 
+    def test_forced_write_of_same_value_skips_recomputation(self):
+        """
+        Tests that a spurious trigger (a forced write of an unchanged
+        dependency) costs one argument comparison, not a recomputation.
+        """
+        manager = StateManager()
+        manager.atom("hover", default=False)
+        manager.atom("loading", default=False)
+
+        call_count = [0]
+
+        @manager.selector("active")
+        def compute_active(get):
+            call_count[0] += 1
+            return get("hover") or get("loading")
+
+        assert call_count[0] == 1
+
+        manager.set("hover", False, force=True)
+        assert call_count[0] == 1
+
+        manager.set("loading", True)
+        assert manager.get("active") is True
+        assert call_count[0] == 2
+
+    def test_in_place_mutation_recomputes(self):
+        """
+        Tests that re-setting the same, mutated dict recomputes the selector
+        instead of matching the cached (identical) argument.
+        """
+        manager = StateManager()
+        manager.atom("tasks", default={1: {"completed": False}}, eq="identity")
+
+        @manager.selector("active_count")
+        def count_active(get):
+            return sum(not t["completed"] for t in get("tasks").values())
+
+        assert manager.get("active_count") == 1
+
+        tasks = manager.get("tasks")
+        tasks[1]["completed"] = True
+        manager.set("tasks", tasks)
+        assert manager.get("active_count") == 0
+
+    def test_cached_result_is_detached_from_source(self):
+        """
+        Tests that mutating what a selector returned does not change its
+        cached value, for flat and nested results alike.
+        """
+        manager = StateManager()
+        manager.atom("tags", default=["a", "b"])
+        manager.atom("groups", default=[["a"], ["b"]])
+        flat = []
+        nested = []
+
+        @manager.selector("flat")
+        def select_flat(get):
+            flat.append(list(get("tags")))
+            return flat[-1]
+
+        @manager.selector("nested")
+        def select_nested(get):
+            nested.append([list(g) for g in get("groups")])
+            return nested[-1]
+
+        flat[-1].append("c")
+        nested[-1][0].append("c")
+
+        assert manager.get("flat") == ["a", "b"]
+        assert manager.get("nested") == [["a"], ["b"]]
+
+    def test_cached_result_with_custom_objects_is_detached(self):
+        """
+        Tests that results holding objects other than plain data are still
+        copied deeply, with the objects' own types.
+        """
+
+        class Point:
+            def __init__(self, x):
+                self.x = x
+
+        manager = StateManager()
+        manager.atom("x", default=1)
+        results = []
+
+        @manager.selector("points")
+        def select_points(get):
+            results.append({"points": [Point(get("x"))]})
+            return results[-1]
+
+        results[-1]["points"][0].x = 99
+
+        cached = manager.get("points")["points"][0]
+        assert type(cached) is Point
+        assert cached.x == 1
+
     def test_memoization_with_complex_objects(self):
         """
         Tests that memoization works correctly with complex objects like dicts.
@@ -313,3 +409,50 @@ class TestSelectorMemoization:
         manager.set("items", [])
         assert manager.get("item_count") == 0
         assert call_count[0] == 3
+
+    def test_unchanged_output_does_not_notify_listeners(self):
+        """
+        Tests that a selector which recomputes to the same output (here the
+        same shared object) does not notify its listeners or bindings.
+        """
+        manager = StateManager()
+        manager.atom("hover", default=False)
+        manager.atom("loading", default=False)
+
+        active, idle = object(), object()
+
+        @manager.selector("visual")
+        def compute_visual(get):
+            is_hover = get("hover")
+            is_loading = get("loading")
+            return active if (is_hover or is_loading) else idle
+
+        notified = []
+        manager.listen("visual", notified.append, immediate=False)
+
+        manager.set("hover", True)
+        assert notified == [active]
+
+        # Recomputes (a dependency changed) but the output is the same object
+        manager.set("loading", True)
+        manager.set("hover", False)
+        assert notified == [active]
+
+        manager.set("loading", False)
+        assert notified == [active, idle]
+
+    def test_thread_safe_selectors_recompute_the_same(self):
+        """
+        Tests that selectors of a thread-safe manager (lock-guarded) and of
+        the default one (flag-guarded) recompute alike.
+        """
+        for thread_safe in (False, True):
+            manager = StateManager(thread_safe=thread_safe)
+            manager.atom("count", default=1)
+            selector = manager.add_selector("double", lambda get: get("count") * 2)
+
+            manager.set("count", 5)
+            assert manager.get("double") == 10
+
+            assert (selector._update_lock is not None) is thread_safe
+            assert selector._is_updating is False
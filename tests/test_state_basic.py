@@ -1,7 +1,12 @@
 # e:/.../flet-asp/tests/test_state.py
 
+import time
 import pytest
+from unittest.mock import Mock
+from flet import Ref
 from flet_asp.state import StateManager
+from flet_asp.selector import Selector
+from flet_asp.action import Action
 
 
 def test_atom_creation_and_retrieval():
@@ -43,3 +48,528 @@ def test_creating_atom_with_selector_key_raises_error():
         ValueError, match="Key 'my_selector' is already registered as a Selector."
     ):
         manager.atom("my_selector")
+
+
+def test_functional_update():
+    """
+    Tests that update() derives the new value from the current one.
+    """
+    manager = StateManager()
+    manager.atom("count", default=1)
+
+    manager.update("count", lambda count: count + 1)
+    assert manager.get("count") == 2
+
+    with manager.batch():
+        manager.update("count", lambda count: count * 10)
+        manager.update("count", lambda count: count + 1)
+
+    assert manager.get("count") == 21
+
+
+def test_atoms_bulk_creation():
+    """
+    Tests that atoms() creates missing atoms and keeps existing values.
+    """
+    manager = StateManager()
+    manager.atom("name", default="Ada")
+
+    atoms = manager.atoms({"name": "ignored", "email": "", "age": 0})
+
+    assert set(atoms) == {"name", "email", "age"}
+    assert manager.get("name") == "Ada"
+    assert manager.get("email") == ""
+    assert atoms["age"] is manager.atom("age")
+
+
+def test_atoms_bulk_creation_rejects_selector_keys():
+    """
+    Tests that atoms() refuses keys already used by selectors.
+    """
+    manager = StateManager()
+    manager.add_selector("total", lambda get: 0)
+
+    with pytest.raises(ValueError):
+        manager.atoms({"total": 1})
+
+
+def test_bind_many():
+    """
+    Tests that bind_many() binds every (key, ref[, prop]) tuple.
+    """
+    manager = StateManager()
+    manager.atom("title", default="Hello")
+    manager.atom("color", default="red")
+    ref = Ref()
+    ref.current = Mock(page=None)
+
+    manager.bind_many([("title", ref), ("color", ref, "color")])
+
+    assert ref.current.value == "Hello"
+    assert ref.current.color == "red"
+
+    manager.set("color", "blue")
+    assert ref.current.color == "blue"
+
+
+def test_set_equal_value_does_not_notify():
+    """
+    Tests that writing a value equal to the current one skips listeners,
+    while re-setting a container mutated in place still notifies.
+    """
+    manager = StateManager()
+    manager.atom("form", default={"name": "Ada"})
+    callback = Mock()
+    manager.listen("form", callback, immediate=False)
+
+    manager.set("form", {"name": "Ada"})
+    callback.assert_not_called()
+
+    form = manager.get("form")
+    form["name"] = "Grace"
+    manager.set("form", form)
+    callback.assert_called_once_with({"name": "Grace"})
+
+
+def test_set_force_notifies_unchanged_value():
+    """
+    Tests that set(..., force=True) notifies listeners even when the value
+    is unchanged, also inside a batch.
+    """
+    manager = StateManager()
+    manager.atom("left", default=130)
+    callback = Mock()
+    manager.listen("left", callback, immediate=False)
+
+    manager.set("left", 130)
+    callback.assert_not_called()
+
+    manager.set("left", 130, force=True)
+    callback.assert_called_once_with(130)
+
+    with manager.batch():
+        manager.set("left", 130, force=True)
+    assert callback.call_count == 2
+
+
+def test_atom_and_selector_families():
+    """
+    Tests that family members are created on demand, keyed by
+    (name, member_id), and evaluated independently.
+    """
+    manager = StateManager()
+    manager.atom_family("hover", default=False)
+    manager.selector_family(
+        "label", lambda get, bid: f"{bid}:{'on' if get(('hover', bid)) else 'off'}"
+    )
+
+    first = manager.family("label", "a")
+    second = manager.family("label", "b")
+    assert first == ("label", "a")
+    assert manager.get(first) == "a:off"
+
+    manager.set(manager.family("hover", "a"), True)
+    assert manager.get(first) == "a:on"
+    assert manager.get(second) == "b:off"
+
+
+def test_family_members_get_their_own_mutable_default():
+    """
+    Tests that members of an atom family with a mutable default do not
+    share one default object.
+    """
+    manager = StateManager()
+    manager.atom_family("selected", default=[])
+
+    first = manager.family("selected", 1)
+    manager.get(first).append("x")
+
+    assert manager.get(manager.family("selected", 2)) == []
+    assert manager.get(first) == ["x"]
+
+
+def test_unknown_family_raises_error():
+    """
+    Tests that family() rejects names that were never registered.
+    """
+    manager = StateManager()
+
+    with pytest.raises(KeyError):
+        manager.family("missing", 1)
+
+
+def test_malformed_family_key_raises_key_error():
+    """
+    Tests that a tuple starting with a family name but not shaped
+    (name, member_id) raises KeyError instead of a TypeError.
+    """
+    manager = StateManager()
+    manager.atom_family("selected", default=False)
+
+    with pytest.raises(KeyError):
+        manager.get(("selected", 1, 2))
+
+    with pytest.raises(KeyError):
+        manager.set(("selected", 1, 2), True)
+
+
+def test_family_keys_resolve_before_family_call():
+    """
+    Tests that get(), set(), listen() and bind() on a family key create
+    the member from its family, even before family() was called.
+    """
+    manager = StateManager()
+    manager.atom_family("hover", default=False)
+    manager.selector_family("label", lambda get, mid: f"{mid}:{get(('hover', mid))}")
+
+    assert manager.get(("hover", "x")) is False
+    assert manager.family("hover", "x") == ("hover", "x")
+    assert manager.get(("hover", "x")) is False
+
+    callback = Mock()
+    manager.listen(("hover", "y"), callback)
+    callback.assert_called_once_with(False)
+
+    ref = Ref()
+    ref.current = Mock(page=None)
+    manager.bind(("label", "z"), ref)
+    assert ref.current.value == "z:False"
+    assert isinstance(manager._selectors[("label", "z")], Selector)
+
+    manager.set(("hover", "z"), True)
+    assert ref.current.value == "z:True"
+
+    with pytest.raises(ValueError):
+        manager.set(("label", "z"), "nope")
+
+
+def test_set_debounced_writes_latest_value_once():
+    """
+    Tests that a burst of set_debounced() calls notifies listeners once,
+    with the last value, after the delay.
+    """
+    manager = StateManager()
+    manager.atom("email", default="")
+    callback = Mock()
+    manager.listen("email", callback, immediate=False)
+
+    for value in ("a", "ab", "abc"):
+        manager.set_debounced("email", value, delay=0.05)
+
+    # Readers see the pending value; listeners wait for the window to close
+    assert manager.get("email") == "abc"
+    callback.assert_not_called()
+    time.sleep(0.2)
+
+    callback.assert_called_once_with("abc")
+    assert manager.get("email") == "abc"
+
+
+def test_set_debounced_restarts_delay_on_every_call():
+    """
+    Tests that set_debounced() waits for a pause: a burst longer than the
+    delay, with shorter gaps, is written once, after the last call.
+    """
+    manager = StateManager()
+    manager.atom("query", default="")
+    callback = Mock()
+    manager.listen("query", callback, immediate=False)
+
+    for value in ("a", "ab", "abc", "abcd", "abcde"):
+        manager.set_debounced("query", value, delay=0.15)
+        time.sleep(0.05)
+
+    # 0.25s since the first call, only 0.05s since the last one
+    callback.assert_not_called()
+    time.sleep(0.4)
+
+    callback.assert_called_once_with("abcde")
+
+
+def test_setter_writes_event_value_and_is_cached():
+    """
+    Tests that setter() returns one shared handler per key that writes
+    e.control.value to the atom.
+    """
+    manager = StateManager()
+    manager.atom("email", default="")
+
+    handler = manager.setter("email")
+    assert manager.setter("email") is handler
+
+    handler(Mock(control=Mock(value="a@b.c")))
+    assert manager.get("email") == "a@b.c"
+
+
+def test_set_throttled_writes_leading_and_trailing_values():
+    """
+    Tests that set_throttled() writes the first call at once and the last
+    call of the burst when the interval ends.
+    """
+    manager = StateManager()
+    manager.atom("volume", default=0)
+    callback = Mock()
+    manager.listen("volume", callback, immediate=False)
+
+    for value in (1, 2, 3):
+        manager.set_throttled("volume", value, interval=0.05)
+
+    callback.assert_called_once_with(1)
+    time.sleep(0.2)
+
+    assert [c.args[0] for c in callback.call_args_list] == [1, 3]
+
+
+def test_direct_set_cancels_pending_debounced_write():
+    """
+    Tests that set() supersedes a set_debounced() write still pending
+    for the same key (e.g. clearing an input right after typing).
+    """
+    manager = StateManager()
+    manager.atom("new_task", default="")
+
+    manager.set_debounced("new_task", "buy milk", delay=0.05)
+    manager.set("new_task", "")
+    time.sleep(0.2)
+
+    assert manager.get("new_task") == ""
+
+
+def test_update_folds_in_pending_debounced_write():
+    """
+    Tests that update() builds on a set_debounced() value still pending
+    and replaces that write, so the functional update is not lost.
+    """
+    manager = StateManager()
+    manager.atom("count", default=0)
+    callback = Mock()
+    manager.listen("count", callback, immediate=False)
+
+    manager.set_debounced("count", 5, delay=0.05)
+    manager.update("count", lambda count: count + 1)
+    assert manager.get("count") == 6
+
+    time.sleep(0.2)
+    assert manager.get("count") == 6
+    callback.assert_called_once_with(6)
+
+
+def test_identity_equality_skips_deep_comparison():
+    """
+    Tests that an atom created with eq="identity" treats any other object
+    as a change, even when it is equal.
+    """
+    manager = StateManager()
+    manager.atom("tasks", [1, 2], eq="identity")
+    callback = Mock()
+    manager.listen("tasks", callback, immediate=False)
+
+    manager.set("tasks", [1, 2])
+    callback.assert_called_once_with([1, 2])
+
+
+def test_custom_equality_function():
+    """
+    Tests that an atom accepts a custom (old, new) -> bool equality.
+    """
+    manager = StateManager()
+    manager.atom("name", "Ana", eq=lambda old, new: old.lower() == new.lower())
+    callback = Mock()
+    manager.listen("name", callback, immediate=False)
+
+    manager.set("name", "ANA")
+    callback.assert_not_called()
+
+    manager.set("name", "Bia")
+    callback.assert_called_once_with("Bia")
+
+
+def test_run_actions_bounds_concurrency():
+    """
+    Tests that run_actions() keeps at most `concurrency` actions in flight
+    and returns the results in order.
+    """
+    import asyncio
+
+    manager = StateManager()
+    manager.atom("running", 0)
+    peak = [0]
+
+    async def work(get, set_value, n):
+        set_value("running", get("running") + 1)
+        peak[0] = max(peak[0], get("running"))
+        await asyncio.sleep(0.01 * (n % 3))
+        set_value("running", get("running") - 1)
+        return n * 10
+
+    action = Action(work)
+    results = asyncio.run(
+        manager.run_actions([(action, n) for n in range(7)], concurrency=2)
+    )
+
+    assert results == [0, 10, 20, 30, 40, 50, 60]
+    assert peak[0] == 2
+
+    with pytest.raises(ValueError):
+        asyncio.run(manager.run_actions([action], concurrency=0))
+
+
+def test_write_without_listeners_skips_comparison(monkeypatch):
+    """
+    Tests that an atom nobody listens to stores writes without comparing
+    them, and compares again once a listener is added.
+    """
+    import flet_asp.atom as atom_module
+
+    compare = Mock(return_value=False)
+    monkeypatch.setitem(atom_module._EQUALITY, "deep", compare)
+
+    manager = StateManager()
+    manager.atom("email", "")
+    manager.set("email", "a@b.c")
+    assert manager.get("email") == "a@b.c"
+    compare.assert_not_called()
+
+    callback = Mock()
+    manager.listen("email", callback, immediate=False)
+    manager.set("email", "x@y.z")
+    compare.assert_called_once_with("a@b.c", "x@y.z")
+    callback.assert_called_once_with("x@y.z")
+
+
+def test_resetting_mutated_set_notifies():
+    """
+    Tests that re-setting the same set after mutating it notifies listeners,
+    as it does for dicts and lists.
+    """
+    manager = StateManager()
+    manager.atom("ids", set(), eq="identity")
+    callback = Mock()
+    manager.listen("ids", callback, immediate=False)
+
+    ids = manager.get("ids")
+    ids.add(1)
+    manager.set("ids", ids)
+    callback.assert_called_once_with({1})
+
+
+def test_clear_drops_pending_debounced_write():
+    """
+    Tests that clear() cancels a pending debounced write instead of letting
+    it re-create the atom afterwards.
+    """
+    manager = StateManager()
+    manager.atom("query", "")
+    manager.set_debounced("query", "abc", delay=0.05)
+
+    manager.clear()
+    time.sleep(0.1)
+
+    assert not manager.has("query")
+
+
+def test_listen_ignores_duplicate_callbacks():
+    """
+    Tests that registering the same callback twice keeps one listener, and
+    that it can be registered again after unlisten().
+    """
+    manager = StateManager()
+    manager.atom("count", 0)
+    callback = Mock()
+
+    manager.listen("count", callback, immediate=False)
+    manager.listen("count", callback, immediate=False)
+    manager.set("count", 1)
+    callback.assert_called_once_with(1)
+
+    manager.unlisten("count", callback)
+    manager.listen("count", callback, immediate=False)
+    manager.set("count", 2)
+    assert callback.call_count == 2
+
+
+def test_selector_returning_coroutine_is_awaited():
+    """
+    Tests that a plain select function returning a coroutine is treated as
+    async from its first result, instead of caching the coroutine object.
+    """
+    import asyncio
+
+    async def double(n):
+        return n * 2
+
+    async def scenario():
+        manager = StateManager()
+        manager.atom("n", 1)
+        manager.add_selector("double", lambda get: double(get("n")))
+        await asyncio.sleep(0.01)
+        first = manager.get("double")
+
+        manager.set("n", 2)
+        await asyncio.sleep(0.01)
+        return first, manager.get("double")
+
+    assert asyncio.run(scenario()) == (2, 4)
+
+
+def test_listen_multiple_registers_atoms_and_selectors():
+    """
+    Tests that listen_multiple() resolves atoms, selectors and new keys,
+    and ignores a callback that is already registered.
+    """
+    manager = StateManager()
+    manager.atom("count", 1)
+    manager.add_selector("double", lambda get: get("count") * 2)
+
+    seen = []
+    on_count = lambda v: seen.append(("count", v))  # noqa: E731
+    on_double = lambda v: seen.append(("double", v))  # noqa: E731
+    mappings = {"count": on_count, "double": on_double, "fresh": seen.append}
+
+    manager.listen_multiple(mappings)
+    manager.listen_multiple(mappings)
+    assert seen == [("count", 1), ("double", 2), None]
+
+    manager.set("count", 2)
+    assert sorted(seen[3:]) == [("count", 2), ("double", 4)]
+
+
+def test_async_selector_error_is_logged(caplog):
+    """
+    Tests that an exception raised by an async selector is logged with
+    its traceback instead of printed.
+    """
+    import asyncio
+    import logging
+
+    async def failing(get):
+        get("n")
+        raise RuntimeError("boom")
+
+    async def scenario():
+        manager = StateManager()
+        manager.atom("n", 1)
+        manager.add_selector("broken", failing)
+        await asyncio.sleep(0.01)
+
+    with caplog.at_level(logging.ERROR, logger="flet_asp.selector"):
+        asyncio.run(scenario())
+
+    assert caplog.records[0].exc_info[1].args == ("boom",)
+
+
+def test_runtime_built_keys_are_stored_interned():
+    """
+    Tests that string keys built at runtime are interned when registered,
+    while family (tuple) keys are kept as is.
+    """
+    import sys
+
+    manager = StateManager()
+    key = "".join(["user", "_name"])
+    manager.atom(key, "Ana")
+    manager.add_selector("".join(["user", "_greeting"]), lambda get: get(key))
+
+    assert next(iter(manager._atoms)) is sys.intern("user_name")
+    assert next(iter(manager._selectors)) is sys.intern("user_greeting")
+    assert manager.get("user_greeting") == "Ana"
@@ -7,23 +7,25 @@ import asyncio
 import sys
 
 
+class MockPage:
+    """Minimal page stand-in shared by every example."""
+
+    def __init__(self):
+        self.controls = []
+
+    def add(self, control):
+        self.controls.append(control)
+
+    def update(self):
+        pass
+
+
 def test_1_basic_counter():
     """Test: 1. Basic Counter (Your First Atom)"""
     print("Testing: 1. Basic Counter...")
     try:
         import flet_asp as fa
 
-        # Mock page object
-        class MockPage:
-            def __init__(self):
-                self.controls = []
-
-            def add(self, control):
-                self.controls.append(control)
-
-            def update(self):
-                pass
-
         page = MockPage()
         fa.get_state_manager(page)
         page.state.atom("count", 0)
@@ -46,16 +48,6 @@ def test_2_two_way_binding():
     try:
         import flet_asp as fa
 
-        class MockPage:
-            def __init__(self):
-                self.controls = []
-
-            def add(self, control):
-                self.controls.append(control)
-
-            def update(self):
-                pass
-
         page = MockPage()
         fa.get_state_manager(page)
 
@@ -83,16 +75,6 @@ def test_3_computed_state():
     try:
         import flet_asp as fa
 
-        class MockPage:
-            def __init__(self):
-                self.controls = []
-
-            def add(self, control):
-                self.controls.append(control)
-
-            def update(self):
-                pass
-
         page = MockPage()
         fa.get_state_manager(page)
 
@@ -127,16 +109,6 @@ def test_4_async_actions():
     try:
         import flet_asp as fa
 
-        class MockPage:
-            def __init__(self):
-                self.controls = []
-
-            def add(self, control):
-                self.controls.append(control)
-
-            def update(self):
-                pass
-
         page = MockPage()
         fa.get_state_manager(page)
 
@@ -186,16 +158,6 @@ def test_5_custom_controls():
     try:
         import flet_asp as fa
 
-        class MockPage:
-            def __init__(self):
-                self.controls = []
-
-            def add(self, control):
-                self.controls.append(control)
-
-            def update(self):
-                pass
-
         page = MockPage()
         fa.get_state_manager(page)
 
@@ -225,16 +187,6 @@ def test_6_async_selectors():
     try:
         import flet_asp as fa
 
-        class MockPage:
-            def __init__(self):
-                self.controls = []
-
-            def add(self, control):
-                self.controls.append(control)
-
-            def update(self):
-                pass
-
         page = MockPage()
         fa.get_state_manager(page)
 
@@ -274,16 +226,6 @@ def test_7_shopping_cart():
     try:
         import flet_asp as fa
 
-        class MockPage:
-            def __init__(self):
-                self.controls = []
-
-            def add(self, control):
-                self.controls.append(control)
-
-            def update(self):
-                pass
-
         page = MockPage()
         fa.get_state_manager(page)
 